@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+원자적 파일 쓰기 (디스크 캐시 / 스냅샷 / 생성 파일 공용)
+- 같은 디렉토리의 고유 임시 파일(NamedTemporaryFile)에 다 쓴 뒤 os.replace → 읽는 쪽은 이전 파일 또는 새 파일 전체만 봄
+- 임시 파일 이름이 호출마다 달라서 여러 스레드 / HTTP 워커 프로세스가 같은 파일을 동시에 써도
+  서로의 임시 파일을 덮어쓰거나 먼저 옮겨 FileNotFoundError 가 나지 않음 (마지막 교체가 남음)
+"""
+
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """data 를 path 에 원자적으로 쓰기 (상위 디렉토리는 호출하는 쪽에서 만듦)"""
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False) as handle:
+        handle.write(data)
+    try:
+        os.replace(handle.name, path)
+    except BaseException:
+        os.unlink(handle.name)
+        raise
+
+
+def atomic_pickle(path: Path, payload: Any) -> None:
+    """payload 를 pickle 해 원자적으로 쓰기 (직렬화가 끝난 뒤에만 임시 파일을 만듦)"""
+    atomic_write(path, pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MCP 핸들러 벤치마크 (인메모리 스트림 + 실제 ClientSession)
+- server.py (UnifiedMCPServer): list_resources, 콘텐츠 리소스 전체 + 스펙 리소스 종류별 1건의 read_resource
+- server_fastmcp.py (FastMCP): list_tools, 등록된 모든 툴 호출
+- 케이스별 p50/p99 지연과 처리량(calls/sec) 출력
+- 결과를 JSON 베이스라인으로 저장하고, 이후 실행에서 임계치 이상 느려진 케이스를 회귀로 표시 (기본 p50 기준)
+
+사용법:
+    python benchmarks/bench_handlers.py --save-baseline          # 현재 결과를 베이스라인으로 저장
+    python benchmarks/bench_handlers.py                          # 베이스라인과 비교 (회귀 시 종료 코드 1)
+    python benchmarks/bench_handlers.py --iterations 50 --filter search get_schema
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+# 요청마다 찍히는 INFO 로그가 측정을 왜곡하지 않도록
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from mcp.shared.memory import create_connected_server_and_client_session  # noqa: E402
+
+MCP_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE = Path(os.getenv("BENCH_BASELINE_PATH", MCP_DIR / ".cache" / "bench_handlers.json"))
+
+# 필수 인자가 있거나 대표 인자로 측정할 툴
+TOOL_ARGS: Dict[str, Dict[str, Any]] = {
+    "search": {"query": "금형 수리 목록"},
+    "list_spec_tags": {"domain": "primes_mold"},
+    "find_spec_operations": {"domain": "primes_mold", "tag": "MoldRepair"},
+    "find_operations_by_schema": {"schema": "MoldMasterDto", "domain": "primes_mold"},
+    "get_schema": {"domain": "primes_mold", "name": "CommonResponseMoldMasterDto"},
+    "read_resource_chunk": {"uri": "swagger://primes_mold/spec", "offset": 65536},
+    # 버전이 하나뿐인 환경에서도 동작하도록 처음 버전 → 현재 버전
+    "diff_swagger": {"domain": "primes_mold", "from_version": "0", "to_version": "current"},
+    "analyze_swagger_sync": {"domain": "primes_mold", "app": "primes", "entity": "MoldMaster"},
+    "find_symbol": {"query": "useMoldRepairListQuery"},
+    "find_package_dependents": {"package": "@repo/falcon-ui"},
+    "get_package_dependencies": {"package": "@repo/esg", "transitive": True},
+}
+
+# 원격 호출이 필요해 인메모리 측정 대상에서 제외하는 툴
+SKIPPED_TOOLS = {"refresh_swagger_specs"}
+
+Call = Callable[[], Awaitable[Any]]
+
+
+def percentile(samples: List[float], ratio: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+async def measure(call: Call, iterations: int, warmup: int) -> Dict[str, float]:
+    """케이스 하나 측정 - 워밍업 호출은 통계에서 제외"""
+    for _ in range(warmup):
+        await call()
+    latencies: List[float] = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        await call()
+        latencies.append((time.perf_counter() - call_started) * 1000)
+    elapsed = time.perf_counter() - started
+    return {
+        "iterations": iterations,
+        "p50_ms": percentile(latencies, 0.50),
+        "p99_ms": percentile(latencies, 0.99),
+        "calls_per_sec": iterations / elapsed,
+    }
+
+
+def checked_tool_call(client, name: str, arguments: Dict[str, Any]) -> Call:
+    async def call() -> Any:
+        result = await client.call_tool(name, arguments)
+        if result.isError:
+            raise RuntimeError(f"{name} 실패: {result.content}")
+        return result
+
+    return call
+
+
+async def bench_unified(iterations: int, warmup: int, wanted: Optional[List[str]]) -> Dict[str, Dict[str, float]]:
+    from server import UnifiedMCPServer
+
+    results: Dict[str, Dict[str, float]] = {}
+    async with create_connected_server_and_client_session(UnifiedMCPServer().server) as client:
+        cases: List[Tuple[str, Call]] = [("server/list_resources", client.list_resources)]
+        uris: List[str] = []
+        seen_kinds = set()
+        cursor = None
+        while True:
+            listing = await client.list_resources(cursor)
+            for resource in listing.resources:
+                uri = str(resource.uri)
+                # 스펙 파생 리소스(swagger://{domain}/{kind}/...)는 종류별 대표 1건만
+                kind = uri.rsplit("/", 1)[0] if uri.startswith("swagger://") else uri
+                if kind not in seen_kinds:
+                    seen_kinds.add(kind)
+                    uris.append(uri)
+            cursor = listing.nextCursor
+            if cursor is None:
+                break
+        for uri in uris:
+            cases.append((f"server/read_resource {uri}", lambda uri=uri: client.read_resource(uri)))
+        for name, call in cases:
+            if selected(name, wanted):
+                results[name] = await measure(call, iterations, warmup)
+                report(name, results[name])
+    return results
+
+
+async def bench_fastmcp(iterations: int, warmup: int, wanted: Optional[List[str]]) -> Dict[str, Dict[str, float]]:
+    from server_fastmcp import mcp
+
+    results: Dict[str, Dict[str, float]] = {}
+    async with create_connected_server_and_client_session(mcp._mcp_server) as client:
+        cases: List[Tuple[str, Call]] = [("fastmcp/list_tools", client.list_tools)]
+        listing = await client.list_tools()
+        for tool in listing.tools:
+            if tool.name in SKIPPED_TOOLS:
+                continue
+            required = tool.inputSchema.get("required", [])
+            if required and tool.name not in TOOL_ARGS:
+                print(f"  skip {tool.name}: 필수 인자 {required} 에 대한 TOOL_ARGS 항목 없음", file=sys.stderr)
+                continue
+            arguments = TOOL_ARGS.get(tool.name, {})
+            cases.append((f"fastmcp/{tool.name}", checked_tool_call(client, tool.name, arguments)))
+        for name, call in cases:
+            if selected(name, wanted):
+                results[name] = await measure(call, iterations, warmup)
+                report(name, results[name])
+    return results
+
+
+def selected(name: str, wanted: Optional[List[str]]) -> bool:
+    return not wanted or any(pattern in name for pattern in wanted)
+
+
+def report(name: str, stats: Dict[str, float]) -> None:
+    print(f"{name:<48} {stats['p50_ms']:>9.3f} {stats['p99_ms']:>9.3f} {stats['calls_per_sec']:>11.0f}")
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+    min_delta_ms: float,
+    metrics: List[str],
+) -> List[str]:
+    """베이스라인 대비 지정 지표(p50/p99)가 (1 + threshold) 배와 min_delta_ms 를 모두 넘은 케이스 목록
+    (서브 ms 케이스의 스케줄링 잡음이 회귀로 잡히지 않도록 절대 증가량 하한을 둠)"""
+    regressions: List[str] = []
+    for name, stats in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        for metric in metrics:
+            slower = stats[metric] > before[metric] * (1 + threshold)
+            if slower and stats[metric] - before[metric] > min_delta_ms:
+                regressions.append(
+                    f"{name} {metric}: {before[metric]:.3f} -> {stats[metric]:.3f} ms "
+                    f"(+{(stats[metric] / before[metric] - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="MCP 핸들러 p50/p99 · 처리량 벤치마크")
+    parser.add_argument("--iterations", type=int, default=200, help="케이스당 측정 호출 수")
+    parser.add_argument("--warmup", type=int, default=5, help="케이스당 워밍업 호출 수")
+    parser.add_argument("--server", choices=["server", "fastmcp", "all"], default="all")
+    parser.add_argument("--filter", nargs="+", help="케이스 이름에 포함된 문자열로 선택")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="결과를 베이스라인으로 저장")
+    parser.add_argument("--threshold", type=float, default=0.25, help="회귀 판정 임계치 (0.25 = 25%% 느려짐)")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="회귀 판정 최소 증가량 (ms)")
+    parser.add_argument(
+        "--gate",
+        nargs="+",
+        choices=["p50_ms", "p99_ms"],
+        default=["p50_ms"],
+        help="회귀 판정에 쓸 지표 (p99 는 반복 수가 충분할 때만 안정적)",
+    )
+    args = parser.parse_args()
+
+    print(f"{'case':<48} {'p50(ms)':>9} {'p99(ms)':>9} {'calls/sec':>11}")
+    results: Dict[str, Dict[str, float]] = {}
+    if args.server in ("server", "all"):
+        results.update(await bench_unified(args.iterations, args.warmup, args.filter))
+    if args.server in ("fastmcp", "all"):
+        results.update(await bench_fastmcp(args.iterations, args.warmup, args.filter))
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        document = {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cases": results,
+        }
+        args.baseline.write_text(json.dumps(document, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"baseline saved: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"baseline 없음: {args.baseline} (--save-baseline 으로 생성)")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = compare(results, baseline["cases"], args.threshold, args.min_delta_ms, args.gate)
+    if regressions:
+        print(f"\n회귀 {len(regressions)}건 (기준: {args.baseline}, 임계치 +{args.threshold * 100:.0f}%)")
+        for line in regressions:
+            print(f"  REGRESSION {line}")
+        return 1
+    print(f"\n회귀 없음 (기준: {args.baseline}, 임계치 +{args.threshold * 100:.0f}%)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Atomic Hooks 생성기 처리량 벤치마크
+- 도메인 전체(모든 태그) 생성: 계획 / 렌더링 / 쓰기 단계별 시간과 files/sec
+- 직렬 렌더링 vs 프로세스 풀 렌더링, 콜드(템플릿 컴파일 포함) vs 웜
+- 반복 실행의 출력 해시가 모두 같은지(결정성) 확인
+
+사용법:
+    python benchmarks/bench_hook_generator.py [--domain primes_mold] [--iterations 20] [--workers 4]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import hook_generator  # noqa: E402
+from spec_store import get_spec_store  # noqa: E402
+
+
+def timed(function, *args, **kwargs):
+    started = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, (time.perf_counter() - started) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Atomic Hooks 생성기 처리량 벤치마크")
+    parser.add_argument("--domain", default="primes_mold")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=4, help="병렬 렌더링 프로세스 수")
+    args = parser.parse_args()
+
+    index = get_spec_store().get(args.domain)
+
+    plans, plan_ms = timed(hook_generator.plan_domain, index, args.domain)
+    _, cold_ms = timed(hook_generator.render_all, plans, 1)
+    files = hook_generator.render_all(plans, 1)
+    print(f"domain   : {args.domain} ({len(plans)} entities, {len(files)} files, {sum(len(text) for _, text in files) / 1024:.0f} KB)")
+    print(f"plan     : {plan_ms:.2f} ms")
+    print(f"cold     : {cold_ms:.2f} ms (render, 템플릿 컴파일 포함)")
+
+    # 스레드/프로세스 풀 기동 비용을 보기 위해 병렬 기준을 낮춰 강제로 풀 사용
+    hook_generator.PARALLEL_THRESHOLD = 1
+    for label, workers in (("serial", 1), (f"parallel x{args.workers}", args.workers)):
+        samples = [timed(hook_generator.render_all, plans, workers)[1] for _ in range(args.iterations)]
+        median = statistics.median(samples)
+        print(f"{label:<12}: {median:8.2f} ms/domain  {len(files) / median * 1000:10.0f} files/sec")
+
+    hashes = set()
+    # generate_domain 은 기본 출력 디렉토리(또는 apps/) 아래 상대 경로만 받으므로 그 안에 임시 디렉토리를 만듦
+    hook_generator.DEFAULT_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=hook_generator.DEFAULT_OUTPUT_DIR) as scratch:
+        output_dir = Path(scratch).resolve().relative_to(hook_generator.PROJECT_ROOT.resolve())
+        manifest, first_ms = timed(hook_generator.generate_domain, index, args.domain, None, output_dir, 1)
+        hashes.add(manifest["outputHash"])
+        rerun_samples = []
+        for _ in range(args.iterations):
+            manifest, elapsed = timed(hook_generator.generate_domain, index, args.domain, None, output_dir, 1)
+            hashes.add(manifest["outputHash"])
+            rerun_samples.append(elapsed)
+    print(f"generate : {first_ms:.2f} ms (처음 쓰기 {len(files)} files)")
+    print(f"regen    : {statistics.median(rerun_samples):.2f} ms (변경 없음 → 쓰기 {manifest['written']} files)")
+    print(f"determ.  : {'OK' if len(hashes) == 1 else 'MISMATCH'} ({len(hashes)} distinct output hash)")
+    return 0 if len(hashes) == 1 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+read_resource 마이크로 벤치마크
+- handler: 등록된 ReadResourceRequest 핸들러 직접 호출 (전송 계층 제외)
+- session: 인메모리 스트림 + 실제 MCP ClientSession 왕복
+- 모든 리소스 URI 를 순환하며 초당 읽기 수(reads/sec) 출력 (계측 래퍼 포함, 첫 읽기 한 바퀴는 제외)
+
+사용법:
+    python benchmarks/bench_read_resource.py [--iterations 20000] [--session-iterations 2000]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mcp import types  # noqa: E402
+from mcp.shared.memory import create_connected_server_and_client_session  # noqa: E402
+
+from server import UnifiedMCPServer  # noqa: E402
+
+
+async def list_resources(server: UnifiedMCPServer):
+    handler = server.server.request_handlers[types.ListResourcesRequest]
+    result = await handler(types.ListResourcesRequest(method="resources/list"))
+    return result.root.resources
+
+
+async def bench_handler(server: UnifiedMCPServer, uris, iterations: int) -> float:
+    """핸들러 직접 호출 기준 reads/sec"""
+    handler = server.server.request_handlers[types.ReadResourceRequest]
+    requests = [
+        types.ReadResourceRequest(method="resources/read", params=types.ReadResourceRequestParams(uri=uri))
+        for uri in uris
+    ]
+    count = len(requests)
+    # 첫 읽기(스펙 리소스 본문 직렬화 / 응답 생성)는 측정에서 제외 - 반복 읽기 기준 처리량
+    for request in requests:
+        await handler(request)
+    started = time.perf_counter()
+    for i in range(iterations):
+        await handler(requests[i % count])
+    elapsed = time.perf_counter() - started
+    return iterations / elapsed
+
+
+async def bench_session(server: UnifiedMCPServer, uris, iterations: int) -> float:
+    """MCP 클라이언트 세션 왕복 기준 reads/sec"""
+    count = len(uris)
+    async with create_connected_server_and_client_session(server.server) as client:
+        started = time.perf_counter()
+        for i in range(iterations):
+            await client.read_resource(uris[i % count])
+        elapsed = time.perf_counter() - started
+    return iterations / elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="read_resource reads/sec 벤치마크")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--session-iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    server = UnifiedMCPServer()
+    uris = [str(resource.uri) for resource in await list_resources(server)]
+
+    handler_rps = await bench_handler(server, uris, args.iterations)
+    session_rps = await bench_session(server, uris, args.session_iterations)
+
+    print(f"resources: {len(uris)}")
+    print(f"handler  : {handler_rps:,.0f} reads/sec ({args.iterations} reads)")
+    print(f"session  : {session_rps:,.0f} reads/sec ({args.session_iterations} reads)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스키마 해석기 벤치마크
+- 콜드: 로컬 스펙의 모든 컴포넌트 스키마를 처음 펼치는 시간
+- 웜: 메모이즈된 get(name, depth) 반복 조회 시간
+
+사용법:
+    python benchmarks/bench_schema_resolver.py [--domain primes_mold] [--iterations 100000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from schema_resolver import SchemaResolver  # noqa: E402
+from spec_store import get_spec_store  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="스키마 해석기 벤치마크")
+    parser.add_argument("--domain", default="primes_mold")
+    parser.add_argument("--iterations", type=int, default=100000)
+    args = parser.parse_args()
+
+    index = get_spec_store().get(args.domain)
+    names = list(index.schemas)
+
+    resolver = SchemaResolver(index.schemas)
+    started = time.perf_counter()
+    flattened = resolver.flatten_all()
+    cold_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    for i in range(args.iterations):
+        resolver.get(names[i % len(names)], 2)
+    warm_ns = (time.perf_counter() - started) / args.iterations * 1e9
+
+    print(f"schemas : {flattened}")
+    print(f"cold    : {cold_ms:.2f} ms (flatten all)")
+    print(f"warm    : {warm_ns:.0f} ns/lookup (get(name, depth=2), {args.iterations} lookups)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스펙 메모리 벤치마크 (tracemalloc)
+- 실제 스펙 본문(Swagger 디스크 캐시 + 로컬 스펙 파일, 내용 해시로 중복 제거)을 로드했을 때 유지되는 메모리 측정
+  1) dict+raw : json.loads 결과 중첩 dict + 원문 bytes (모델 없이 같은 기능을 하는 저장소의 최소 유지량, 기준)
+  2) store    : SpecStore.load_bytes 로 로드한 저장소 (Operation/Parameter/Schema/Field 모델 + 인덱스 + 원문 bytes)
+  3) +dicts   : 2) 에서 모든 스펙의 index.spec 을 읽은 뒤 (원문에서 다시 파싱한 dict 를 최근 SPEC_DICT_CACHE 개까지 유지)
+- 같은 스펙을 복제한 가짜 도메인은 쓰지 않음 (도메인 간 인턴 문자열 공유가 실제보다 크게 나오므로)
+  → 디스크 캐시가 비어 있으면 로컬 스펙만 측정, refresh_swagger_specs 로 캐시를 채운 뒤 실행하면 전체 도메인 측정
+
+사용법:
+    python benchmarks/bench_spec_memory.py
+"""
+
+import gc
+import hashlib
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from content_store import SWAGGER_URLS  # noqa: E402
+from spec_store import LOCAL_SPEC_FILES, SPEC_DICT_CACHE, SpecStore  # noqa: E402
+from swagger_fetcher import SwaggerDiskCache  # noqa: E402
+
+
+def load_bodies() -> List[Tuple[str, str, bytes]]:
+    """(도메인, 출처, 본문) - 출처는 cache / local, 내용이 같은 본문은 한 번만"""
+    cache = SwaggerDiskCache()
+    bodies = []
+    seen = set()
+    candidates = [(domain, "cache", cache.load_body(url)) for domain, url in SWAGGER_URLS.items()]
+    candidates += [(domain, "local", path.read_bytes()) for domain, path in LOCAL_SPEC_FILES if path.exists()]
+    for domain, source, body in candidates:
+        if body is None:
+            continue
+        content_hash = hashlib.sha256(body).hexdigest()
+        if content_hash not in seen:
+            seen.add(content_hash)
+            bodies.append((domain, source, body))
+    return bodies
+
+
+def retained(build: Callable[[], Any]) -> Tuple[Any, int, float]:
+    """build() 결과를 들고 있는 동안 유지되는 메모리 (결과, bytes, 소요 ms)"""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    kept = build()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return kept, current, elapsed_ms
+
+
+def main() -> None:
+    bodies = load_bodies()
+    for domain, source, body in bodies:
+        print(f"  {domain:<20} {source:<9} {len(body) / 1024:8.0f} KB")
+    print()
+
+    reference, plain, plain_ms = retained(lambda: [(json.loads(body), body) for _, _, body in bodies])
+    del reference
+
+    def load_store() -> SpecStore:
+        store = SpecStore()
+        for domain, _, body in bodies:
+            store.load_bytes(domain, body, source=domain)
+        return store
+
+    # 원본 dict 캐시는 저장소를 유지한 채 이어서 측정 (tracemalloc 한 세션 안에서 저장소 + dict 캐시 합계)
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    store = load_store()
+    store_ms = (time.perf_counter() - started) * 1000
+    gc.collect()
+    store_bytes, _ = tracemalloc.get_traced_memory()
+    started = time.perf_counter()
+    for domain in store.domains():
+        store.get(domain).spec
+    dicts_ms = (time.perf_counter() - started) * 1000
+    gc.collect()
+    dicts_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    unique = store.parsed_count
+    for label, size, elapsed_ms in (
+        ("dict+raw", plain, plain_ms),
+        ("store", store_bytes, store_ms),
+        ("+dicts", dicts_bytes, store_ms + dicts_ms),
+    ):
+        print(
+            f"{label:<10} {size / 1e6:9.2f} MB retained {size / unique / 1e6:8.2f} MB/spec "
+            f"{size / plain:6.2f}x {elapsed_ms:9.1f} ms"
+        )
+    print(f"\n고유 스펙 {unique}개, 원본 dict 캐시 {min(unique, SPEC_DICT_CACHE)}개 추가분 {(dicts_bytes - store_bytes) / 1e6:.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
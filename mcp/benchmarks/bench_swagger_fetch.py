@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Swagger 수집기 벤치마크 (로컬 대역 HTTP 서버)
+- mold_api.json 을 ETag/Last-Modified 와 함께 제공하는 로컬 서버를 띄우고
+  SWAGGER_URLS 와 같은 8개 도메인 경로를 동시에 수집
+- 1회차: 캐시 없음 → 200 + 전체 본문
+- 2회차: 디스크 캐시로 조건부 요청 → 304 (본문 0 byte)
+- 3회차: 서버 스펙 변경 후 → 변경된 도메인만 200
+- 회차마다 기대 결과를 확인하고, 하나라도 어긋나면 종료 코드 1
+
+사용법:
+    python benchmarks/bench_swagger_fetch.py
+"""
+
+import asyncio
+import hashlib
+import sys
+import tempfile
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List
+
+MCP_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(MCP_DIR))
+
+from swagger_fetcher import FetchResult, SwaggerDiskCache, SwaggerFetcher  # noqa: E402
+
+DOMAINS = [
+    "esg",
+    "primes_production",
+    "primes_sales",
+    "primes_purchase",
+    "primes_inventory",
+    "primes_machine",
+    "primes_mold",
+    "primes_ini",
+]
+
+
+class SpecServer(ThreadingHTTPServer):
+    """경로별 스펙 본문을 제공하는 대역 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, bodies: Dict[str, bytes]) -> None:
+        super().__init__(("127.0.0.1", 0), SpecHandler)
+        self.bodies = bodies
+        self.last_modified = formatdate(time.time(), usegmt=True)
+        self.requests = 0
+        self.sent_bytes = 0
+
+
+class SpecHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802
+        server: SpecServer = self.server  # type: ignore[assignment]
+        server.requests += 1
+        body = server.bodies.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", server.last_modified)
+        self.end_headers()
+        self.wfile.write(body)
+        server.sent_bytes += len(body)
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        pass
+
+
+async def run_round(
+    label: str, fetcher: SwaggerFetcher, urls: Dict[str, str], server: SpecServer
+) -> Dict[str, FetchResult]:
+    requests_before, bytes_before = server.requests, server.sent_bytes
+    started = time.perf_counter()
+    results = await fetcher.fetch_all(urls)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    statuses: Dict[str, int] = {}
+    for result in results.values():
+        statuses[result.status] = statuses.get(result.status, 0) + 1
+    print(
+        f"{label:<10} {elapsed:8.1f} ms  requests={server.requests - requests_before}  "
+        f"bytes={server.sent_bytes - bytes_before:>9,}  {statuses}"
+    )
+    return results
+
+
+def check_fetched(label: str, result: FetchResult, body: bytes, failures: List[str]) -> None:
+    """200 + 본문 전체"""
+    if result.status != "fetched" or result.http_status != 200:
+        failures.append(f"{label} {result.domain}: 200 기대, {result.status}/{result.http_status} ({result.error})")
+    elif result.body != body or result.bytes_received != len(body):
+        failures.append(f"{label} {result.domain}: 받은 본문이 서버 스펙과 다름")
+
+
+def check_not_modified(label: str, result: FetchResult, body: bytes, failures: List[str]) -> None:
+    """304 + 본문 0 byte + 캐시된 스펙"""
+    if result.status != "not_modified" or result.http_status != 304:
+        failures.append(f"{label} {result.domain}: 304 기대, {result.status}/{result.http_status} ({result.error})")
+    elif result.bytes_received != 0:
+        failures.append(f"{label} {result.domain}: 304 인데 본문 {result.bytes_received} byte 수신")
+    elif result.body != body or result.content_hash != hashlib.sha256(body).hexdigest():
+        failures.append(f"{label} {result.domain}: 캐시된 스펙이 마지막으로 받은 본문과 다름")
+
+
+async def main() -> int:
+    spec = (MCP_DIR / "mold_api.json").read_bytes()
+    bodies = {f"/api-docs/{domain}": spec for domain in DOMAINS}
+    server = SpecServer(bodies)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    urls = {domain: f"{base}/api-docs/{domain}" for domain in DOMAINS}
+    failures: List[str] = []
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        fetcher = SwaggerFetcher(cache=SwaggerDiskCache(Path(cache_dir)))
+        results = await run_round("cold", fetcher, urls, server)
+        for result in results.values():
+            check_fetched("cold", result, spec, failures)
+
+        bytes_before = server.sent_bytes
+        results = await run_round("revalidate", fetcher, urls, server)
+        for result in results.values():
+            check_not_modified("revalidate", result, spec, failures)
+        if server.sent_bytes != bytes_before:
+            failures.append(f"revalidate: 서버가 본문 {server.sent_bytes - bytes_before} byte 전송")
+
+        changed = spec.replace(b'"version":"v1"', b'"version":"v2"', 1) + b"\n"
+        bodies["/api-docs/primes_mold"] = changed
+        results = await run_round("1 changed", fetcher, urls, server)
+        for domain, result in results.items():
+            if domain == "primes_mold":
+                check_fetched("1 changed", result, changed, failures)
+            else:
+                check_not_modified("1 changed", result, spec, failures)
+
+    server.shutdown()
+    for failure in failures:
+        print(f"FAIL {failure}")
+    print("OK" if not failures else f"{len(failures)}건 실패")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
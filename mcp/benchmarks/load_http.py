@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP 전송 부하 테스트
+- server_fastmcp.py --transport http 를 하위 프로세스로 띄우고 (또는 --url 로 기존 서버 사용)
+- 동시 세션 수(기본 50/100/200)별로 세션마다 initialize 후 툴 호출을 반복
+- 툴 호출 지연 p50/p95/p99 와 처리량(calls/sec) 출력
+
+사용법:
+    python benchmarks/load_http.py [--workers 4] [--sessions 50 100 200] [--calls 10]
+    python benchmarks/load_http.py --url http://mcp.internal:8000/mcp
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import httpx
+from mcp import ClientSession
+from mcp.client.streamable_http import streamable_http_client
+
+MCP_DIR = Path(__file__).resolve().parent.parent
+
+# 세션마다 순환 호출할 툴 (이름, 인자)
+CALLS: List[Tuple[str, dict]] = [
+    ("ping", {}),
+    ("get_primes_overview", {}),
+    ("find_spec_operations", {"tag": "MoldRepair"}),
+    ("get_schema", {"domain": "primes_mold", "name": "CommonResponseMoldMasterDto", "depth": 1}),
+]
+
+
+def percentile(samples: List[float], ratio: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+async def run_session(url: str, client: httpx.AsyncClient, calls: int, latencies: List[float]) -> None:
+    async with streamable_http_client(url, http_client=client) as (read_stream, write_stream, _):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            for i in range(calls):
+                name, arguments = CALLS[i % len(CALLS)]
+                started = time.perf_counter()
+                result = await session.call_tool(name, arguments)
+                latencies.append((time.perf_counter() - started) * 1000)
+                if result.isError:
+                    raise RuntimeError(f"{name} 실패: {result.content}")
+
+
+async def run_level(url: str, sessions: int, calls: int) -> None:
+    latencies: List[float] = []
+    limits = httpx.Limits(max_connections=sessions, max_keepalive_connections=sessions)
+    async with httpx.AsyncClient(limits=limits, timeout=60.0) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(run_session(url, client, calls, latencies) for _ in range(sessions)))
+        elapsed = time.perf_counter() - started
+    print(
+        f"{sessions:>8} {len(latencies):>7} {percentile(latencies, 0.50):>9.1f} "
+        f"{percentile(latencies, 0.95):>9.1f} {percentile(latencies, 0.99):>9.1f} {len(latencies) / elapsed:>11.0f}"
+    )
+
+
+def start_server(port: int, workers: int) -> subprocess.Popen:
+    env = {**os.environ, "LOG_LEVEL": "WARNING"}
+    process = subprocess.Popen(
+        [sys.executable, "server_fastmcp.py", "--transport", "http", "--port", str(port), "--workers", str(workers)],
+        cwd=MCP_DIR,
+        env=env,
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/healthz", timeout=1.0).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("HTTP 서버 기동 실패")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Streamable HTTP 부하 테스트")
+    parser.add_argument("--url", help="기존 서버 MCP 엔드포인트 (생략 시 로컬 서버 기동)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[50, 100, 200])
+    parser.add_argument("--calls", type=int, default=10, help="세션당 툴 호출 수")
+    args = parser.parse_args()
+
+    process: Optional[subprocess.Popen] = None
+    url = args.url
+    if url is None:
+        process = start_server(args.port, args.workers)
+        url = f"http://127.0.0.1:{args.port}/mcp"
+
+    try:
+        print(f"target: {url}")
+        print(f"{'sessions':>8} {'calls':>7} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} {'calls/sec':>11}")
+        for sessions in args.sessions:
+            await run_level(url, sessions, args.calls)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+큰 리소스의 바이트 범위(청크) 읽기
+- 리소스 본문을 UTF-8 바이트 버퍼로 한 번만 만들어 두고(스펙 원문은 로드한 bytes 그대로)
+  요청마다 버퍼를 잘라 해당 구간만 디코딩 → 2번째 청크도 전체 JSON 직렬화 비용 없음
+- 범위 지정: 리소스 URI 쿼리 ?offset=<byte>&limit=<bytes> 또는 ?chunk=<n>&limit=<bytes>
+- 청크 시작은 "offset 이상인 첫 문자 시작 바이트", 끝은 "offset+limit 이하인 마지막 문자 시작 바이트"
+  → 청크가 limit 바이트를 넘지 않고, nextOffset 으로 이어 읽거나 ?chunk=0,1,2.. 로 읽으면 빈틈/겹침 없이 이어짐
+- 응답 _meta 에 offset/length/totalBytes/nextOffset (마지막 청크면 nextOffset 없음)
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs
+
+from mcp import types
+
+# 기본 / 최대 청크 크기 (bytes)
+DEFAULT_CHUNK_SIZE = int(os.getenv("MCP_CHUNK_SIZE", str(64 * 1024)))
+MAX_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ByteRange:
+    offset: int
+    limit: int
+    # ?chunk=<n> 로 지정한 경우 청크 번호 (시작 위치는 본문을 보고 chunk_offset() 으로 계산)
+    chunk: Optional[int] = None
+
+
+def split_range(uri: str) -> Tuple[str, Optional[ByteRange]]:
+    """'<uri>?offset=..&limit=..' → (쿼리를 뗀 URI, 범위) - 범위 쿼리가 없으면 (uri, None)"""
+    base, sep, query = uri.partition("?")
+    if not sep:
+        return uri, None
+    params = {key: values[-1] for key, values in parse_qs(query).items()}
+    if not {"offset", "limit", "chunk"} & params.keys():
+        return uri, None
+    try:
+        limit = int(params.get("limit", DEFAULT_CHUNK_SIZE))
+        chunk = None if "offset" in params else int(params.get("chunk", 0))
+        offset = int(params["offset"]) if chunk is None else chunk * limit
+    except ValueError as exc:
+        raise ValueError(f"잘못된 범위 쿼리입니다: {query}") from exc
+    if offset < 0 or not 0 < limit <= MAX_CHUNK_SIZE:
+        raise ValueError(f"범위는 offset >= 0, 0 < limit <= {MAX_CHUNK_SIZE} 이어야 합니다: {query}")
+    return base, ByteRange(offset, limit, chunk)
+
+
+def char_boundary(data: bytes, position: int) -> int:
+    """position 이상인 첫 UTF-8 문자 시작 위치 (연속 바이트 10xxxxxx 는 건너뜀)"""
+    end = len(data)
+    while position < end and (data[position] & 0xC0) == 0x80:
+        position += 1
+    return min(position, end)
+
+
+def char_boundary_before(data: bytes, position: int) -> int:
+    """position 이하인 마지막 UTF-8 문자 시작 위치 (끝을 넘으면 버퍼 길이)"""
+    if position >= len(data):
+        return len(data)
+    while position > 0 and (data[position] & 0xC0) == 0x80:
+        position -= 1
+    return position
+
+
+def chunk_end(data: bytes, start: int, limit: int) -> int:
+    """문자 경계 start 에서 시작하는 청크의 끝 - limit 안쪽 마지막 문자 경계
+
+    그러면 빈 청크가 되는 경우(limit 가 문자 하나보다 작음)만 다음 문자 경계까지 늘림 → 진행이 멈추지 않음
+    """
+    end = char_boundary_before(data, start + limit)
+    if end <= start:
+        end = char_boundary(data, start + 1)
+    return end
+
+
+def chunk_offset(data: bytes, chunk: int, limit: int) -> int:
+    """chunk 번째 청크의 시작 위치 - 0번부터 nextOffset 을 따라 읽은 것과 같은 경계 (청크 번호로 읽어도 빈틈/겹침 없음)"""
+    if data.isascii():
+        # 모든 바이트가 문자 경계 → 청크 크기가 정확히 limit
+        return min(chunk * limit, len(data))
+    position = 0
+    for _ in range(chunk):
+        if position >= len(data):
+            break
+        position = chunk_end(data, position, limit)
+    return position
+
+
+def slice_text(data: bytes, offset: int, limit: int) -> Tuple[str, int, int]:
+    """버퍼의 [offset, offset+limit) 를 문자 경계에 맞춰 디코딩 - (텍스트, 시작, 끝) 반환"""
+    start = char_boundary(data, offset)
+    end = chunk_end(data, start, limit)
+    # memoryview 로 자르면 청크 크기만큼만 복사
+    return str(memoryview(data)[start:end], "utf-8"), start, end
+
+
+def chunk_meta(start: int, end: int, total: int) -> Dict[str, Any]:
+    meta: Dict[str, Any] = {"offset": start, "length": end - start, "totalBytes": total}
+    if end < total:
+        meta["nextOffset"] = end
+    return meta
+
+
+def chunk_result(uri: str, data: bytes, byte_range: ByteRange, mime_type: str) -> types.ServerResult:
+    """read_resource 청크 응답 (contents[0].uri 는 범위 쿼리를 포함한 요청 URI)"""
+    offset = byte_range.offset if byte_range.chunk is None else chunk_offset(data, byte_range.chunk, byte_range.limit)
+    text, start, end = slice_text(data, offset, byte_range.limit)
+    return types.ServerResult(
+        types.ReadResourceResult(
+            contents=[
+                types.TextResourceContents(
+                    uri=uri,
+                    text=text,
+                    mimeType=mime_type,
+                    _meta=chunk_meta(start, end, len(data)),
+                )
+            ]
+        )
+    )
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+콘텐츠 응답 형식 (마크다운 / 압축 JSON)
+- 콘텐츠 본문을 로드 시 한 번 구조화 문서로 파싱: 제목 → 섹션 트리, 섹션마다 블록(목록/표/코드/문단)
+- 마크다운과 압축 JSON 을 모두 이 문서에서 렌더링해 ContentEntry 에 보관 → 툴/리소스는 형식만 고르고 렌더링 비용 없음
+- JSON 에서는 "- **키**: 값" 목록을 {키: 값} 객체로, 표를 columns/rows 로 바꿔 클라이언트가 마크다운을 다시 파싱할 필요 없음
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode
+
+# 응답 형식
+MARKDOWN = "markdown"
+JSON = "json"
+FORMATS = (MARKDOWN, JSON)
+
+FORMAT_MIME_TYPES = {MARKDOWN: "text/markdown", JSON: "application/json"}
+
+# 중첩 목록 들여쓰기 (렌더링 시)
+LIST_INDENT = "  "
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*$")
+_LIST_RE = re.compile(r"^(\s*)([-*]|\d+\.)\s+(.*)$")
+_KEY_VALUE_RE = re.compile(r"^\*\*([^*]+)\*\*:\s*(.*)$")
+_TABLE_SEPARATOR_RE = re.compile(r"^\|(\s*:?-+:?\s*\|)+$")
+
+Block = Dict[str, Any]
+
+
+def check_format(format: str) -> str:
+    if format not in FORMATS:
+        raise ValueError(f"알 수 없는 형식입니다: {format} (가능: {', '.join(FORMATS)})")
+    return format
+
+
+def split_format(uri: str) -> Tuple[str, str]:
+    """'<uri>?format=json&offset=..' → ('<uri>?offset=..', 'json') - format 쿼리가 없으면 마크다운"""
+    base, sep, query = uri.partition("?")
+    if not sep:
+        return uri, MARKDOWN
+    params = parse_qs(query)
+    values = params.pop("format", None)
+    if values is None:
+        return uri, MARKDOWN
+    rest = urlencode({key: value[-1] for key, value in params.items()})
+    return (f"{base}?{rest}" if rest else base), check_format(values[-1])
+
+
+# ===== 파싱 =====
+
+
+def _new_section(title: Optional[str], level: int) -> Dict[str, Any]:
+    return {"title": title, "level": level, "blocks": [], "sections": []}
+
+
+def _parse_item(text: str) -> Dict[str, Any]:
+    match = _KEY_VALUE_RE.match(text)
+    if match:
+        return {"key": match.group(1).strip(), "value": match.group(2)}
+    return {"text": text}
+
+
+def _parse_list(lines: List[str]) -> Block:
+    """연속된 목록 줄 → 항목 트리 (들여쓰기가 깊어지면 앞 항목의 하위 항목)"""
+    block: Block = {"type": "list", "ordered": bool(re.match(r"\s*\d", lines[0])), "items": []}
+    # (들여쓰기, 그 단계의 항목 목록)
+    stack: List[Tuple[int, List[Dict[str, Any]]]] = [(len(lines[0]) - len(lines[0].lstrip()), block["items"])]
+    for line in lines:
+        match = _LIST_RE.match(line)
+        indent = len(match.group(1))
+        while len(stack) > 1 and indent < stack[-1][0]:
+            stack.pop()
+        level_indent, siblings = stack[-1]
+        if indent > level_indent and siblings:
+            siblings = siblings[-1].setdefault("items", [])
+            stack.append((indent, siblings))
+        siblings.append(_parse_item(match.group(3)))
+    return block
+
+
+def _parse_table(lines: List[str]) -> Optional[Block]:
+    if len(lines) < 2 or not _TABLE_SEPARATOR_RE.match(lines[1].replace(" ", "")):
+        return None
+
+    def cells(line: str) -> List[str]:
+        return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+    return {"type": "table", "columns": cells(lines[0]), "rows": [cells(line) for line in lines[2:]]}
+
+
+def parse_markdown(text: str) -> Dict[str, Any]:
+    """마크다운 본문 → 구조화 문서 {title, blocks, sections: [{title, level, blocks, sections}]}"""
+    root = _new_section(None, 0)
+    stack = [root]
+    lines = text.splitlines()
+    position = 0
+    while position < len(lines):
+        line = lines[position]
+        if not line.strip():
+            position += 1
+            continue
+
+        heading = _HEADING_RE.match(line)
+        if heading:
+            level = len(heading.group(1))
+            if level == 1 and root["title"] is None and not root["blocks"] and not root["sections"]:
+                root["title"] = heading.group(2)
+            else:
+                while stack[-1]["level"] >= level:
+                    stack.pop()
+                section = _new_section(heading.group(2), level)
+                stack[-1]["sections"].append(section)
+                stack.append(section)
+            position += 1
+            continue
+
+        blocks = stack[-1]["blocks"]
+        if line.startswith("```"):
+            end = position + 1
+            while end < len(lines) and not lines[end].startswith("```"):
+                end += 1
+            blocks.append({"type": "code", "language": line[3:].strip(), "text": "\n".join(lines[position + 1:end])})
+            position = end + 1
+            continue
+
+        end = position
+        if line.startswith("|"):
+            while end < len(lines) and lines[end].startswith("|"):
+                end += 1
+            table = _parse_table(lines[position:end])
+            if table is not None:
+                blocks.append(table)
+                position = end
+                continue
+        elif _LIST_RE.match(line):
+            while end < len(lines) and _LIST_RE.match(lines[end]):
+                end += 1
+            blocks.append(_parse_list(lines[position:end]))
+            position = end
+            continue
+
+        # 문단: 빈 줄이나 다른 블록 시작 전까지
+        end = position + 1
+        while (
+            end < len(lines)
+            and lines[end].strip()
+            and not _HEADING_RE.match(lines[end])
+            and not _LIST_RE.match(lines[end])
+            and not lines[end].startswith(("```", "|"))
+        ):
+            end += 1
+        blocks.append({"type": "paragraph", "text": "\n".join(lines[position:end])})
+        position = end
+
+    return {"title": root["title"], "blocks": root["blocks"], "sections": root["sections"]}
+
+
+# ===== 마크다운 렌더링 =====
+
+
+def _item_markdown(item: Dict[str, Any]) -> str:
+    if "key" in item:
+        return f"**{item['key']}**: {item['value']}".rstrip()
+    return item["text"]
+
+
+def _list_markdown(items: List[Dict[str, Any]], ordered: bool, depth: int = 0) -> List[str]:
+    lines: List[str] = []
+    for number, item in enumerate(items, 1):
+        marker = f"{number}." if ordered and depth == 0 else "-"
+        lines.append(f"{LIST_INDENT * depth}{marker} {_item_markdown(item)}")
+        if item.get("items"):
+            lines.extend(_list_markdown(item["items"], False, depth + 1))
+    return lines
+
+
+def _block_markdown(block: Block) -> str:
+    kind = block["type"]
+    if kind == "list":
+        return "\n".join(_list_markdown(block["items"], block["ordered"]))
+    if kind == "table":
+        header = f"| {' | '.join(block['columns'])} |"
+        separator = "|" + "|".join("---" for _ in block["columns"]) + "|"
+        return "\n".join([header, separator, *(f"| {' | '.join(row)} |" for row in block["rows"])])
+    if kind == "code":
+        return f"```{block['language']}\n{block['text']}\n```"
+    return block["text"]
+
+
+def _section_chunks(heading: Optional[str], blocks: List[Block], sections: List[Dict[str, Any]]) -> List[str]:
+    """제목 줄 바로 아래 첫 블록, 이후 블록/하위 섹션은 빈 줄로 구분"""
+    chunks = [_block_markdown(block) for block in blocks]
+    if heading is not None:
+        chunks[:1] = ["\n".join([heading, *chunks[:1]])]
+    for section in sections:
+        chunks.extend(
+            _section_chunks(f"{'#' * section['level']} {section['title']}", section["blocks"], section["sections"])
+        )
+    return chunks
+
+
+def render_markdown(document: Dict[str, Any]) -> str:
+    title = f"# {document['title']}" if document["title"] is not None else None
+    return "\n\n".join(_section_chunks(title, document["blocks"], document["sections"])) + "\n"
+
+
+# ===== 압축 JSON 렌더링 =====
+
+
+def _plain(text: str) -> str:
+    """JSON 값에서는 굵게 표시(**) 제거"""
+    return text.replace("**", "")
+
+
+def _items_json(items: List[Dict[str, Any]]) -> Any:
+    """모든 항목이 '**키**: 값' 이고 키가 겹치지 않으면 객체, 아니면 배열"""
+    keys = [item.get("key") for item in items]
+    if None not in keys and len(set(keys)) == len(keys):
+        values: Dict[str, Any] = {}
+        for item in items:
+            value = _plain(item["value"])
+            if item.get("items"):
+                value = {"value": value, "items": _items_json(item["items"])} if value else _items_json(item["items"])
+            values[_plain(item["key"])] = value
+        return values
+    result: List[Any] = []
+    for item in items:
+        text = _plain(_item_markdown(item))
+        result.append({"text": text, "items": _items_json(item["items"])} if item.get("items") else text)
+    return result
+
+
+def _block_json(block: Block) -> Any:
+    kind = block["type"]
+    if kind == "list":
+        return _items_json(block["items"])
+    if kind == "table":
+        return {
+            "columns": [_plain(column) for column in block["columns"]],
+            "rows": [[_plain(cell) for cell in row] for row in block["rows"]],
+        }
+    if kind == "code":
+        return {"language": block["language"], "code": block["text"]}
+    return _plain(block["text"])
+
+
+def _content_json(blocks: List[Block]) -> Any:
+    """블록이 하나면 그 값, 여러 개면 배열"""
+    content = [_block_json(block) for block in blocks]
+    return content[0] if len(content) == 1 else content
+
+
+def _sections_json(sections: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """섹션 제목 → 본문 (하위 섹션이 없으면 본문 블록 값만, 있으면 {content, sections})"""
+    result: Dict[str, Any] = {}
+    for section in sections:
+        title = _plain(section["title"])
+        # 같은 단계에 같은 제목이 또 있으면 번호를 붙여 구분
+        duplicate = 2
+        while title in result:
+            title = f"{_plain(section['title'])} ({duplicate})"
+            duplicate += 1
+        if not section["sections"]:
+            result[title] = _content_json(section["blocks"])
+            continue
+        body: Dict[str, Any] = {}
+        if section["blocks"]:
+            body["content"] = _content_json(section["blocks"])
+        body["sections"] = _sections_json(section["sections"])
+        result[title] = body
+    return result
+
+
+def document_json(document: Dict[str, Any], **meta: Any) -> Dict[str, Any]:
+    """구조화 문서 → JSON 응답 객체 (meta: uri/name/description 등 앞에 붙일 값)"""
+    result: Dict[str, Any] = {**meta}
+    if document["title"] is not None:
+        result["title"] = _plain(document["title"])
+    if document["blocks"]:
+        result["content"] = _content_json(document["blocks"])
+    result["sections"] = _sections_json(document["sections"])
+    return result
+
+
+def render_json(document: Dict[str, Any], **meta: Any) -> str:
+    """압축 JSON 문자열 (공백 없는 구분자, 한글 그대로)"""
+    return json.dumps(document_json(document, **meta), ensure_ascii=False, separators=(",", ":"))
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+프로젝트 정보 콘텐츠 저장소 (두 서버 공용)
+- content/<scheme>/<slug>.md 한 파일이 리소스 <scheme>://<slug> 하나
+- 파일 머리말(--- name / description / order ---)이 리소스 메타데이터, 본문은 마크다운
+- 본문의 {{swagger_urls.<domain>}} 자리표시자는 로드 시 SWAGGER_URLS 값으로 치환
+- 생성 콘텐츠 그룹({{packages.*}} 등)은 값 제공 함수를 refresh() 마다 호출해 값이 바뀐 그룹을 쓰는 파일만 다시 렌더링
+- 처음 한 번 전체를 파싱해 메모리에 두고, refresh() 는 (mtime, size) 가 바뀐 파일만 다시 파싱
+- watch_content() 가 주기적으로 collect()(워커 스레드) → apply()(이벤트 루프) → 재시작 없이 편집 내용 반영
+- 본문은 로드 시 구조화 문서로 한 번 파싱하고, 마크다운/압축 JSON 두 형식을 미리 렌더링해 보관 (content_formats)
+"""
+
+import asyncio
+import logging
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import anyio
+
+from content_formats import JSON, MARKDOWN, check_format, parse_markdown, render_json, render_markdown
+
+logger = logging.getLogger("unified-project-info-mcp.content")
+
+MCP_DIR = Path(__file__).resolve().parent
+CONTENT_DIR = Path(os.getenv("MCP_CONTENT_DIR", str(MCP_DIR / "content")))
+
+# 변경 감지 주기 (초, 0 이면 감시 안 함)
+CONTENT_POLL_INTERVAL = float(os.getenv("MCP_CONTENT_POLL_INTERVAL", "1.0"))
+
+# 실제 Swagger URL들 (환경변수로 오버라이드 가능)
+SWAGGER_URLS: Dict[str, str] = {
+    "esg": os.getenv("SWAGGER_ESG", "https://api.esg.primes-cloud.co.kr/api-docs/esg"),
+    "primes_production": os.getenv("SWAGGER_PRIMES_PROD", "https://api.orcamaas.com/api-docs/production"),
+    "primes_sales": os.getenv("SWAGGER_PRIMES_SALES", "https://api.orcamaas.com/api-docs/sales"),
+    "primes_purchase": os.getenv("SWAGGER_PRIMES_PURCHASE", "https://api.orcamaas.com/api-docs/purchase"),
+    "primes_inventory": os.getenv("SWAGGER_PRIMES_INVENTORY", "https://api.orcamaas.com/api-docs/inventory"),
+    "primes_machine": os.getenv("SWAGGER_PRIMES_MACHINE", "https://api.orcamaas.com/api-docs/machine"),
+    "primes_mold": os.getenv("SWAGGER_PRIMES_MOLD", "https://api.orcamaas.com/api-docs/mold"),
+    "primes_ini": os.getenv("SWAGGER_PRIMES_INI", "https://api.orcamaas.com/api-docs/init"),
+}
+
+_PLACEHOLDER_RE = re.compile(r"\{\{\s*([a-z_]+)\.([a-z0-9_]+)\s*\}\}")
+
+# 생성 콘텐츠 자리표시자 그룹 값 제공 함수 (그룹 → {키: 값})
+VariableProvider = Callable[[], Dict[str, str]]
+
+# 변경 알림 콜백 (바뀌거나 추가된 URI 목록, 삭제된 URI 목록)
+ChangeListener = Callable[[List[str], List[str]], None]
+
+
+@dataclass(frozen=True)
+class ContentEntry:
+    """콘텐츠 파일 한 개 (메타데이터 + 치환이 끝난 본문의 구조화 문서와 두 가지 렌더링)"""
+
+    uri: str
+    name: str
+    description: str
+    order: int
+    # 마크다운 형식 (구조화 문서에서 렌더링)
+    text: str
+    # 청크 읽기용 UTF-8 본문 (로드 시 한 번만 인코딩)
+    encoded: bytes
+    mtime_ns: int
+    size: int
+    # 본문이 쓰는 자리표시자 그룹 (생성 콘텐츠 값이 바뀌면 이 그룹을 쓰는 파일만 다시 렌더링)
+    groups: Tuple[str, ...] = ()
+    # 구조화 문서 (제목 → 섹션 트리, 블록) - 두 형식의 공통 원본
+    document: Dict[str, Any] = field(default_factory=dict, compare=False)
+    # 압축 JSON 형식과 UTF-8 인코딩
+    json_text: str = ""
+    json_encoded: bytes = b""
+
+    def render(self, format: str = MARKDOWN) -> str:
+        """미리 렌더링한 형식 (markdown | json)"""
+        return self.json_text if check_format(format) == JSON else self.text
+
+    def encode(self, format: str = MARKDOWN) -> bytes:
+        return self.json_encoded if check_format(format) == JSON else self.encoded
+
+
+def uri_for(path: Path, root: Path) -> str:
+    """content/primes/overview.md → primes://overview"""
+    relative = path.relative_to(root)
+    return f"{relative.parts[0]}://{'/'.join(relative.parts[1:])[:-len('.md')]}"
+
+
+def split_front_matter(raw: str) -> Tuple[Dict[str, str], str]:
+    """'---' 로 감싼 key: value 머리말과 본문 분리 (머리말이 없으면 빈 dict)"""
+    if not raw.startswith("---\n"):
+        return {}, raw
+    end = raw.find("\n---\n", 4)
+    if end < 0:
+        return {}, raw
+    meta: Dict[str, str] = {}
+    for line in raw[4:end].splitlines():
+        key, sep, value = line.partition(":")
+        if sep:
+            meta[key.strip()] = value.strip()
+    return meta, raw[end + len("\n---\n"):]
+
+
+def render(body: str, variables: Dict[str, Dict[str, str]], source: str = "") -> str:
+    """{{group.key}} 자리표시자 치환 (모르는 키는 그대로 두고 경고)"""
+
+    def substitute(match: "re.Match[str]") -> str:
+        value = variables.get(match.group(1), {}).get(match.group(2))
+        if value is None:
+            logger.warning("알 수 없는 자리표시자 %s (%s)", match.group(0), source)
+            return match.group(0)
+        return value
+
+    return _PLACEHOLDER_RE.sub(substitute, body)
+
+
+def parse_content(path: Path, root: Path, variables: Dict[str, Dict[str, str]]) -> ContentEntry:
+    stat = path.stat()
+    uri = uri_for(path, root)
+    meta, body = split_front_matter(path.read_text(encoding="utf-8"))
+    name = meta.get("name", uri)
+    description = meta.get("description", "")
+    document = parse_markdown(render(body, variables, uri))
+    text = render_markdown(document)
+    json_text = render_json(document, uri=uri, name=name, description=description)
+    return ContentEntry(
+        uri=uri,
+        name=name,
+        description=description,
+        order=int(meta.get("order", "1000")),
+        text=text,
+        encoded=text.encode("utf-8"),
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        groups=tuple(sorted({match.group(1) for match in _PLACEHOLDER_RE.finditer(body)})),
+        document=document,
+        json_text=json_text,
+        json_encoded=json_text.encode("utf-8"),
+    )
+
+
+def _package_variables() -> Dict[str, str]:
+    from package_graph import package_variables
+
+    return package_variables()
+
+
+def _workspace_variables() -> Dict[str, str]:
+    from workspace_inventory import workspace_variables
+
+    return workspace_variables()
+
+
+# 기본 저장소의 생성 콘텐츠 그룹
+# - packages : common://packages (package.json 의존성 그래프)
+# - workspace: 앱별 페이지/Hook/서비스 수 (apps/*/src 인벤토리, primes://overview 와 common://comparison)
+DEFAULT_PROVIDERS: Dict[str, VariableProvider] = {"packages": _package_variables, "workspace": _workspace_variables}
+
+
+@dataclass(frozen=True)
+class ContentChanges:
+    """ContentStore.collect() 결과 (apply() 로 반영)"""
+
+    # 값이 바뀐 생성 콘텐츠 그룹
+    variables: Dict[str, Dict[str, str]]
+    # 다시 파싱한 항목
+    entries: List[ContentEntry]
+    # 디렉토리에 있는 URI 전체 (여기 없는 기존 항목은 삭제)
+    seen: Set[str]
+
+
+class ContentStore:
+    """URI → 콘텐츠 캐시 (변경된 파일만 다시 읽음)"""
+
+    def __init__(
+        self,
+        root: Path = CONTENT_DIR,
+        variables: Optional[Dict[str, Dict[str, str]]] = None,
+        providers: Optional[Dict[str, VariableProvider]] = None,
+    ) -> None:
+        self.root = root
+        self.variables = dict(variables) if variables is not None else {"swagger_urls": SWAGGER_URLS}
+        self.providers = providers or {}
+        self._entries: Dict[str, ContentEntry] = {}
+        self._ordered: List[ContentEntry] = []
+        self._listeners: List[ChangeListener] = []
+        # 변경이 반영될 때마다 증가 (검색 인덱스 등 파생 캐시의 재동기화 판단용)
+        self.version = 0
+        self.refresh()
+
+    def refresh(self) -> Tuple[List[str], List[str]]:
+        """바뀐 파일만 재파싱해 바로 반영 - (변경/추가 URI, 삭제 URI) 반환"""
+        return self.apply(self.collect())
+
+    def collect(self) -> ContentChanges:
+        """생성 콘텐츠 값 갱신 + 디렉토리를 stat 으로 훑어 바뀐 파일만 재파싱
+
+        저장소 상태는 바꾸지 않음 → watch_content() 가 워커 스레드에서 호출하고 apply() 만 이벤트 루프에서 실행
+        """
+        groups = self._collect_providers()
+        variables = {**self.variables, **groups}
+        entries: List[ContentEntry] = []
+        seen: Set[str] = set()
+        for path in sorted(self.root.glob("*/**/*.md")):
+            uri = uri_for(path, self.root)
+            seen.add(uri)
+            current = self._entries.get(uri)
+            stat = path.stat()
+            if (
+                current is not None
+                and current.mtime_ns == stat.st_mtime_ns
+                and current.size == stat.st_size
+                and groups.keys().isdisjoint(current.groups)
+            ):
+                continue
+            try:
+                entries.append(parse_content(path, self.root, variables))
+            except (OSError, UnicodeDecodeError, ValueError) as exc:
+                # 편집 도중 저장된 파일 등 - 이전 내용을 유지하고 다음 주기에 다시 시도
+                logger.warning("콘텐츠 로드 실패 %s: %s", path, exc)
+        return ContentChanges(groups, entries, seen)
+
+    def apply(self, changes: ContentChanges) -> Tuple[List[str], List[str]]:
+        """collect() 결과 반영 + 변경 알림 - (변경/추가 URI, 삭제 URI) 반환"""
+        self.variables.update(changes.variables)
+        changed: List[str] = []
+        for entry in changes.entries:
+            current = self._entries.get(entry.uri)
+            self._entries[entry.uri] = entry
+            # 저장만 다시 한 경우(내용 동일)는 변경으로 알리지 않음
+            if current is None or (current.name, current.description, current.order, current.text) != (
+                entry.name, entry.description, entry.order, entry.text
+            ):
+                changed.append(entry.uri)
+        removed = [uri for uri in self._entries if uri not in changes.seen]
+        for uri in removed:
+            del self._entries[uri]
+
+        if changed or removed:
+            self._ordered = sorted(self._entries.values(), key=lambda entry: (entry.order, entry.uri))
+            self.version += 1
+            for listener in self._listeners:
+                listener(changed, removed)
+        return changed, removed
+
+    def _collect_providers(self) -> Dict[str, Dict[str, str]]:
+        """생성 콘텐츠 그룹 값 계산 - 값이 바뀐 그룹만 {그룹: 값} 으로 반환"""
+        changed: Dict[str, Dict[str, str]] = {}
+        for group, provider in self.providers.items():
+            try:
+                values = provider()
+            except (OSError, ValueError) as exc:
+                # 이전 값을 유지하고 다음 주기에 다시 시도
+                logger.warning("생성 콘텐츠 %s 갱신 실패: %s", group, exc)
+                continue
+            if values != self.variables.get(group):
+                changed[group] = values
+        return changed
+
+    def subscribe(self, listener: ChangeListener) -> None:
+        """refresh() 로 반영된 변경 알림 등록"""
+        self._listeners.append(listener)
+
+    def get(self, uri: str) -> ContentEntry:
+        entry = self._entries.get(uri)
+        if entry is None:
+            raise ValueError(f"콘텐츠를 찾을 수 없습니다: {uri}")
+        return entry
+
+    def text(self, uri: str, format: str = MARKDOWN) -> str:
+        return self.get(uri).render(format)
+
+    def entries(self) -> List[ContentEntry]:
+        """order, URI 순 콘텐츠 목록"""
+        return self._ordered
+
+    def __contains__(self, uri: object) -> bool:
+        return uri in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+async def watch_content(store: "ContentStore", interval: float = CONTENT_POLL_INTERVAL) -> None:
+    """interval 초마다 변경 파일 반영 (파일 수십 개 stat 이라 폴링 비용은 무시할 수준)"""
+    if interval <= 0:
+        return
+    while True:
+        await asyncio.sleep(interval)
+        # 생성 콘텐츠 제공 함수(패키지 그래프 / 워크스페이스 인벤토리)와 stat·파싱은 워커 스레드에서 실행해
+        # 폴링 중에도 이벤트 루프가 요청을 계속 처리 - 반영과 리스너 호출은 루프에서 (레지스트리 교체가 요청 처리와 겹치지 않음)
+        changes = await anyio.to_thread.run_sync(store.collect)
+        changed, removed = store.apply(changes)
+        if changed or removed:
+            logger.info("콘텐츠 갱신: 변경 %s, 삭제 %s", changed, removed)
+
+
+_default_store: Optional[ContentStore] = None
+# 백그라운드 스레드(지연 시작한 감시)와 툴 호출이 동시에 처음 만들 수 있음 → 한 번만 생성
+_default_store_lock = threading.Lock()
+
+
+def get_content_store() -> ContentStore:
+    """프로세스 공용 콘텐츠 저장소 (첫 호출 시 한 번만 로드)"""
+    global _default_store
+    if _default_store is None:
+        with _default_store_lock:
+            if _default_store is None:
+                _default_store = ContentStore(providers=DEFAULT_PROVIDERS)
+    return _default_store
@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Atomic Hooks 코드 생성기 (스펙 인덱스 기반)
+- 도메인 스펙의 태그별 오퍼레이션을 기준 경로(/x, /x/{id}, /x/fields/{fieldName}) 단위 엔티티로 묶고
+  엔티티마다 서비스 파일 1개 + use{X}ListQuery / use{X}ByIdQuery / useCreate{X} / useUpdate{X} / useDelete{X}
+  / use{X}FieldQuery Hook 과 index.ts 생성 (스펙에 있는 오퍼레이션만)
+- 템플릿은 templates/atomic_hooks/*.ts.tmpl, {{name}} 자리표시자를 (리터럴, 필드) 조각 목록으로 한 번만 컴파일해
+  (경로, mtime) 기준으로 캐시 → 렌더링은 join 한 번
+- 엔티티가 많으면 프로세스 풀로 병렬 렌더링, 파일 쓰기는 스레드 풀 (내용이 같은 파일은 건너뜀)
+- 출력은 입력 순서가 아닌 정렬된 엔티티/파일 순서로만 결정 → 같은 스펙이면 항상 같은 바이트
+"""
+
+import hashlib
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from atomic_files import atomic_write
+from server_metrics import METRICS
+from spec_store import REF_PREFIX, SpecIndex
+
+MCP_DIR = Path(__file__).parent
+PROJECT_ROOT = MCP_DIR.parent
+TEMPLATE_DIR = MCP_DIR / "templates" / "atomic_hooks"
+DEFAULT_OUTPUT_DIR = Path(os.getenv("HOOKGEN_OUTPUT_DIR", str(MCP_DIR / ".cache" / "generated")))
+
+# 이 수 이상 엔티티를 렌더링할 때만 프로세스 풀 사용 (풀 기동 비용 > 소량 렌더링 비용)
+PARALLEL_THRESHOLD = int(os.getenv("HOOKGEN_PARALLEL_THRESHOLD", "32"))
+
+_PLACEHOLDER_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+_ID_SUFFIX_RE = re.compile(r"/\{[^}/]+\}$")
+_FIELDS_SUFFIX = "/fields/{fieldName}"
+
+# 기준 경로 대비 오퍼레이션 종류 (메서드, 접미사) → 역할
+_ROLES = {
+    ("get", ""): "list",
+    ("get", "/{id}"): "by_id",
+    ("post", ""): "create",
+    ("put", "/{id}"): "update",
+    ("patch", "/{id}"): "update",
+    ("delete", ""): "delete",
+    ("get", _FIELDS_SUFFIX): "fields",
+}
+
+# 역할 → (서비스 조각 템플릿, Hook 템플릿, Hook 이름 형식)
+_ROLE_OUTPUTS = {
+    "list": ("service_list", "hook_list_query", "use{entity}ListQuery"),
+    "by_id": ("service_by_id", "hook_by_id_query", "use{entity}ByIdQuery"),
+    "create": ("service_create", "hook_create", "useCreate{entity}"),
+    "update": ("service_update", "hook_update", "useUpdate{entity}"),
+    "delete": ("service_delete", "hook_delete", "useDelete{entity}"),
+    "fields": ("service_fields", "hook_field_query", "use{entity}FieldQuery"),
+}
+_ROLE_ORDER = ("list", "by_id", "create", "update", "delete", "fields")
+_REQUEST_FUNCTIONS = {"get": "FetchApiGet", "post": "FetchApiPost", "put": "FetchApiPut", "patch": "FetchApiPut", "delete": "FetchApiDelete"}
+
+
+# ===== 템플릿 컴파일 =====
+
+CompiledTemplate = Tuple[Tuple[str, ...], Tuple[str, ...]]
+
+_compiled: Dict[Path, Tuple[int, CompiledTemplate]] = {}
+
+
+def compile_template(source: str) -> CompiledTemplate:
+    """'a {{x}} b' → (('a ', ' b'), ('x',)) - 리터럴이 필드보다 항상 1개 많음"""
+    parts = _PLACEHOLDER_RE.split(source)
+    return tuple(parts[0::2]), tuple(parts[1::2])
+
+
+def load_template(name: str, template_dir: Path = TEMPLATE_DIR) -> CompiledTemplate:
+    """컴파일된 템플릿 (파일 mtime 이 바뀌었을 때만 다시 컴파일)"""
+    path = template_dir / f"{name}.ts.tmpl"
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _compiled.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        METRICS.cache_hit("hook_templates")
+        return cached[1]
+    METRICS.cache_miss("hook_templates")
+    template = compile_template(path.read_text(encoding="utf-8"))
+    _compiled[path] = (mtime_ns, template)
+    return template
+
+
+def render(template: CompiledTemplate, values: Dict[str, str]) -> str:
+    literals, fields = template
+    pieces = [literals[0]]
+    for name, literal in zip(fields, literals[1:]):
+        pieces.append(values[name])
+        pieces.append(literal)
+    return "".join(pieces)
+
+
+# ===== 생성 계획 (스펙 → 엔티티) =====
+
+@dataclass(frozen=True)
+class PlannedOperation:
+    role: str
+    method: str
+    path: str
+    body_type: str
+
+
+@dataclass
+class EntityPlan:
+    """엔티티 하나의 생성 입력 (프로세스 풀로 넘기므로 순수 데이터만)"""
+
+    domain: str
+    tag: str
+    entity: str
+    label: str
+    module_dir: str
+    url_prefix: str
+    base_path: str
+    search_type: str
+    operations: List[PlannedOperation] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+
+
+def pascal_to_camel(name: str) -> str:
+    return name[:1].lower() + name[1:]
+
+
+def pascal_to_kebab(name: str) -> str:
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "-", name).lower()
+
+
+def _ref_name(schema: Any) -> Optional[str]:
+    if isinstance(schema, dict):
+        ref = schema.get("$ref")
+        if isinstance(ref, str) and ref.startswith(REF_PREFIX):
+            return ref[len(REF_PREFIX):]
+    return None
+
+
+def ts_type(schema: Any, known: Dict[str, Any]) -> str:
+    """요청 본문 스키마 → TS 타입 표기 ($ref 는 스키마 이름, 모르는 형태는 unknown)"""
+    name = _ref_name(schema)
+    if name is not None:
+        return name if name in known else "Record<string, unknown>"
+    if isinstance(schema, dict):
+        if schema.get("type") == "array":
+            item = ts_type(schema.get("items", {}), known)
+            return f"({item})[]" if " " in item else f"{item}[]"
+        if schema.get("type") in ("integer", "number"):
+            return "number"
+        if schema.get("type") in ("string", "boolean"):
+            return schema["type"]
+    return "unknown"
+
+
+def _body_schema(raw: Dict[str, Any]) -> Any:
+    content = raw.get("requestBody", {}).get("content", {})
+    for media in content.values():
+        return media.get("schema")
+    return None
+
+
+def _base_path(path: str) -> Tuple[str, str]:
+    """/x/fields/{fieldName} → (/x, 접미사), /x/{id} → (/x, /{id})"""
+    if path.endswith(_FIELDS_SUFFIX):
+        return path[: -len(_FIELDS_SUFFIX)], _FIELDS_SUFFIX
+    match = _ID_SUFFIX_RE.search(path)
+    if match is not None:
+        return path[: match.start()], "/{id}"
+    return path, ""
+
+
+def _entity_name(tag: str, base_path: str, schema_names: List[str]) -> str:
+    """SearchRequest/CreateRequest/UpdateRequest 스키마 이름에서 엔티티 이름, 없으면 태그 + 마지막 경로 조각"""
+    for suffix in ("SearchRequest", "CreateRequest", "UpdateRequest"):
+        for name in schema_names:
+            if name.endswith(suffix) and len(name) > len(suffix):
+                return name[: -len(suffix)]
+    last = base_path.rstrip("/").rsplit("/", 1)[-1]
+    segment = "".join(part.capitalize() for part in re.split(r"[-_]", last) if part)
+    return tag if segment.lower() in tag.lower() else f"{tag}{segment}"
+
+
+def _module_dir(domain: str) -> str:
+    """primes_mold → mold (apps/primes/src/{hooks,services}/mold)"""
+    return domain.split("_", 1)[1] if domain.startswith("primes_") else domain
+
+
+def _url_prefix(index: SpecIndex) -> str:
+    """servers[0].url 의 앞 '/' 를 뗀 경로 (FetchApi* 는 API 게이트웨이 기준 상대 경로 사용)"""
+    return index.servers[0].strip("/") if index.servers else ""
+
+
+def plan_domain(index: SpecIndex, domain: str, tags: Optional[List[str]] = None) -> List[EntityPlan]:
+    """태그 → 기준 경로별 엔티티 계획 (태그/기준 경로 정렬 순)"""
+    wanted = {tag.lower() for tag in tags} if tags else None
+    plans: List[EntityPlan] = []
+    # 요청 본문 타입은 원본 스펙에서 (원문에서 다시 파싱한 dict, 루프 밖에서 한 번만 조회)
+    paths = index.spec.get("paths", {})
+    schemas = index.schemas
+    for tag in sorted(index.by_tag):
+        if wanted is not None and tag.lower() not in wanted:
+            continue
+        groups: Dict[str, List[Tuple[str, Any]]] = {}
+        for position in index.by_tag[tag]:
+            operation = index.operations[position]
+            base, suffix = _base_path(operation.path)
+            groups.setdefault(base, []).append((suffix, operation))
+
+        for base in sorted(groups):
+            members = groups[base]
+            schema_names = [name for _, operation in members for name in operation.request_schemas]
+            entity = _entity_name(tag, base, schema_names)
+            search = next(
+                (name for _, operation in members for name in operation.request_schemas if name.endswith("SearchRequest")),
+                None,
+            )
+            plan = EntityPlan(
+                domain=domain,
+                tag=tag,
+                entity=entity,
+                label=entity,
+                module_dir=_module_dir(domain),
+                url_prefix=_url_prefix(index),
+                base_path=base,
+                search_type=search or "Record<string, unknown>",
+            )
+            taken = set()
+            for suffix, operation in sorted(members, key=lambda member: (member[1].path, member[1].method)):
+                role = _ROLES.get((operation.method, suffix))
+                if role is None or role in taken:
+                    plan.skipped.append(f"{operation.method.upper()} {operation.path}")
+                    continue
+                taken.add(role)
+                raw = paths[operation.path][operation.method]
+                plan.operations.append(
+                    PlannedOperation(role, operation.method, operation.path, ts_type(_body_schema(raw), schemas))
+                )
+            plan.operations.sort(key=lambda planned: _ROLE_ORDER.index(planned.role))
+            plans.append(plan)
+    return plans
+
+
+# ===== 렌더링 =====
+
+def _js_url(prefix: str, path: str) -> str:
+    """/x/{id} → `mold/x/${id}` (경로 변수가 없으면 작은따옴표 문자열)"""
+    full = f"{prefix}/{path.lstrip('/')}" if prefix else path.lstrip("/")
+    if "{" not in full:
+        return f"'{full}'"
+    # 서비스 함수 인자는 id / fieldName 두 가지뿐
+    return "`" + re.sub(r"\{(\w+)\}", lambda match: "${fieldName}" if match.group(1) == "fieldName" else "${id}", full) + "`"
+
+
+def _type_import(names: List[str], module_dir: str) -> str:
+    declared = sorted({name for name in names if name.isidentifier()})
+    if not declared:
+        return ""
+    return f"import type {{ {', '.join(declared)} }} from '@primes/types/{module_dir}';\n"
+
+
+def _type_names(ts: str) -> List[str]:
+    """TS 타입 표기에서 스키마 이름만 (number[] / Record<...> 등 제외)"""
+    return [name for name in re.findall(r"[A-Za-z_]\w*", ts) if name[0].isupper() and name not in ("Record",)]
+
+
+def render_entity(plan: EntityPlan, template_dir: Path = TEMPLATE_DIR) -> List[Tuple[str, str]]:
+    """엔티티 하나 → [(출력 상대 경로, 내용)] (파일 경로 순)"""
+    kebab = pascal_to_kebab(plan.entity)
+    service_name = f"{pascal_to_camel(plan.entity)}Service"
+    common = {
+        "domain": plan.domain,
+        "tag": plan.tag,
+        "entity": plan.entity,
+        "kebab": kebab,
+        "label": plan.label,
+        "search_type": plan.search_type,
+        "service_module": f"@primes/services/{plan.module_dir}/{service_name}",
+    }
+
+    files: List[Tuple[str, str]] = []
+    sections: List[str] = []
+    request_functions = set()
+    service_types: List[str] = []
+    hook_names: List[str] = []
+    for planned in plan.operations:
+        service_template, hook_template, hook_format = _ROLE_OUTPUTS[planned.role]
+        values = {
+            **common,
+            "method": planned.method.upper(),
+            "path": planned.path,
+            "url": _js_url(plan.url_prefix, planned.path),
+            "create_type": planned.body_type,
+            "update_type": planned.body_type,
+        }
+        role_types = _type_names(plan.search_type) if planned.role in ("list", "fields") else _type_names(planned.body_type)
+        if planned.role in ("by_id", "delete"):
+            role_types = []
+        service_types.extend(role_types)
+        values["type_import"] = _type_import(role_types, plan.module_dir)
+        sections.append(render(load_template(service_template, template_dir), values))
+        request_functions.add(_REQUEST_FUNCTIONS[planned.method])
+
+        hook_name = hook_format.format(entity=plan.entity)
+        hook_names.append(hook_name)
+        files.append((f"hooks/{plan.module_dir}/{kebab}/{hook_name}.ts", render(load_template(hook_template, template_dir), values)))
+
+    service = render(
+        load_template("service", template_dir),
+        {
+            **common,
+            "request_imports": "\n".join(f"\t{name}," for name in sorted(request_functions)),
+            "type_import": _type_import(service_types, plan.module_dir),
+            "operations": "".join(sections),
+        },
+    )
+    files.append((f"services/{plan.module_dir}/{service_name}.ts", service))
+    exports = "\n".join(f"export * from './{name}';" for name in hook_names)
+    files.append((f"hooks/{plan.module_dir}/{kebab}/index.ts", render(load_template("index", template_dir), {"exports": exports})))
+    return sorted((path, text.rstrip("\n") + "\n") for path, text in files)
+
+
+def _render_entity_worker(plan: EntityPlan) -> List[Tuple[str, str]]:
+    return render_entity(plan)
+
+
+def render_all(plans: List[EntityPlan], workers: Optional[int] = None) -> List[Tuple[str, str]]:
+    """모든 엔티티 렌더링 - 결과는 계획 순서 그대로 (병렬이어도 결정적)"""
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    if workers > 1 and len(plans) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rendered = list(pool.map(_render_entity_worker, plans, chunksize=max(1, len(plans) // (workers * 4))))
+    else:
+        rendered = [render_entity(plan) for plan in plans]
+    files = [item for entity_files in rendered for item in entity_files]
+    duplicates = sorted(path for path, count in Counter(path for path, _ in files).items() if count > 1)
+    if duplicates:
+        raise ValueError(f"서로 다른 엔티티가 같은 파일을 생성합니다: {', '.join(duplicates)}")
+    return files
+
+
+def _write_if_changed(target: Path, text: str) -> bool:
+    data = text.encode("utf-8")
+    try:
+        if target.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    target.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(target, data)
+    return True
+
+
+def resolve_output_dir(output_dir: Optional[Path], default: Path) -> Path:
+    """툴 인자 출력 경로 → 실제 경로 (프로젝트 루트 기준 상대 경로만, apps/ 또는 기본 출력 디렉토리 아래만 허용)
+    절대 경로·'..' 경로·심볼릭 링크로 밖을 가리키는 경로는 ValueError (HTTP 공용 서버에서 임의 위치 쓰기 방지)"""
+    if output_dir is None:
+        return default
+    relative = Path(output_dir)
+    if relative.is_absolute() or ".." in relative.parts:
+        raise ValueError(f"출력 경로는 프로젝트 루트 기준 상대 경로여야 합니다 ('..' 불가): {output_dir}")
+    resolved = (PROJECT_ROOT / relative).resolve()
+    allowed = ((PROJECT_ROOT / "apps").resolve(), DEFAULT_OUTPUT_DIR.resolve())
+    if not any(resolved.is_relative_to(root) for root in allowed):
+        raise ValueError(f"출력 경로는 apps/ 또는 {DEFAULT_OUTPUT_DIR} 아래여야 합니다: {output_dir}")
+    return resolved
+
+
+def write_files(files: List[Tuple[str, str]], output_dir: Path, workers: int = 8) -> List[bool]:
+    """파일 쓰기 (스레드 풀, 내용이 같으면 건너뜀) - 파일별 변경 여부"""
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        return list(pool.map(lambda item: _write_if_changed(output_dir / item[0], item[1]), files))
+
+
+def generate_domain(
+    index: SpecIndex,
+    domain: str,
+    tags: Optional[List[str]] = None,
+    output_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """도메인 전체(또는 지정 태그) 생성 → output_dir/{hooks,services}/... 에 쓰고 매니페스트 반환"""
+    # 상대 경로는 프로젝트 루트 기준 (예: apps/primes/src)
+    output_dir = resolve_output_dir(output_dir, DEFAULT_OUTPUT_DIR / domain)
+    plans = plan_domain(index, domain, tags)
+    if not plans:
+        raise ValueError(f"생성할 태그가 없습니다: {domain} {tags or ''}".rstrip())
+    files = render_all(plans, workers)
+    changed = write_files(files, output_dir)
+
+    digest = hashlib.sha256()
+    for path, text in files:
+        digest.update(path.encode() + b"\0" + text.encode("utf-8") + b"\0")
+    return {
+        "domain": domain,
+        "outputDir": str(output_dir),
+        "entities": [
+            {
+                "tag": plan.tag,
+                "entity": plan.entity,
+                "basePath": plan.base_path,
+                "operations": [f"{planned.method.upper()} {planned.path}" for planned in plan.operations],
+                "skipped": plan.skipped,
+            }
+            for plan in plans
+        ],
+        "files": [path for path, _ in files],
+        "written": sum(changed),
+        "unchanged": len(changed) - sum(changed),
+        # 출력 전체의 해시 (같은 스펙/템플릿이면 항상 같은 값)
+        "outputHash": digest.hexdigest(),
+    }
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+모노레포 패키지 의존성 그래프
+- packages/*/package.json, apps/*/package.json 을 읽어 워크스페이스 내부 의존 관계(dependencies / devDependencies /
+  peerDependencies 중 워크스페이스 패키지 이름) 그래프 구성
+- package.json 별 (mtime, size) 로 파싱 결과를 캐시 → 호출마다 stat 만 하고, 바뀐 파일이 있을 때만 그래프 재구성
+- 조회: 정방향 의존(dependencies), 역방향 의존(dependents, 어떤 앱/패키지가 쓰는지), 위상 정렬 빌드 순서(단계별)
+- common://packages 리소스 본문은 이 그래프에서 생성 (content_store 의 {{packages.*}} 자리표시자)
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from server_metrics import METRICS
+
+logger = logging.getLogger("unified-project-info-mcp.packages")
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# (그룹 디렉토리, 종류) - 그룹 바로 아래 디렉토리의 package.json 만 대상
+WORKSPACE_GROUPS = (("packages", "package"), ("apps", "app"))
+
+DEPENDENCY_FIELDS = ("dependencies", "devDependencies", "peerDependencies")
+
+
+@dataclass(frozen=True)
+class WorkspacePackage:
+    """package.json 한 개"""
+
+    name: str
+    kind: str  # app | package
+    path: str  # 프로젝트 루트 기준 디렉토리 (apps/primes)
+    version: str
+    description: str
+    # 모든 의존성 이름 → 필드 (워크스페이스 내부 여부는 그래프 구성 시 판단)
+    dependencies: Tuple[Tuple[str, str], ...]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "path": self.path,
+            "version": self.version,
+            "description": self.description,
+        }
+
+
+def parse_package(path: Path, root: Path, kind: str) -> WorkspacePackage:
+    with open(path, "r", encoding="utf-8") as handle:
+        manifest = json.load(handle)
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("name"), str):
+        raise ValueError(f"name 이 없는 package.json 입니다: {path}")
+    dependencies: Dict[str, str] = {}
+    for field in DEPENDENCY_FIELDS:
+        for name in manifest.get(field) or {}:
+            # 같은 이름이 여러 필드에 있으면 앞 필드(dependencies 우선)
+            dependencies.setdefault(name, field)
+    return WorkspacePackage(
+        name=manifest["name"],
+        kind=kind,
+        path=path.parent.relative_to(root).as_posix(),
+        version=str(manifest.get("version", "")),
+        description=str(manifest.get("description", "")),
+        dependencies=tuple(sorted(dependencies.items())),
+    )
+
+
+class PackageGraph:
+    """워크스페이스 패키지 그래프 (package.json 변경 시 자동 재구성)"""
+
+    def __init__(self, root: Path = PROJECT_ROOT) -> None:
+        self.root = Path(root)
+        self._files: Dict[str, Tuple[int, int, WorkspacePackage]] = {}
+        self._signature: Optional[Tuple[Tuple[str, int, int], ...]] = None
+        self.packages: Dict[str, WorkspacePackage] = {}
+        # 이름 → 워크스페이스 내부 의존 (이름 → 필드), 역방향은 이름 목록
+        self.edges: Dict[str, Dict[str, str]] = {}
+        self.reverse: Dict[str, List[str]] = {}
+        # 그래프가 다시 구성될 때마다 증가 (파생 캐시 재생성 판단용)
+        self.version = 0
+        self._markdown: Optional[Tuple[int, Dict[str, str]]] = None
+
+    def _manifests(self) -> Iterable[Tuple[str, str, os.stat_result]]:
+        """(상대경로, 종류, stat) - 그룹 디렉토리를 scandir 로 한 단계만 훑음"""
+        for group, kind in WORKSPACE_GROUPS:
+            try:
+                children = sorted(entry.name for entry in os.scandir(self.root / group) if entry.is_dir())
+            except FileNotFoundError:
+                continue
+            for child in children:
+                relpath = f"{group}/{child}/package.json"
+                try:
+                    stat = os.stat(self.root / relpath)
+                except FileNotFoundError:
+                    continue
+                yield relpath, kind, stat
+
+    def refresh(self) -> bool:
+        """바뀐 package.json 만 다시 파싱 - 그래프가 다시 구성됐으면 True"""
+        manifests = list(self._manifests())
+        signature = tuple((relpath, stat.st_mtime_ns, stat.st_size) for relpath, _, stat in manifests)
+        if signature == self._signature:
+            METRICS.cache_hit("package_graph")
+            return False
+        METRICS.cache_miss("package_graph")
+
+        files: Dict[str, Tuple[int, int, WorkspacePackage]] = {}
+        for relpath, kind, stat in manifests:
+            cached = self._files.get(relpath)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                files[relpath] = cached
+                continue
+            try:
+                files[relpath] = (stat.st_mtime_ns, stat.st_size, parse_package(self.root / relpath, self.root, kind))
+            except (OSError, ValueError) as exc:
+                # 편집 도중 저장된 파일 등 - 이전 결과가 있으면 유지하고 다음 호출에 다시 시도
+                logger.warning("package.json 로드 실패 %s: %s", relpath, exc)
+                if cached is not None:
+                    files[relpath] = cached
+        self._files = files
+        self._signature = signature
+        self._build(package for _, _, package in files.values())
+        return True
+
+    def _build(self, packages: Iterable[WorkspacePackage]) -> None:
+        self.packages = {package.name: package for package in packages}
+        self.edges = {
+            name: {dependency: field for dependency, field in package.dependencies if dependency in self.packages}
+            for name, package in self.packages.items()
+        }
+        reverse: Dict[str, List[str]] = {name: [] for name in self.packages}
+        for name, dependencies in self.edges.items():
+            for dependency in dependencies:
+                reverse[dependency].append(name)
+        self.reverse = {name: sorted(names) for name, names in reverse.items()}
+        self.version += 1
+
+    # ===== 조회 =====
+
+    def get(self, name: str) -> WorkspacePackage:
+        package = self.packages.get(name)
+        if package is None:
+            # 접두사 없이 준 이름(falcon-ui)도 찾기
+            matches = [candidate for candidate in self.packages if candidate.split("/")[-1] == name]
+            if len(matches) != 1:
+                raise ValueError(f"워크스페이스 패키지를 찾을 수 없습니다: {name}")
+            package = self.packages[matches[0]]
+        return package
+
+    def _closure(self, start: str, neighbours: Dict[str, Any]) -> Dict[str, int]:
+        """start 에서 닿는 패키지 → 최단 거리 (BFS, start 제외)"""
+        distances: Dict[str, int] = {}
+        frontier = [start]
+        depth = 0
+        while frontier:
+            depth += 1
+            next_frontier = []
+            for node in frontier:
+                for neighbour in neighbours[node]:
+                    if neighbour != start and neighbour not in distances:
+                        distances[neighbour] = depth
+                        next_frontier.append(neighbour)
+            frontier = next_frontier
+        return distances
+
+    def dependencies(self, name: str, transitive: bool = False) -> List[Dict[str, Any]]:
+        """name 이 의존하는 워크스페이스 패키지 (transitive=True 면 간접 의존 포함, depth = 거리)"""
+        package = self.get(name)
+        if not transitive:
+            return [
+                {"name": dependency, "kind": self.packages[dependency].kind, "field": field}
+                for dependency, field in sorted(self.edges[package.name].items())
+            ]
+        distances = self._closure(package.name, self.edges)
+        return [
+            {"name": dependency, "kind": self.packages[dependency].kind, "depth": depth}
+            for dependency, depth in sorted(distances.items(), key=lambda item: (item[1], item[0]))
+        ]
+
+    def dependents(self, name: str, transitive: bool = False) -> List[Dict[str, Any]]:
+        """name 에 의존하는 앱/패키지 (역방향, transitive=True 면 간접 의존 포함)"""
+        package = self.get(name)
+        if not transitive:
+            return [
+                {"name": dependent, "kind": self.packages[dependent].kind, "field": self.edges[dependent][package.name]}
+                for dependent in self.reverse[package.name]
+            ]
+        distances = self._closure(package.name, self.reverse)
+        return [
+            {"name": dependent, "kind": self.packages[dependent].kind, "depth": depth}
+            for dependent, depth in sorted(distances.items(), key=lambda item: (item[1], item[0]))
+        ]
+
+    def build_order(self, targets: Optional[List[str]] = None) -> List[List[str]]:
+        """의존 대상이 먼저 오는 빌드 단계 목록 (같은 단계는 서로 독립 → 병렬 빌드 가능)
+        targets 를 주면 그 패키지와 의존 대상만 포함, 순환이 있으면 ValueError"""
+        if targets:
+            selected: Set[str] = set()
+            for target in targets:
+                name = self.get(target).name
+                selected.add(name)
+                selected.update(self._closure(name, self.edges))
+        else:
+            selected = set(self.packages)
+
+        remaining = {name: len(set(self.edges[name]) & selected) for name in selected}
+        stages: List[List[str]] = []
+        ready = sorted(name for name, count in remaining.items() if count == 0)
+        while ready:
+            stages.append(ready)
+            next_ready: List[str] = []
+            for name in ready:
+                del remaining[name]
+                for dependent in self.reverse[name]:
+                    if dependent in remaining:
+                        remaining[dependent] -= 1
+                        if remaining[dependent] == 0:
+                            next_ready.append(dependent)
+            ready = sorted(next_ready)
+        if remaining:
+            raise ValueError(f"패키지 의존성에 순환이 있습니다: {', '.join(sorted(remaining))}")
+        return stages
+
+    # ===== common://packages 본문 =====
+
+    def markdown(self) -> Dict[str, str]:
+        """content 자리표시자 값 ({{packages.summary}}, {{packages.table}}, {{packages.build_order}}) - 그래프 버전별 1회 생성"""
+        if self._markdown is not None and self._markdown[0] == self.version:
+            return self._markdown[1]
+        values = self._render_markdown()
+        self._markdown = (self.version, values)
+        return values
+
+    def _render_markdown(self) -> Dict[str, str]:
+        apps = sorted(name for name, package in self.packages.items() if package.kind == "app")
+        libraries = sorted(name for name, package in self.packages.items() if package.kind == "package")
+
+        rows = ["| 패키지 | 설명 | 사용하는 앱 | 의존하는 워크스페이스 패키지 |", "|---|---|---|---|"]
+        for name in libraries:
+            package = self.packages[name]
+            users = [self.packages[dependent].path.split("/")[-1] for dependent in self.reverse[name]
+                     if self.packages[dependent].kind == "app"]
+            internal = ", ".join(sorted(self.edges[name])) or "-"
+            rows.append(f"| **{name}** | {package.description or '-'} | {', '.join(users) or '-'} | {internal} |")
+        rows.append("")
+        rows.append("| 앱 | 설명 | 워크스페이스 패키지 |")
+        rows.append("|---|---|---|")
+        for name in apps:
+            package = self.packages[name]
+            rows.append(
+                f"| **{name}** (`{package.path}`) | {package.description or '-'} | {', '.join(sorted(self.edges[name])) or '-'} |"
+            )
+
+        try:
+            order = "\n".join(f"{position}. {', '.join(stage)}" for position, stage in enumerate(self.build_order(), 1))
+        except ValueError as exc:
+            order = f"⚠️ {exc}"
+
+        edge_count = sum(len(dependencies) for dependencies in self.edges.values())
+        return {
+            "summary": f"워크스페이스 패키지 {len(libraries)}개, 앱 {len(apps)}개, 내부 의존 {edge_count}건",
+            "table": "\n".join(rows),
+            "build_order": order,
+        }
+
+
+_default_graph: Optional[PackageGraph] = None
+
+
+def get_package_graph() -> PackageGraph:
+    """프로세스 공용 패키지 그래프 (호출마다 package.json stat 으로 변경 확인)"""
+    global _default_graph
+    if _default_graph is None:
+        _default_graph = PackageGraph()
+    _default_graph.refresh()
+    return _default_graph
+
+
+def package_variables() -> Dict[str, str]:
+    """content_store 자리표시자 그룹 "packages" 값"""
+    return get_package_graph().markdown()
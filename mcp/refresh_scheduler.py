@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Swagger 스펙 백그라운드 갱신 스케줄러 (stale-while-revalidate)
+- 서버 프로세스 안에서 SWAGGER_URLS 도메인마다 루프 하나 - 지터를 준 주기로 재검증(304) / 수집
+- 수집은 스냅샷 디렉토리의 갱신 잠금(.refresh.lock, flock)을 얻은 리더 프로세스 하나만 수행
+  → HTTP 워커 N개여도 수집/동시 요청은 1배, 나머지(팔로워)는 스냅샷 매니페스트가 바뀌면 디스크에서만 다시 로드
+  (리더가 종료되면 다음 확인 때 팔로워 중 하나가 잠금을 이어받음)
+- 동시 수집 수는 세마포어로 제한, 실패한 도메인은 지수 백오프(최대 SWAGGER_REFRESH_MAX_BACKOFF)
+- 툴/리소스는 항상 스펙 저장소의 현재 버전으로 바로 응답하고, 바뀐 스펙은 스레드에서 파싱한 뒤
+  이벤트 루프 스레드에서 도메인 단위로 교체 (저장소 변경과 조회가 같은 스레드 → 교체 중 조회가 깨지지 않음)
+- 수집에 성공한 새 스펙은 오프라인 스냅샷에도 저장
+- 도메인별 마지막 시도/성공/변경 시각, 다음 예정 시각, 연속 실패 수를 get_refresh_status 로 보고
+"""
+
+import asyncio
+import logging
+import os
+import random
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import httpx
+
+from content_store import SWAGGER_URLS
+
+try:
+    import fcntl
+except ImportError:  # Windows - 잠금 없이 프로세스마다 리더
+    fcntl = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from swagger_fetcher import FetchResult, SwaggerFetcher
+
+logger = logging.getLogger("unified-project-info-mcp.refresh")
+
+# 정상 갱신 주기 (초, 0 이면 백그라운드 갱신 안 함)
+REFRESH_INTERVAL = float(os.getenv("SWAGGER_REFRESH_INTERVAL", "1800"))
+# 주기에 곱할 지터 비율 (0.2 → 주기의 ±20%, 도메인/워커들이 같은 순간에 몰리지 않도록)
+REFRESH_JITTER = float(os.getenv("SWAGGER_REFRESH_JITTER", "0.2"))
+# 시작 후 첫 갱신까지 대기 (초, 지터 적용 - 기동 직후 요청과 겹치지 않도록)
+REFRESH_INITIAL_DELAY = float(os.getenv("SWAGGER_REFRESH_INITIAL_DELAY", "10"))
+# 동시에 수집하는 도메인 수
+REFRESH_CONCURRENCY = int(os.getenv("SWAGGER_REFRESH_CONCURRENCY", "2"))
+# 실패 시 첫 재시도 대기 (초) - 연속 실패마다 2배, 최대 MAX_BACKOFF
+REFRESH_RETRY = float(os.getenv("SWAGGER_REFRESH_RETRY", "60"))
+REFRESH_MAX_BACKOFF = float(os.getenv("SWAGGER_REFRESH_MAX_BACKOFF", "3600"))
+# 팔로워가 스냅샷 매니페스트 변경을 확인하고 리더 잠금을 다시 시도하는 주기 (초, 지터 적용)
+REFRESH_FOLLOW_INTERVAL = float(os.getenv("SWAGGER_REFRESH_FOLLOW_INTERVAL", "30"))
+# 리더 잠금 파일 이름 (스냅샷 디렉토리 안 - 스냅샷을 공유하는 프로세스끼리 리더 하나)
+REFRESH_LOCK_NAME = ".refresh.lock"
+
+
+def jittered(seconds: float, jitter: float = REFRESH_JITTER) -> float:
+    return seconds * random.uniform(1 - jitter, 1 + jitter) if jitter > 0 else seconds
+
+
+def backoff_delay(failures: int, retry: float = REFRESH_RETRY, maximum: float = REFRESH_MAX_BACKOFF) -> float:
+    """연속 실패 n 번째의 재시도 대기 (retry × 2^(n-1), 최대 maximum)"""
+    return min(maximum, retry * (2 ** max(0, failures - 1)))
+
+
+def acquire_leader_lock(path: Path) -> Optional[int]:
+    """비차단 배타 잠금 - 얻으면 파일 디스크립터(닫을 때까지 리더), 다른 프로세스가 쥐고 있으면 None"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    if fcntl is None:
+        return fd
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return None
+    return fd
+
+
+@dataclass
+class DomainRefreshState:
+    """도메인 한 개의 갱신 상태"""
+
+    domain: str
+    url: str
+    next_due: float
+    last_attempt: Optional[float] = None
+    last_success: Optional[float] = None
+    last_changed: Optional[float] = None
+    last_status: Optional[str] = None
+    last_error: Optional[str] = None
+    failures: int = 0
+    running: bool = False
+
+    def to_dict(self, now: float) -> Dict[str, Any]:
+        return {
+            "domain": self.domain,
+            "url": self.url,
+            "status": "refreshing" if self.running else self.last_status or "pending",
+            "lastAttemptAt": self.last_attempt,
+            "lastSuccessAt": self.last_success,
+            "lastChangedAt": self.last_changed,
+            "nextRefreshAt": self.next_due,
+            "ageSeconds": round(now - self.last_success, 1) if self.last_success is not None else None,
+            "consecutiveFailures": self.failures,
+            "error": self.last_error,
+        }
+
+
+class RefreshScheduler:
+    """도메인별 갱신 루프 + 수동 갱신 (같은 상태/세마포어 공유)"""
+
+    def __init__(
+        self,
+        urls: Optional[Dict[str, str]] = None,
+        fetcher: Optional["SwaggerFetcher"] = None,
+        interval: float = REFRESH_INTERVAL,
+        concurrency: int = REFRESH_CONCURRENCY,
+        initial_delay: float = REFRESH_INITIAL_DELAY,
+        follow_interval: float = REFRESH_FOLLOW_INTERVAL,
+        lock_path: Optional[Path] = None,
+    ) -> None:
+        self.urls = dict(urls if urls is not None else SWAGGER_URLS)
+        self._fetcher = fetcher
+        self.interval = interval
+        self.initial_delay = initial_delay
+        self.follow_interval = follow_interval
+        self._lock_path = lock_path
+        # 백그라운드 실행 중 역할 (leader / follower, 실행 전·후 None)
+        self.role: Optional[str] = None
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self.concurrency = max(1, concurrency)
+        # 스펙 교체(스레드 파싱 + 루프에서 저장소 갱신)는 한 번에 하나씩
+        self._apply_lock = asyncio.Lock()
+        now = time.time()
+        self.states: Dict[str, DomainRefreshState] = {
+            domain: DomainRefreshState(domain, url, now + jittered(initial_delay)) for domain, url in self.urls.items()
+        }
+        self._client: Optional[httpx.AsyncClient] = None
+        self._tasks: List["asyncio.Task[None]"] = []
+
+    @property
+    def fetcher(self) -> "SwaggerFetcher":
+        if self._fetcher is None:
+            from swagger_fetcher import SwaggerFetcher
+
+            self._fetcher = SwaggerFetcher()
+        return self._fetcher
+
+    # ===== 갱신 =====
+
+    async def refresh_domain(self, domain: str, client: httpx.AsyncClient) -> Dict[str, Any]:
+        """도메인 한 개 수집/재검증 후 바뀐 경우에만 교체 (수집 보고 반환)"""
+        state = self.states[domain]
+        async with self._semaphore:
+            state.running = True
+            state.last_attempt = time.time()
+            try:
+                result = await self.fetcher.fetch(client, domain, state.url)
+                entry = result.to_dict()
+                if result.status == "error":
+                    self._failed(state, result.error or "unknown error")
+                else:
+                    entry.update(await self._apply(result))
+                    self._succeeded(state, result.status, changed=entry.get("changed", False))
+            except Exception as exc:  # 루프가 죽지 않도록 - 원인은 상태와 로그에 남김
+                logger.exception("스펙 갱신 실패 %s", domain)
+                self._failed(state, f"{type(exc).__name__}: {exc}")
+                entry = {"domain": domain, "url": state.url, "status": "error", "error": state.last_error}
+            finally:
+                state.running = False
+        return entry
+
+    async def _apply(self, result: "FetchResult") -> Dict[str, Any]:
+        """받은 스펙이 현재 버전과 다를 때만 스레드에서 파싱해 루프 스레드에서 교체하고 스냅샷 저장"""
+        from snapshot_store import get_snapshot_store
+        from spec_store import SpecStore, get_spec_store
+
+        store = get_spec_store()
+        applied: Dict[str, Any] = {"changed": False}
+        if result.body is None:
+            return applied
+        current = store.get(result.domain).content_hash if result.domain in store else None
+        if current != result.content_hash:
+            async with self._apply_lock:
+                index = store.indexed(result.content_hash)
+                if index is None:
+                    try:
+                        index = await asyncio.to_thread(SpecStore.parse, result.body, result.content_hash)
+                    except ValueError as exc:
+                        return {"changed": False, "error": f"스펙 파싱 실패: {exc}"}
+                store.install(result.domain, index, result.url)
+            applied["changed"] = True
+        snapshots = get_snapshot_store()
+        latest = snapshots.latest(result.domain)
+        if latest is None or latest.content_hash != result.content_hash:
+            entry = await asyncio.to_thread(snapshots.put, result.domain, result.body, result.url)
+            applied["snapshot"] = entry.content_hash[:12]
+        return applied
+
+    def _succeeded(self, state: DomainRefreshState, status: str, changed: bool) -> None:
+        now = time.time()
+        state.last_success = now
+        state.last_status = status
+        state.last_error = None
+        state.failures = 0
+        if changed:
+            state.last_changed = now
+            logger.info("스펙 갱신 %s (%s)", state.domain, status)
+        state.next_due = now + jittered(self.interval)
+
+    def _failed(self, state: DomainRefreshState, error: str) -> None:
+        state.failures += 1
+        state.last_status = "error"
+        state.last_error = error
+        delay = backoff_delay(state.failures)
+        state.next_due = time.time() + jittered(delay)
+        # 오프라인 환경에서 로그가 쌓이지 않도록 첫 실패만 경고
+        log = logger.warning if state.failures == 1 else logger.debug
+        log("스펙 갱신 실패 %s (%d회 연속, %.0f초 후 재시도): %s", state.domain, state.failures, delay, error)
+
+    async def refresh(self, domains: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """수동 갱신 (refresh_swagger_specs) - 실행 중이면 스케줄러 클라이언트, 아니면 임시 클라이언트"""
+        targets = [domain for domain in self.states if not domains or domain in domains]
+        if self._client is not None:
+            return list(await asyncio.gather(*(self.refresh_domain(domain, self._client) for domain in targets)))
+        async with self.fetcher.create_client() as client:
+            return list(await asyncio.gather(*(self.refresh_domain(domain, client) for domain in targets)))
+
+    # ===== 백그라운드 실행 =====
+
+    async def _domain_loop(self, domain: str, client: httpx.AsyncClient) -> None:
+        state = self.states[domain]
+        while True:
+            # 수동 갱신으로 next_due 가 밀렸으면 그만큼 더 기다림
+            delay = state.next_due - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            await self.refresh_domain(domain, client)
+
+    async def run(self) -> None:
+        """리더 잠금을 얻으면 도메인별 갱신 루프, 못 얻으면 팔로워로 스냅샷만 다시 로드하며 잠금 재시도
+        (취소될 때까지, interval <= 0 이면 바로 반환)"""
+        if self.interval <= 0 or not self.states:
+            return
+        lock_path = self.lock_path
+        lock = acquire_leader_lock(lock_path)
+        try:
+            while lock is None:
+                if self.role is None:
+                    logger.info("스펙 갱신 팔로워 (리더 잠금: %s)", lock_path)
+                self.role = "follower"
+                await asyncio.sleep(jittered(self.follow_interval))
+                await self.sync_from_snapshots()
+                lock = acquire_leader_lock(lock_path)
+            self.role = "leader"
+            logger.info("스펙 갱신 리더 (잠금: %s)", lock_path)
+            await self._lead()
+        finally:
+            self.role = None
+            if lock is not None:
+                os.close(lock)
+
+    async def _lead(self) -> None:
+        async with self.fetcher.create_client() as client:
+            self._client = client
+            self._tasks = [asyncio.create_task(self._domain_loop(domain, client)) for domain in self.states]
+            try:
+                await asyncio.gather(*self._tasks)
+            finally:
+                for task in self._tasks:
+                    task.cancel()
+                self._tasks = []
+                self._client = None
+
+    async def sync_from_snapshots(self) -> List[str]:
+        """팔로워: 리더가 스냅샷 매니페스트를 바꿨으면 도메인별 최신 스냅샷으로 교체 (스레드에서 읽기/파싱, 루프에서 교체)"""
+        from snapshot_store import get_snapshot_store
+        from spec_store import SpecStore, get_spec_store
+
+        snapshots = get_snapshot_store()
+        if not await asyncio.to_thread(snapshots.reload):
+            return []
+        store = get_spec_store()
+        changed = []
+        for domain, state in self.states.items():
+            entry = snapshots.latest(domain)
+            if entry is None or (domain in store and store.get(domain).content_hash == entry.content_hash):
+                continue
+            async with self._apply_lock:
+                index = store.indexed(entry.content_hash)
+                if index is None:
+                    try:
+                        body = await asyncio.to_thread(snapshots.read, entry.content_hash)
+                        index = await asyncio.to_thread(SpecStore.parse, body, entry.content_hash)
+                    except ValueError as exc:
+                        logger.warning("스냅샷 로드 실패 %s: %s", domain, exc)
+                        continue
+                store.install(domain, index, source=f"snapshot:{entry.content_hash[:12]}")
+            state.last_changed = time.time()
+            changed.append(domain)
+        if changed:
+            logger.info("리더가 갱신한 스냅샷 로드: %s", ", ".join(changed))
+        return changed
+
+    @property
+    def lock_path(self) -> Path:
+        if self._lock_path is None:
+            from snapshot_store import get_snapshot_store
+
+            self._lock_path = get_snapshot_store().root / REFRESH_LOCK_NAME
+        return self._lock_path
+
+    @property
+    def running(self) -> bool:
+        return self.role is not None
+
+    def status(self) -> Dict[str, Any]:
+        now = time.time()
+        return {
+            "running": self.running,
+            "role": self.role,
+            "intervalSeconds": self.interval,
+            "jitter": REFRESH_JITTER,
+            "concurrency": self.concurrency,
+            "maxBackoffSeconds": REFRESH_MAX_BACKOFF,
+            "domains": [state.to_dict(now) for state in self.states.values()],
+        }
+
+
+_default_scheduler: Optional[RefreshScheduler] = None
+
+
+def get_refresh_scheduler(fetcher: Optional["SwaggerFetcher"] = None) -> RefreshScheduler:
+    """프로세스 공용 스케줄러 (수동 갱신 툴과 백그라운드 루프가 상태를 공유)"""
+    global _default_scheduler
+    if _default_scheduler is None:
+        _default_scheduler = RefreshScheduler(fetcher=fetcher)
+    return _default_scheduler
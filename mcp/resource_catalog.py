@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스펙 파생 리소스 + 커서 페이지네이션
+- 리소스 템플릿: swagger://{domain}/spec (원문 전체), swagger://{domain}/paths/{path}, swagger://{domain}/schemas/{name}
+  ({path} 는 RFC 6570 단순 확장 규칙대로 '/' 까지 퍼센트 인코딩: /mold/repair → %2Fmold%2Frepair)
+- 읽기 응답(JSON)은 URI 별로 한 번만 직렬화해 스펙 내용 해시와 함께 캐시
+- ?offset=&limit= 범위 읽기는 캐시된 바이트 버퍼(전체 스펙은 로드한 원문)를 잘라 응답 (chunked_reads)
+- list_resources 는 (정적 리소스 + 모든 도메인의 경로/스키마) 목록을 페이지 단위로 반환
+  커서는 마지막 항목의 정렬 키라 페이지 사이에 목록이 바뀌어도 건너뛰거나 중복되지 않음
+"""
+
+import base64
+import bisect
+import json
+import os
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote, unquote
+
+from mcp import types
+from mcp.types import Resource, ResourceTemplate
+
+from chunked_reads import ByteRange, chunk_result, split_range
+from spec_store import SpecIndex, SpecStore, get_spec_store, on_spec_evicted
+
+SWAGGER_SCHEME = "swagger://"
+SPEC_TEMPLATE = SWAGGER_SCHEME + "{domain}/spec"
+PATH_TEMPLATE = SWAGGER_SCHEME + "{domain}/paths/{path}"
+SCHEMA_TEMPLATE = SWAGGER_SCHEME + "{domain}/schemas/{name}"
+JSON_MIME_TYPE = "application/json"
+
+# list_resources 한 페이지 크기
+RESOURCE_PAGE_SIZE = int(os.getenv("MCP_RESOURCE_PAGE_SIZE", "100"))
+
+RESOURCE_TEMPLATES: List[ResourceTemplate] = [
+    ResourceTemplate(
+        uriTemplate=SPEC_TEMPLATE,
+        name="Swagger 스펙 원문",
+        description="도메인 스펙 JSON 전체 (큰 문서는 ?offset=<byte>&limit=<bytes> 로 나눠 읽기, 응답 _meta.nextOffset)",
+        mimeType=JSON_MIME_TYPE,
+    ),
+    ResourceTemplate(
+        uriTemplate=PATH_TEMPLATE,
+        name="Swagger 경로",
+        description="경로 하나의 전체 오퍼레이션(JSON). path 는 '/' 포함 퍼센트 인코딩 (예: %2Fmold%2Frepair)",
+        mimeType=JSON_MIME_TYPE,
+    ),
+    ResourceTemplate(
+        uriTemplate=SCHEMA_TEMPLATE,
+        name="Swagger 스키마",
+        description="components.schemas 항목 하나(JSON, $ref 는 그대로 - 펼친 결과는 get_schema 툴)",
+        mimeType=JSON_MIME_TYPE,
+    ),
+]
+
+# 정렬 키 - 정적 리소스 (0, 정렬 순번, URI), 스펙 리소스 (1, 도메인, 종류, 이름)
+# (정적 리소스 순번은 콘텐츠 머리말 order 처럼 항목마다 고정된 값 - 목록 위치를 쓰면 앞쪽 항목이 추가/삭제될 때
+#  같은 리소스의 키가 바뀌어 다음 페이지에서 건너뛰거나 중복됨)
+SortKey = Tuple[Any, ...]
+_KIND_ORDER = {"spec": 0, "paths": 1, "schemas": 2}
+# 정렬 키 첫 값 → 요소별 타입 (cursor 검증용 - 모양이 다른 키는 bisect 비교에서 TypeError)
+_SORT_KEY_TYPES: Dict[int, Tuple[type, ...]] = {0: (int, int, str), 1: (int, str, int, str)}
+
+
+def path_uri(domain: str, path: str) -> str:
+    return f"{SWAGGER_SCHEME}{domain}/paths/{quote(path, safe='')}"
+
+
+def schema_uri(domain: str, name: str) -> str:
+    return f"{SWAGGER_SCHEME}{domain}/schemas/{quote(name, safe='')}"
+
+
+def spec_uri(domain: str) -> str:
+    return f"{SWAGGER_SCHEME}{domain}/spec"
+
+
+def parse_spec_uri(uri: str) -> Tuple[str, str, str]:
+    """swagger://{domain}/{spec|paths|schemas}[/{key}] → (도메인, 종류, 디코딩된 키)"""
+    if not uri.startswith(SWAGGER_SCHEME):
+        raise ValueError(f"swagger:// 리소스가 아닙니다: {uri}")
+    parts = uri[len(SWAGGER_SCHEME):].split("/", 2)
+    if len(parts) == 2 and parts[1] == "spec":
+        return parts[0], "spec", ""
+    if len(parts) != 3 or parts[1] not in ("paths", "schemas") or not parts[2]:
+        raise ValueError(
+            f"잘못된 Swagger 리소스 URI 입니다: {uri} (형식: {SPEC_TEMPLATE} | {PATH_TEMPLATE} | {SCHEMA_TEMPLATE})"
+        )
+    return parts[0], parts[1], unquote(parts[2])
+
+
+class SpecResources:
+    """스펙 저장소의 경로/스키마를 MCP 리소스로 노출 (목록·본문 모두 스펙 해시 단위 캐시)"""
+
+    def __init__(self, store_factory: Callable[[], SpecStore] = get_spec_store) -> None:
+        # 스펙 파싱이 서버 기동 시간에 들어가지 않도록 첫 사용 시 저장소를 가져옴
+        self._store_factory = store_factory
+        self._listings: Dict[str, List[Tuple[SortKey, Resource]]] = {}
+        self._texts: Dict[str, Tuple[str, str]] = {}
+        self._buffers: Dict[str, Tuple[str, bytes]] = {}
+        # uri → (스펙 해시, 도메인, 응답) - 도메인을 함께 두어 적중 시 URI 파싱 없이 해시만 확인
+        self._results: Dict[str, Tuple[str, str, types.ServerResult]] = {}
+        _instances.add(self)
+
+    def evict(self, content_hash: str) -> None:
+        """해제된 스펙 버전의 목록/본문/응답 캐시 제거 (한 번 읽고 다시 읽지 않는 uri 의 옛 본문이 남지 않도록)"""
+        self._listings = {key: value for key, value in self._listings.items() if not key.endswith(":" + content_hash)}
+        for cache in (self._texts, self._buffers, self._results):
+            for uri in [uri for uri, cached in cache.items() if cached[0] == content_hash]:
+                del cache[uri]
+
+    @property
+    def store(self) -> SpecStore:
+        return self._store_factory()
+
+    def listing(self, domain: str) -> List[Tuple[SortKey, Resource]]:
+        """도메인 하나의 (정렬 키, 리소스) 목록 - 같은 스펙 해시면 재사용"""
+        index = self.store.get(domain)
+        cache_key = f"{domain}:{index.content_hash}"
+        listing = self._listings.get(cache_key)
+        if listing is None:
+            listing = _build_listing(domain, index)
+            self._listings = {key: value for key, value in self._listings.items() if not key.startswith(domain + ":")}
+            self._listings[cache_key] = listing
+        return listing
+
+    def text(self, uri: str) -> str:
+        """리소스 본문 JSON 문자열 (스펙이 바뀌지 않았으면 캐시된 직렬화 결과)"""
+        domain, kind, key = parse_spec_uri(uri)
+        index = self.store.get(domain)
+        cached = self._texts.get(uri)
+        if cached is not None and cached[0] == index.content_hash:
+            return cached[1]
+        if kind == "spec":
+            text = index.raw.decode("utf-8")
+        else:
+            text = json.dumps(_resource_body(index, kind, key, uri), ensure_ascii=False, indent=2)
+        self._texts[uri] = (index.content_hash, text)
+        return text
+
+    def buffer(self, uri: str) -> bytes:
+        """리소스 본문 UTF-8 바이트 (청크 읽기용, 전체 스펙은 로드한 원문 그대로)"""
+        domain, kind, _ = parse_spec_uri(uri)
+        index = self.store.get(domain)
+        if kind == "spec":
+            return index.raw
+        cached = self._buffers.get(uri)
+        if cached is not None and cached[0] == index.content_hash:
+            return cached[1]
+        data = self.text(uri).encode("utf-8")
+        self._buffers[uri] = (index.content_hash, data)
+        return data
+
+    def read(self, uri: str) -> types.ServerResult:
+        """read_resource 응답 (본문과 함께 응답 객체도 캐시, 범위 쿼리가 있으면 버퍼 청크)"""
+        cached = self._results.get(uri)
+        if cached is not None and cached[0] == self.store.get(cached[1]).content_hash:
+            return cached[2]
+        base, byte_range = split_range(uri)
+        if byte_range is not None:
+            return self.read_range(uri, base, byte_range)
+        domain, _, _ = parse_spec_uri(uri)
+        content_hash = self.store.get(domain).content_hash
+        result = types.ServerResult(
+            types.ReadResourceResult(
+                contents=[types.TextResourceContents(uri=uri, text=self.text(uri), mimeType=JSON_MIME_TYPE)]
+            )
+        )
+        self._results[uri] = (content_hash, domain, result)
+        return result
+
+    def read_range(self, uri: str, base: str, byte_range: ByteRange) -> types.ServerResult:
+        return chunk_result(uri, self.buffer(base), byte_range, JSON_MIME_TYPE)
+
+
+def _build_listing(domain: str, index: SpecIndex) -> List[Tuple[SortKey, Resource]]:
+    listing: List[Tuple[SortKey, Resource]] = [(
+        (1, domain, _KIND_ORDER["spec"], ""),
+        Resource(
+            uri=spec_uri(domain),
+            name=f"{domain} spec",
+            description=f"{index.title} 스펙 원문 ({len(index.raw):,} bytes, ?offset=&limit= 로 청크 읽기)",
+            mimeType=JSON_MIME_TYPE,
+            size=len(index.raw),
+        ),
+    )]
+    for path in sorted(index.by_path):
+        operations = [index.operations[position] for position in index.by_path[path]]
+        summary = " / ".join(f"{op.method.upper()} {op.summary}".strip() for op in operations)
+        listing.append((
+            (1, domain, _KIND_ORDER["paths"], path),
+            Resource(uri=path_uri(domain, path), name=f"{domain} {path}", description=summary, mimeType=JSON_MIME_TYPE),
+        ))
+    for name in sorted(index.schema_models):
+        schema = index.schema_models[name]
+        listing.append((
+            (1, domain, _KIND_ORDER["schemas"], name),
+            Resource(
+                uri=schema_uri(domain, name),
+                name=f"{domain} {name}",
+                description=schema.description or schema.title,
+                mimeType=JSON_MIME_TYPE,
+            ),
+        ))
+    return listing
+
+
+def _resource_body(index: SpecIndex, kind: str, key: str, uri: str) -> Dict[str, Any]:
+    if kind == "paths":
+        path_item = index.spec.get("paths", {}).get(key)
+        if path_item is None:
+            raise ValueError(f"리소스를 찾을 수 없습니다: {uri}")
+        return {"path": key, **path_item}
+    schema = index.schemas.get(key)
+    if schema is None:
+        raise ValueError(f"리소스를 찾을 수 없습니다: {uri}")
+    return {"name": key, **schema}
+
+
+# ===== 페이지네이션 =====
+
+def encode_cursor(key: SortKey) -> str:
+    return base64.urlsafe_b64encode(json.dumps(key, ensure_ascii=False).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> SortKey:
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, UnicodeError) as exc:
+        raise ValueError(f"잘못된 cursor 입니다: {cursor}") from exc
+    expected = _SORT_KEY_TYPES.get(key[0]) if isinstance(key, list) and key and type(key[0]) is int else None
+    if expected is None or len(key) != len(expected) or any(type(value) is not kind for value, kind in zip(key, expected)):
+        raise ValueError(f"잘못된 cursor 입니다: {cursor}")
+    return tuple(key)
+
+
+class ResourceCatalog:
+    """정적 리소스 + 스펙 리소스 전체 목록 (구성 결과는 입력 버전이 같으면 재사용)
+
+    static 은 (정렬 순번, 리소스) 목록 - 순번이 같으면 URI 순
+    """
+
+    def __init__(
+        self,
+        static: Callable[[], List[Tuple[int, Resource]]],
+        static_version: Callable[[], Any],
+        specs: SpecResources,
+        page_size: int = RESOURCE_PAGE_SIZE,
+    ) -> None:
+        self._static = static
+        self._static_version = static_version
+        self.specs = specs
+        self.page_size = page_size
+        self._version: Optional[Tuple[Any, ...]] = None
+        self._keys: List[SortKey] = []
+        self._resources: List[Resource] = []
+
+    def _current_version(self) -> Tuple[Any, ...]:
+        store = self.specs.store
+        return (self._static_version(), *((domain, store.get(domain).content_hash) for domain in store.domains()))
+
+    def _ensure(self) -> None:
+        version = self._current_version()
+        if version == self._version:
+            return
+        entries: List[Tuple[SortKey, Resource]] = [
+            ((0, ordinal, str(resource.uri)), resource) for ordinal, resource in self._static()
+        ]
+        for domain in self.specs.store.domains():
+            entries.extend(self.specs.listing(domain))
+        entries.sort(key=lambda entry: entry[0])
+        self._keys = [key for key, _ in entries]
+        self._resources = [resource for _, resource in entries]
+        self._version = version
+
+    def page(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> types.ListResourcesResult:
+        """cursor 다음부터 limit 개 (마지막 페이지면 nextCursor 없음)"""
+        self._ensure()
+        limit = limit or self.page_size
+        start = bisect.bisect_right(self._keys, decode_cursor(cursor)) if cursor else 0
+        end = start + limit
+        next_cursor = encode_cursor(self._keys[end - 1]) if end < len(self._keys) else None
+        return types.ListResourcesResult(resources=self._resources[start:end], nextCursor=next_cursor)
+
+    def __len__(self) -> int:
+        self._ensure()
+        return len(self._resources)
+
+
+# 스펙 버전 해제 알림을 받을 인스턴스 (약한 참조 - 콜백 등록이 인스턴스를 붙잡지 않도록)
+_instances: "weakref.WeakSet[SpecResources]" = weakref.WeakSet()
+
+
+@on_spec_evicted
+def _evict_resources(content_hash: str) -> None:
+    for resources in list(_instances):
+        resources.evict(content_hash)
+
+
+_default_spec_resources: Optional[SpecResources] = None
+
+
+def get_spec_resources() -> SpecResources:
+    """프로세스 공용 스펙 리소스 (스펙 저장소는 첫 사용 시 로드)"""
+    global _default_spec_resources
+    if _default_spec_resources is None:
+        _default_spec_resources = SpecResources()
+    return _default_spec_resources
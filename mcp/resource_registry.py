@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MCP 리소스 레지스트리
+- 서버 시작 시 구성되는 URI → 리소스 매핑 (콘텐츠가 바뀐 항목만 교체)
+- 리소스 본문과 ReadResourceResult 응답은 등록 시점에 미리 만들어 두고
+  읽기 시에는 dict 조회만 수행
+- list_resources / read_resource 가 같은 레지스트리를 사용
+- 압축 JSON 형식을 함께 등록한 리소스는 '<uri>?format=json' 으로 읽기 (응답도 등록 시 미리 생성)
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+from mcp import types
+from mcp.types import Resource
+
+from chunked_reads import chunk_result, split_range
+from content_formats import FORMAT_MIME_TYPES, JSON, MARKDOWN, split_format
+
+
+@dataclass(frozen=True)
+class ResourceEntry:
+    """등록된 리소스 한 건 (메타데이터 + 미리 렌더링된 본문)"""
+
+    resource: Resource
+    text: str
+    encoded: bytes
+    result: types.ServerResult
+
+
+class ResourceRegistry:
+    """URI 를 키로 하는 리소스 테이블"""
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, ResourceEntry] = {}
+        # URI → 압축 JSON 형식 (등록 시 json_content 를 준 리소스만)
+        self._json_entries: Dict[str, ResourceEntry] = {}
+        self._resources: List[Resource] = []
+
+    def register(
+        self,
+        uri: str,
+        name: str,
+        description: str,
+        content: str,
+        mime_type: str = FORMAT_MIME_TYPES[MARKDOWN],
+        replace: bool = False,
+        json_content: Optional[str] = None,
+    ) -> ResourceEntry:
+        """리소스 등록 (같은 URI 중복 등록은 오류, replace=True 면 목록 위치를 유지한 채 교체)
+        json_content 를 주면 같은 리소스의 압축 JSON 형식도 응답을 미리 만들어 둠"""
+        previous = self._entries.get(uri)
+        if previous is not None and not replace:
+            raise ValueError(f"이미 등록된 리소스 URI 입니다: {uri}")
+
+        resource = Resource(uri=uri, name=name, description=description, mimeType=mime_type)
+        entry = ResourceEntry(
+            resource=resource,
+            text=content,
+            encoded=content.encode("utf-8"),
+            result=types.ServerResult(
+                types.ReadResourceResult(
+                    contents=[types.TextResourceContents(uri=uri, text=content, mimeType=mime_type)]
+                )
+            ),
+        )
+        self._entries[uri] = entry
+        if json_content is not None:
+            self._json_entries[uri] = _prebuilt(resource, f"{uri}?format={JSON}", json_content, FORMAT_MIME_TYPES[JSON])
+        else:
+            self._json_entries.pop(uri, None)
+        if previous is None:
+            self._resources.append(resource)
+        else:
+            self._resources[self._resources.index(previous.resource)] = resource
+        return entry
+
+    def unregister(self, uri: str) -> None:
+        """리소스 제거 (없으면 무시)"""
+        entry = self._entries.pop(uri, None)
+        self._json_entries.pop(uri, None)
+        if entry is not None:
+            self._resources.remove(entry.resource)
+
+    def get(self, uri: str) -> Optional[ResourceEntry]:
+        """URI 로 리소스 조회 (없으면 None)"""
+        return self._entries.get(uri)
+
+    def read(self, uri: str) -> types.ServerResult:
+        """미리 만들어 둔 read_resource 응답 반환 (없으면 ValueError)
+        URI 에 ?offset=&limit= 범위 쿼리가 있으면 미리 인코딩한 본문 바이트를 잘라 응답, format=json 이면 압축 JSON 형식"""
+        entry = self._entries.get(uri)
+        if entry is None:
+            base, format = split_format(uri)
+            entries = self._json_entries if format == JSON else self._entries
+            base, byte_range = split_range(base)
+            entry = entries.get(base)
+            if entry is None:
+                raise ValueError(f"리소스를 찾을 수 없습니다: {uri}")
+            if byte_range is not None:
+                mime_type = FORMAT_MIME_TYPES[JSON] if format == JSON else entry.resource.mimeType or "text/plain"
+                return chunk_result(uri, entry.encoded, byte_range, mime_type)
+        return entry.result
+
+    def list_resources(self) -> List[Resource]:
+        """등록 순서대로 리소스 메타데이터 반환"""
+        return self._resources
+
+    def __contains__(self, uri: object) -> bool:
+        return uri in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _prebuilt(resource: Resource, uri: str, content: str, mime_type: str) -> ResourceEntry:
+    """다른 형식 본문의 미리 만든 응답 (목록에는 원래 리소스 하나만 노출)"""
+    return ResourceEntry(
+        resource=resource,
+        text=content,
+        encoded=content.encode("utf-8"),
+        result=types.ServerResult(
+            types.ReadResourceResult(contents=[types.TextResourceContents(uri=uri, text=content, mimeType=mime_type)])
+        ),
+    )
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+components.schemas → TypeScript 타입 + Zod 스키마 생성기
+- 스펙 제약을 그대로 옮김: required → 필수/optional, maxLength/minLength, minimum/maximum, pattern, enum,
+  integer → .int(), nullable → .nullable(), description → JSDoc
+- $ref 그래프를 위상 정렬(의존 대상 먼저)해 스키마마다 파일 1개(<Name>.ts)를 만들고,
+  index.ts 는 의존 순서대로 다시 내보냄
+- 순환 참조(같은 강연결 요소 안의 $ref)는 z.lazy(() => XSchema) + z.ZodType<X> 주석으로 생성
+- 생성 결과는 (스키마 내용 해시, 지연 참조 목록) 단위로 한 번만 만들어 메모이즈하고 디스크에 저장
+  → 스펙이 바뀌어 다시 생성하면 해시가 바뀐 스키마만 새로 만들고, 내용이 같은 파일은 쓰지 않음
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from atomic_files import atomic_pickle
+from hook_generator import DEFAULT_OUTPUT_DIR, resolve_output_dir, write_files
+from server_metrics import METRICS
+from spec_store import REF_PREFIX, SpecIndex, schema_refs
+
+MCP_DIR = Path(__file__).parent
+DEFAULT_CACHE_PATH = Path(os.getenv("SCHEMA_EMITTER_CACHE_PATH", str(MCP_DIR / ".cache" / "schema_emitter.pickle")))
+
+# 생성 규칙이 바뀌면 올려서 메모이즈된 결과 전체 무효화
+EMITTER_VERSION = 1
+
+_IDENTIFIER_RE = re.compile(r"^[A-Za-z_$][\w$]*$")
+
+
+@dataclass(frozen=True)
+class EmittedSchema:
+    """스키마 하나의 생성 결과 (파일 본문 + 참조하는 다른 스키마)"""
+
+    text: str
+    refs: Tuple[str, ...]
+
+
+# ===== 의존 그래프 =====
+
+def dependency_graph(schemas: Dict[str, Any]) -> Dict[str, List[str]]:
+    """스키마 이름 → 직접 참조하는 (존재하는) 스키마 이름 (정렬)"""
+    return {name: sorted(ref for ref in set(schema_refs(schema)) if ref in schemas) for name, schema in schemas.items()}
+
+
+def strongly_connected(graph: Dict[str, List[str]]) -> Dict[str, int]:
+    """Tarjan 강연결 요소 - 스키마 이름 → 요소 번호 (반복 구현, 재귀 한도 없음)"""
+    index_of: Dict[str, int] = {}
+    low: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    stack: List[str] = []
+    component: Dict[str, int] = {}
+    counter = components = 0
+    for root in sorted(graph):
+        if root in index_of:
+            continue
+        work: List[Tuple[str, int]] = [(root, 0)]
+        while work:
+            node, child_position = work.pop()
+            if child_position == 0:
+                index_of[node] = low[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack.add(node)
+            children = graph[node]
+            if child_position < len(children):
+                work.append((node, child_position + 1))
+                child = children[child_position]
+                if child not in index_of:
+                    work.append((child, 0))
+                elif child in on_stack:
+                    low[node] = min(low[node], index_of[child])
+                continue
+            if low[node] == index_of[node]:
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component[member] = components
+                    if member == node:
+                        break
+                components += 1
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+    return component
+
+
+def topological_order(graph: Dict[str, List[str]]) -> List[str]:
+    """의존 대상이 먼저 오는 순서 (순환 안에서는 이름 순, 같은 입력이면 항상 같은 순서)"""
+    order: List[str] = []
+    visited: Set[str] = set()
+    for root in sorted(graph):
+        if root in visited:
+            continue
+        visited.add(root)
+        work: List[Tuple[str, int]] = [(root, 0)]
+        while work:
+            node, child_position = work.pop()
+            children = graph[node]
+            if child_position < len(children):
+                work.append((node, child_position + 1))
+                child = children[child_position]
+                if child not in visited:
+                    visited.add(child)
+                    work.append((child, 0))
+                continue
+            order.append(node)
+    return order
+
+
+# ===== 스키마 → TS / Zod =====
+
+def _quote_key(key: str) -> str:
+    return key if _IDENTIFIER_RE.match(key) else json.dumps(key, ensure_ascii=False)
+
+
+def _literal(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _js_regex(pattern: str) -> str:
+    return "/" + pattern.replace("/", "\\/") + "/"
+
+
+class _Emitter:
+    """스키마 하나를 TS 타입 표기와 Zod 표현식으로 변환"""
+
+    def __init__(self, lazy_refs: FrozenSet[str]) -> None:
+        self.lazy_refs = lazy_refs
+        self.refs: Set[str] = set()
+
+    def convert(self, node: Any, indent: str) -> Tuple[str, str]:
+        if not isinstance(node, dict):
+            return "unknown", "z.unknown()"
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith(REF_PREFIX):
+            name = ref[len(REF_PREFIX):]
+            self.refs.add(name)
+            zod = f"z.lazy(() => {name}Schema)" if name in self.lazy_refs else f"{name}Schema"
+            return name, zod
+
+        ts, zod = self._convert_shape(node, indent)
+        if node.get("nullable"):
+            ts, zod = f"{ts} | null", f"{zod}.nullable()"
+        return ts, zod
+
+    def _convert_shape(self, node: Dict[str, Any], indent: str) -> Tuple[str, str]:
+        for combinator, ts_joiner in (("allOf", " & "), ("oneOf", " | "), ("anyOf", " | ")):
+            members = node.get(combinator)
+            if isinstance(members, list) and members:
+                converted = [self.convert(member, indent) for member in members]
+                if len(converted) == 1:
+                    return converted[0]
+                ts = ts_joiner.join(f"({item_ts})" if " " in item_ts else item_ts for item_ts, _ in converted)
+                if combinator == "allOf":
+                    zod = converted[0][1] + "".join(f".and({item_zod})" for _, item_zod in converted[1:])
+                else:
+                    zod = f"z.union([{', '.join(item_zod for _, item_zod in converted)}])"
+                return ts, zod
+
+        enum = node.get("enum")
+        if isinstance(enum, list) and enum:
+            ts = " | ".join(_literal(value) for value in enum)
+            if all(isinstance(value, str) for value in enum):
+                return ts, f"z.enum([{', '.join(_literal(value) for value in enum)}])"
+            return ts, f"z.union([{', '.join(f'z.literal({_literal(value)})' for value in enum)}])"
+
+        kind = node.get("type")
+        if kind == "string":
+            zod = "z.string()"
+            if node.get("minLength"):
+                zod += f".min({node['minLength']})"
+            if "maxLength" in node:
+                zod += f".max({node['maxLength']})"
+            if node.get("pattern"):
+                zod += f".regex({_js_regex(node['pattern'])})"
+            if node.get("format") == "email":
+                zod += ".email()"
+            return "string", zod
+        if kind in ("integer", "number"):
+            zod = "z.number().int()" if kind == "integer" else "z.number()"
+            if "minimum" in node:
+                zod += f".{'gt' if node.get('exclusiveMinimum') is True else 'min'}({node['minimum']})"
+            if "maximum" in node:
+                zod += f".{'lt' if node.get('exclusiveMaximum') is True else 'max'}({node['maximum']})"
+            return "number", zod
+        if kind == "boolean":
+            return "boolean", "z.boolean()"
+        if kind == "array":
+            item_ts, item_zod = self.convert(node.get("items", {}), indent)
+            zod = f"z.array({item_zod})"
+            if node.get("minItems"):
+                zod += f".min({node['minItems']})"
+            if "maxItems" in node:
+                zod += f".max({node['maxItems']})"
+            return (f"({item_ts})[]" if " " in item_ts else f"{item_ts}[]"), zod
+        if kind == "object" or "properties" in node:
+            return self._convert_object(node, indent)
+        return "unknown", "z.unknown()"
+
+    def _convert_object(self, node: Dict[str, Any], indent: str) -> Tuple[str, str]:
+        properties = node.get("properties") or {}
+        extra = node.get("additionalProperties")
+        if not properties:
+            if isinstance(extra, dict):
+                value_ts, value_zod = self.convert(extra, indent)
+                return f"Record<string, {value_ts}>", f"z.record(z.string(), {value_zod})"
+            return "Record<string, unknown>", "z.record(z.string(), z.unknown())"
+
+        required = set(node.get("required") or ())
+        inner = indent + "\t"
+        ts_lines: List[str] = []
+        zod_lines: List[str] = []
+        for key, child in properties.items():
+            child_ts, child_zod = self.convert(child, inner)
+            description = child.get("description") if isinstance(child, dict) else None
+            if description:
+                ts_lines.append(f"{inner}/** {description.replace('*/', '* /')} */")
+            optional = key not in required
+            ts_lines.append(f"{inner}{_quote_key(key)}{'?' if optional else ''}: {child_ts};")
+            zod_lines.append(f"{inner}{_quote_key(key)}: {child_zod}{'.optional()' if optional else ''},")
+        return (
+            "{\n" + "\n".join(ts_lines) + f"\n{indent}}}",
+            "z.object({\n" + "\n".join(zod_lines) + f"\n{indent}}})",
+        )
+
+
+def emit_schema(domain: str, name: str, schema: Dict[str, Any], lazy_refs: FrozenSet[str]) -> EmittedSchema:
+    """스키마 하나 → <name>.ts 본문 (TS 타입 + Zod 스키마, 참조 스키마 import)"""
+    emitter = _Emitter(lazy_refs)
+    ts, zod = emitter.convert(schema, "")
+    refs = tuple(sorted(emitter.refs - {name}))
+
+    lines = [
+        f"// Swagger 스펙({domain}) components.schemas.{name} 에서 생성된 파일 - 수정 시 emit_zod_schemas 로 다시 생성",
+        "import { z } from 'zod';",
+    ]
+    lines.extend(f"import {{ {ref}Schema, type {ref} }} from './{ref}';" for ref in refs)
+    lines.append("")
+    description = schema.get("description")
+    if description:
+        lines.append(f"/** {description.replace('*/', '* /')} */")
+    lines.append(f"export type {name} = {ts};")
+    lines.append("")
+    # 순환 참조에 걸린 스키마는 타입 추론이 끊기므로 명시적 타입 주석
+    annotation = f": z.ZodType<{name}>" if lazy_refs else ""
+    lines.append(f"export const {name}Schema{annotation} = {zod};")
+    return EmittedSchema("\n".join(lines) + "\n", refs)
+
+
+def schema_hash(schema: Any) -> str:
+    return hashlib.sha256(json.dumps(schema, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+# ===== 메모이즈된 생성기 =====
+
+class SchemaEmitter:
+    """(스키마 해시, 지연 참조) → 생성 결과 메모 (디스크 저장)"""
+
+    def __init__(self, cache_path: Optional[Path] = DEFAULT_CACHE_PATH) -> None:
+        self.cache_path = cache_path
+        self._memo: Dict[Tuple[str, FrozenSet[str]], EmittedSchema] = {}
+        self._dirty = False
+        # 도메인이 다른 emit_domain 은 스레드에서 동시에 실행됨 → 메모 갱신/복사는 _lock, 저장 순서는 _save_lock
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if self.cache_path is None:
+            return
+        try:
+            with open(self.cache_path, "rb") as handle:
+                version, memo = pickle.load(handle)
+        except (OSError, pickle.PickleError, EOFError, ValueError, TypeError, AttributeError):
+            return
+        if version == EMITTER_VERSION:
+            self._memo = memo
+
+    def save(self) -> None:
+        """메모 복사본을 원자적으로 저장 (복사 후에는 다른 스레드가 메모를 계속 갱신해도 됨)"""
+        if self.cache_path is None:
+            return
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                memo = dict(self._memo)
+                self._dirty = False
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                atomic_pickle(self.cache_path, (EMITTER_VERSION, memo))
+            except BaseException:
+                with self._lock:
+                    self._dirty = True
+                raise
+
+    def emit_domain(self, index: SpecIndex, domain: str) -> Tuple[List[Tuple[str, str]], Dict[str, Any]]:
+        """도메인 스키마 전체 → ([(파일 이름, 본문)] 의존 순서, 통계)"""
+        schemas = index.schemas
+        graph = dependency_graph(schemas)
+        component = strongly_connected(graph)
+        members: Dict[int, Set[str]] = {}
+        for name, number in component.items():
+            members.setdefault(number, set()).add(name)
+
+        order = topological_order(graph)
+        files: List[Tuple[str, str]] = []
+        emitted = reused = 0
+        for name in order:
+            group = members[component[name]]
+            # 자기 자신 참조 또는 같은 순환 안의 참조만 지연 평가
+            lazy = frozenset(ref for ref in graph[name] if ref in group and (len(group) > 1 or ref == name))
+            key = (schema_hash({"domain": domain, "name": name, "schema": schemas[name]}), lazy)
+            result = self._memo.get(key)
+            if result is None:
+                METRICS.cache_miss("schema_emitter")
+                result = emit_schema(domain, name, schemas[name], lazy)
+                with self._lock:
+                    self._memo[key] = result
+                    self._dirty = True
+                emitted += 1
+            else:
+                METRICS.cache_hit("schema_emitter")
+                reused += 1
+            files.append((f"{name}.ts", result.text))
+
+        exports = [f"export * from './{name}';" for name in order]
+        files.append(("index.ts", "// 의존 순서 (참조되는 스키마가 먼저)\n" + "\n".join(exports) + "\n"))
+        stats = {
+            "schemas": len(order),
+            "emitted": emitted,
+            "reused": reused,
+            "cycles": sorted(sorted(group) for group in members.values() if len(group) > 1 or any(
+                name in graph[name] for name in group
+            )),
+        }
+        return files, stats
+
+
+_emitter: Optional[SchemaEmitter] = None
+
+
+def get_emitter() -> SchemaEmitter:
+    global _emitter
+    if _emitter is None:
+        _emitter = SchemaEmitter()
+    return _emitter
+
+
+def emit_domain_schemas(index: SpecIndex, domain: str, output_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """도메인 스키마를 output_dir(기본 .cache/generated/{domain}/schemas) 에 생성 - 바뀐 파일만 씀"""
+    output_dir = resolve_output_dir(output_dir, DEFAULT_OUTPUT_DIR / domain / "schemas")
+    emitter = get_emitter()
+    files, stats = emitter.emit_domain(index, domain)
+    emitter.save()
+    changed = write_files(files, output_dir)
+    return {
+        "domain": domain,
+        "outputDir": str(output_dir),
+        **stats,
+        "files": len(files),
+        "written": [path for (path, _), was_written in zip(files, changed) if was_written],
+        "order": [path[: -len(".ts")] for path, _ in files[:-1]],
+    }
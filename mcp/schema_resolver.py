@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+컴포넌트 스키마 $ref 해석기
+- components.schemas 의 $ref 그래프를 펼친(flatten) 결과를 스키마 이름별로 한 번만 계산해 메모이즈
+- 순환 참조는 {"$ref": ..., "x-circular": true} 로 끊음
+- 깊이 제한 뷰(get(name, depth))도 (이름, 깊이) 단위로 캐시 → 반복 조회는 dict 조회 1회
+- 스펙 버전이 저장소 이력에서 해제되면 그 내용 해시의 해석기도 해제
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+from server_metrics import METRICS
+from spec_store import REF_PREFIX, SpecIndex, on_spec_evicted
+
+# 순환에 걸리지 않은 노드의 "가장 얕은 순환 지점" 값
+_NO_CYCLE = 1 << 30
+
+
+class SchemaResolver:
+    """스키마 한 세트(components.schemas)에 대한 메모이즈된 해석기"""
+
+    def __init__(self, schemas: Dict[str, Dict[str, Any]]) -> None:
+        self._schemas = schemas
+        self._flat: Dict[str, Dict[str, Any]] = {}
+        self._views: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._schemas
+
+    def flatten(self, name: str) -> Dict[str, Any]:
+        """$ref 를 모두 펼친 스키마 (반환값은 캐시 공유 객체이므로 수정 금지)"""
+        cached = self._flat.get(name)
+        if cached is not None:
+            return cached
+        if name not in self._schemas:
+            raise KeyError(name)
+        result, _ = self._expand_ref(name, {})
+        return result
+
+    def get(self, name: str, depth: Optional[int] = None) -> Dict[str, Any]:
+        """깊이 제한 뷰 - depth 는 펼칠 중첩 $ref 단계 수 (None/음수면 전체)"""
+        if depth is None or depth < 0:
+            if name in self._flat:
+                METRICS.cache_hit("schema_resolver")
+            else:
+                METRICS.cache_miss("schema_resolver")
+            return self.flatten(name)
+        key = (name, depth)
+        view = self._views.get(key)
+        if view is None:
+            METRICS.cache_miss("schema_resolver")
+            view = _limit_depth(self.flatten(name), depth + 1)
+            self._views[key] = view
+        else:
+            METRICS.cache_hit("schema_resolver")
+        return view
+
+    def flatten_all(self) -> int:
+        """모든 스키마를 펼쳐 캐시 (펼친 스키마 수 반환)"""
+        for name in self._schemas:
+            self.flatten(name)
+        return len(self._flat)
+
+    def _expand_ref(self, name: str, active: Dict[str, int]) -> Tuple[Dict[str, Any], int]:
+        """스키마 하나를 펼침 - (결과, 결과가 의존하는 가장 얕은 순환 지점) 반환"""
+        cached = self._flat.get(name)
+        if cached is not None:
+            return cached, _NO_CYCLE
+        if name in active:
+            return {"$ref": REF_PREFIX + name, "x-circular": True}, active[name]
+        schema = self._schemas.get(name)
+        if schema is None:
+            return {"$ref": REF_PREFIX + name, "x-missing": True}, _NO_CYCLE
+
+        level = len(active)
+        active[name] = level
+        body, lowest = self._expand_node(schema, active)
+        del active[name]
+
+        result = {"x-ref": name, **body}
+        # 바깥 스키마로 되돌아가는 순환이 없을 때만 단독 결과로 캐시
+        if lowest >= level:
+            self._flat[name] = result
+            lowest = _NO_CYCLE
+        return result, lowest
+
+    def _expand_node(self, node: Any, active: Dict[str, int]) -> Tuple[Any, int]:
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str) and ref.startswith(REF_PREFIX):
+                return self._expand_ref(ref[len(REF_PREFIX):], active)
+            lowest = _NO_CYCLE
+            expanded: Dict[str, Any] = {}
+            for key, value in node.items():
+                expanded[key], child_lowest = self._expand_node(value, active)
+                lowest = min(lowest, child_lowest)
+            return expanded, lowest
+        if isinstance(node, list):
+            lowest = _NO_CYCLE
+            items = []
+            for value in node:
+                item, child_lowest = self._expand_node(value, active)
+                items.append(item)
+                lowest = min(lowest, child_lowest)
+            return items, lowest
+        return node, _NO_CYCLE
+
+
+def _limit_depth(node: Any, remaining: int) -> Any:
+    """펼친 스키마에서 remaining 단계를 넘는 $ref 는 다시 참조로 접음"""
+    if isinstance(node, dict):
+        name = node.get("x-ref")
+        if name is not None:
+            if remaining <= 0:
+                return {"$ref": REF_PREFIX + name}
+            remaining -= 1
+        return {key: _limit_depth(value, remaining) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_limit_depth(value, remaining) for value in node]
+    return node
+
+
+_resolvers: Dict[str, SchemaResolver] = {}
+
+
+@on_spec_evicted
+def _evict_resolver(content_hash: str) -> None:
+    _resolvers.pop(content_hash, None)
+
+
+def get_resolver(index: SpecIndex) -> SchemaResolver:
+    """스펙 내용 해시별 해석기 (같은 스펙을 공유하는 도메인은 캐시도 공유)"""
+    resolver = _resolvers.get(index.content_hash)
+    if resolver is None:
+        resolver = SchemaResolver(index.schemas)
+        _resolvers[index.content_hash] = resolver
+    return resolver
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+전문 검색 인덱스 (BM25)
+- 대상: MCP 리소스 마크다운, docs/·packages/ 마크다운, Swagger 요약/설명
+- 토큰화: 영문/숫자는 단어(+camelCase 분해), 한글은 문자 2-gram (조사·어미가 붙어도 매칭)
+- 역색인 + BM25 랭킹
+- 디스크에 저장하고 원본별 버전(mtime/내용 해시)이 바뀐 것만 다시 토큰화
+"""
+
+import hashlib
+import os
+import pickle
+import re
+import time
+from dataclasses import dataclass, field
+from math import log
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from atomic_files import atomic_pickle
+from server_metrics import METRICS
+from spec_store import SpecIndex
+
+# 프로젝트 루트 / 기본 인덱스 파일
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_INDEX_PATH = Path(os.getenv("SEARCH_INDEX_PATH", str(Path(__file__).parent / ".cache" / "search_index.pickle")))
+
+# 마크다운 수집 대상 디렉토리와 제외 디렉토리
+MARKDOWN_ROOTS = ("docs", "packages")
+SKIP_DIRS = {"node_modules", "dist", "build", ".turbo", ".git", "coverage"}
+
+SWAGGER_SOURCE_PREFIX = "swagger://"
+
+# 저장 포맷 버전 (토큰화/섹션 분리 규칙이 바뀌면 올려서 전체 재색인)
+INDEX_FORMAT = 2
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_WORD_RE = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+")
+_ASCII_RE = re.compile(r"[A-Za-z0-9]+")
+_HANGUL_RE = re.compile(r"[가-힣]+")
+_HEADING_RE = re.compile(r"^#{1,6}\s+(.*)$")
+
+
+def tokenize(text: str) -> List[str]:
+    """검색 토큰 목록 (영문 소문자 단어 + camelCase 조각, 한글 2-gram)"""
+    tokens: List[str] = []
+    for word in _ASCII_RE.findall(text):
+        lowered = word.lower()
+        tokens.append(lowered)
+        parts = _WORD_RE.findall(word)
+        if len(parts) > 1:
+            tokens.extend(part.lower() for part in parts)
+    for run in _HANGUL_RE.findall(text):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def split_sections(text: str, default_title: str) -> List[Tuple[str, str]]:
+    """마크다운을 제목(#) 단위 섹션으로 분리 (``` 코드 블록 안의 # 줄은 셸 주석 등이라 제목으로 보지 않음)"""
+    sections: List[Tuple[str, str]] = []
+    title = default_title
+    lines: List[str] = []
+    in_fence = False
+    for line in text.splitlines():
+        if line.startswith("```"):
+            in_fence = not in_fence
+        match = None if in_fence else _HEADING_RE.match(line)
+        if match and lines:
+            body = "\n".join(lines).strip()
+            if body:
+                sections.append((title, body))
+            lines = []
+        if match:
+            title = match.group(1).replace("**", "").strip() or default_title
+        lines.append(line)
+    body = "\n".join(lines).strip()
+    if body:
+        sections.append((title, body))
+    return sections
+
+
+@dataclass
+class Document:
+    """검색 단위 문서 (마크다운 섹션, Swagger 오퍼레이션 등)"""
+
+    doc_id: str
+    source: str
+    title: str
+    text: str
+    length: int
+    terms: Dict[str, int]
+
+
+@dataclass
+class SearchHit:
+    source: str
+    title: str
+    score: float
+    snippet: str
+
+    def to_dict(self) -> Dict[str, object]:
+        return {"source": self.source, "title": self.title, "score": round(self.score, 3), "snippet": self.snippet}
+
+
+@dataclass
+class SearchIndex:
+    """역색인 + 원본별 버전 관리"""
+
+    documents: Dict[str, Document] = field(default_factory=dict)
+    sources: Dict[str, Tuple[str, List[str]]] = field(default_factory=dict)
+    postings: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    total_length: int = 0
+
+    def update_source(self, source: str, version: str, load: Callable[[], List[Tuple[str, str]]]) -> bool:
+        """원본 버전이 바뀐 경우에만 (제목, 본문) 섹션을 다시 읽어 토큰화"""
+        current = self.sources.get(source)
+        if current is not None and current[0] == version:
+            METRICS.cache_hit("search_index")
+            return False
+        METRICS.cache_miss("search_index")
+        self.remove_source(source)
+        doc_ids: List[str] = []
+        for position, (title, text) in enumerate(load()):
+            doc_id = f"{source}#{position}"
+            terms: Dict[str, int] = {}
+            for token in tokenize(title + "\n" + text):
+                terms[token] = terms.get(token, 0) + 1
+            self._add(Document(doc_id, source, title, text, sum(terms.values()), terms))
+            doc_ids.append(doc_id)
+        self.sources[source] = (version, doc_ids)
+        return True
+
+    def remove_source(self, source: str) -> None:
+        entry = self.sources.pop(source, None)
+        if entry is None:
+            return
+        for doc_id in entry[1]:
+            document = self.documents.pop(doc_id)
+            self.total_length -= document.length
+            for term in document.terms:
+                posting = self.postings[term]
+                del posting[doc_id]
+                if not posting:
+                    del self.postings[term]
+
+    def _add(self, document: Document) -> None:
+        self.documents[document.doc_id] = document
+        self.total_length += document.length
+        for term, frequency in document.terms.items():
+            self.postings.setdefault(term, {})[document.doc_id] = frequency
+
+    def search(self, query: str, limit: int = 10, scope: Optional[str] = None) -> List[SearchHit]:
+        """BM25 점수 상위 문서 (scope 는 원본 접두사 필터, 예: "docs/", "esg://", "swagger://")"""
+        count = len(self.documents)
+        if not count:
+            return []
+        average_length = self.total_length / count
+        scores: Dict[str, float] = {}
+        query_terms = list(dict.fromkeys(tokenize(query)))
+        for term in query_terms:
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            idf = log(1 + (count - len(posting) + 0.5) / (len(posting) + 0.5))
+            for doc_id, frequency in posting.items():
+                length = self.documents[doc_id].length
+                norm = frequency + BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (BM25_K1 + 1) / norm
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        hits: List[SearchHit] = []
+        for doc_id, score in ranked:
+            document = self.documents[doc_id]
+            if scope and not document.source.startswith(scope):
+                continue
+            hits.append(SearchHit(document.source, document.title, score, _snippet(document.text, query_terms)))
+            if len(hits) >= limit:
+                break
+        return hits
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"format": INDEX_FORMAT, "documents": self.documents, "sources": self.sources}
+        atomic_pickle(path, payload)
+
+    @classmethod
+    def load(cls, path: Path) -> "SearchIndex":
+        """저장된 인덱스 로드 (없거나 포맷이 다르면 빈 인덱스) - 역색인은 문서별 빈도로 재구성"""
+        index = cls()
+        try:
+            with open(path, "rb") as handle:
+                payload = pickle.load(handle)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return index
+        if not isinstance(payload, dict) or payload.get("format") != INDEX_FORMAT:
+            return index
+        index.sources = payload["sources"]
+        for document in payload["documents"].values():
+            index._add(document)
+        return index
+
+
+def _snippet(text: str, query_terms: List[str], width: int = 160) -> str:
+    """질의 토큰이 가장 많이 등장하는 줄을 발췌"""
+    best_line, best_score = "", 0
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        line_terms = set(tokenize(stripped))
+        score = sum(1 for term in query_terms if term in line_terms)
+        if score > best_score:
+            best_line, best_score = stripped, score
+    if not best_line:
+        best_line = text.strip().splitlines()[0] if text.strip() else ""
+    return best_line[:width]
+
+
+# ===== 원본 수집 =====
+
+def iter_markdown_files(root: Path = PROJECT_ROOT) -> Iterable[Path]:
+    """docs/, packages/ 아래 마크다운 파일 (node_modules 등 제외)"""
+    for top in MARKDOWN_ROOTS:
+        for dirpath, dirnames, filenames in os.walk(root / top):
+            dirnames[:] = sorted(name for name in dirnames if name not in SKIP_DIRS)
+            for filename in sorted(filenames):
+                if filename.endswith(".md"):
+                    yield Path(dirpath) / filename
+
+
+def swagger_sections(index: SpecIndex) -> List[Tuple[str, str]]:
+    """Swagger 태그 설명, 오퍼레이션 요약, 스키마/필드 설명을 검색 섹션으로 변환"""
+    sections: List[Tuple[str, str]] = []
+    title = index.title
+    for tag, description in index.tag_descriptions.items():
+        sections.append((f"{title} · {tag}", description))
+    paths = index.spec["paths"]
+    for operation in index.operations:
+        raw = paths[operation.path][operation.method]
+        body = "\n".join(
+            part
+            for part in (
+                f"{operation.method.upper()} {operation.path}",
+                operation.summary,
+                raw.get("description", ""),
+                operation.operation_id,
+                " ".join(operation.tags),
+                " ".join(operation.request_schemas + operation.response_schemas),
+            )
+            if part
+        )
+        sections.append((f"{title} · {operation.method.upper()} {operation.path}", body))
+    for name, schema in index.schema_models.items():
+        lines = [name, schema.description]
+        for prop in schema.fields:
+            lines.append(f"{prop.name} {prop.description}".strip())
+        sections.append((f"{title} · {name}", "\n".join(line for line in lines if line)))
+    return sections
+
+
+def sync_spec_sources(index: SearchIndex, specs: Dict[str, SpecIndex]) -> int:
+    """Swagger 원본만 스펙 내용 해시 기준으로 동기화 (검색마다 호출해도 dict 비교 수준)"""
+    changed = 0
+    for domain, spec_index in specs.items():
+        changed += index.update_source(
+            SWAGGER_SOURCE_PREFIX + domain,
+            spec_index.content_hash,
+            lambda spec_index=spec_index: swagger_sections(spec_index),
+        )
+    stale = [
+        source
+        for source in index.sources
+        if source.startswith(SWAGGER_SOURCE_PREFIX) and source[len(SWAGGER_SOURCE_PREFIX):] not in specs
+    ]
+    for source in stale:
+        index.remove_source(source)
+    return changed + len(stale)
+
+
+def sync_resource_sources(index: SearchIndex, resources: Dict[str, str]) -> int:
+    """MCP 리소스 원본(URI → 마크다운)만 본문 해시 기준으로 동기화"""
+    changed = 0
+    for uri, text in resources.items():
+        version = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        changed += index.update_source(uri, version, lambda text=text, uri=uri: split_sections(text, uri))
+    stale = [
+        source
+        for source in index.sources
+        if "://" in source and not source.startswith(SWAGGER_SOURCE_PREFIX) and source not in resources
+    ]
+    for source in stale:
+        index.remove_source(source)
+    return changed + len(stale)
+
+
+def refresh_index(
+    index: SearchIndex,
+    resources: Dict[str, str],
+    specs: Dict[str, SpecIndex],
+    root: Path = PROJECT_ROOT,
+) -> int:
+    """모든 원본을 버전과 비교해 바뀐 것만 재색인 (재색인한 원본 수 반환)"""
+    changed = sync_resource_sources(index, resources)
+    seen = set(resources)
+
+    for path in iter_markdown_files(root):
+        source = path.relative_to(root).as_posix()
+        seen.add(source)
+        stat = path.stat()
+        version = f"{stat.st_mtime_ns}:{stat.st_size}"
+        changed += index.update_source(
+            source,
+            version,
+            lambda path=path, source=source: split_sections(path.read_text(encoding="utf-8", errors="replace"), source),
+        )
+
+    changed += sync_spec_sources(index, specs)
+    seen.update(source for source in index.sources if source.startswith(SWAGGER_SOURCE_PREFIX))
+
+    for source in [source for source in index.sources if source not in seen]:
+        index.remove_source(source)
+        changed += 1
+    return changed
+
+
+def open_index(
+    resources: Dict[str, str],
+    specs: Dict[str, SpecIndex],
+    path: Path = DEFAULT_INDEX_PATH,
+    root: Path = PROJECT_ROOT,
+) -> Tuple[SearchIndex, Dict[str, float]]:
+    """저장된 인덱스를 열고 증분 갱신 후 (변경 시) 저장 - (인덱스, 통계) 반환"""
+    started = time.perf_counter()
+    index = SearchIndex.load(path)
+    loaded = time.perf_counter()
+    changed = refresh_index(index, resources, specs, root)
+    if changed:
+        index.save(path)
+    finished = time.perf_counter()
+    stats = {
+        "sources": len(index.sources),
+        "documents": len(index.documents),
+        "terms": len(index.postings),
+        "reindexedSources": changed,
+        "loadMs": round((loaded - started) * 1000, 1),
+        "refreshMs": round((finished - loaded) * 1000, 1),
+    }
+    return index, stats
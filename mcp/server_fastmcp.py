@@ -5,12 +5,52 @@
 - Primes, ESG, AIPS, SCM 모든 프로젝트 정보 제공
 - 개발 패턴, 템플릿, Swagger 정보
 - 실제 Swagger URL 기반 API 정보 제공
+- 프로젝트 정보 본문은 content/ 디렉토리 (server.py 와 공용, 편집 시 재시작 없이 반영)
 """
 
 import os
+import argparse
+import asyncio
 import logging
-from typing import Dict
+import sys
+from pathlib import Path
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from startup_profile import StartupProfiler
+
+# 시작 단계별 시간 기록 (--profile-startup)
+profiler = StartupProfiler()
+
+import anyio
 from mcp.server.fastmcp import FastMCP
+from mcp.server.transport_security import TransportSecuritySettings
+
+profiler.mark("import mcp / pydantic / FastMCP")
+
+# 스펙 파싱·검색·소스 스캔·HTTP 수집 등 무거운 하위 시스템은 첫 사용 시 import/생성
+from content_formats import split_format
+from content_store import SWAGGER_URLS, get_content_store, watch_content
+from chunked_reads import DEFAULT_CHUNK_SIZE, chunk_meta, slice_text
+from resource_catalog import (
+    JSON_MIME_TYPE,
+    PATH_TEMPLATE,
+    SCHEMA_TEMPLATE,
+    SPEC_TEMPLATE,
+    SWAGGER_SCHEME,
+    get_spec_resources,
+)
+from server_metrics import METRICS, instrument_server
+from single_flight import SingleFlight, coalesce
+from spec_store import get_spec_store
+
+if TYPE_CHECKING:
+    from refresh_scheduler import RefreshScheduler
+    from search_index import SearchIndex
+    from swagger_fetcher import SwaggerFetcher
+    from sync_analyzer import CodeScanner
+
+profiler.mark("import local modules")
 
 # 로깅 설정
 logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
@@ -18,316 +58,563 @@ logger = logging.getLogger("unified-project-info-mcp")
 
 # MCP 서버 인스턴스
 mcp = FastMCP("unified-project-info-mcp")
-
-# 실제 Swagger URL들 (환경변수로 오버라이드 가능)
-SWAGGER_URLS: Dict[str, str] = {
-    "esg": os.getenv("SWAGGER_ESG", "https://api.esg.primes-cloud.co.kr/api-docs/esg"),
-    "primes_production": os.getenv("SWAGGER_PRIMES_PROD", "https://api.orcamaas.com/api-docs/production"),
-    "primes_sales": os.getenv("SWAGGER_PRIMES_SALES", "https://api.orcamaas.com/api-docs/sales"),
-    "primes_purchase": os.getenv("SWAGGER_PRIMES_PURCHASE", "https://api.orcamaas.com/api-docs/purchase"),
-    "primes_inventory": os.getenv("SWAGGER_PRIMES_INVENTORY", "https://api.orcamaas.com/api-docs/inventory"),
-    "primes_machine": os.getenv("SWAGGER_PRIMES_MACHINE", "https://api.orcamaas.com/api-docs/machine"),
-    "primes_mold": os.getenv("SWAGGER_PRIMES_MOLD", "https://api.orcamaas.com/api-docs/mold"),
-    "primes_ini": os.getenv("SWAGGER_PRIMES_INI", "https://api.orcamaas.com/api-docs/init"),
-}
+# 모든 툴/리소스 요청 핸들러 계측 (호출 수, 지연, 응답 크기)
+instrument_server(mcp._mcp_server)
+profiler.mark("create FastMCP")
+
+# 지연 생성되는 하위 시스템
+_swagger_fetcher: Optional["SwaggerFetcher"] = None
+_code_scanner: Optional["CodeScanner"] = None
+_search_index: Optional["SearchIndex"] = None
+_search_content_version = -1
+# 같은 앱 소스 스캔이 동시에 들어오면 한 번만 실행 (세션 간 공유)
+_scan_flight = SingleFlight("singleflight:code_scan")
+
+def get_swagger_fetcher() -> "SwaggerFetcher":
+    """Swagger 스펙 수집기 (커넥션 풀 + 디스크 캐시, 첫 사용 시 생성)"""
+    global _swagger_fetcher
+    if _swagger_fetcher is None:
+        from swagger_fetcher import SwaggerFetcher
+
+        _swagger_fetcher = SwaggerFetcher()
+    return _swagger_fetcher
+
+def get_refresh_scheduler() -> "RefreshScheduler":
+    """스펙 갱신 스케줄러 (백그라운드 루프와 refresh_swagger_specs 가 같은 수집기/상태 사용)"""
+    from refresh_scheduler import get_refresh_scheduler as get_scheduler
+
+    return get_scheduler(get_swagger_fetcher())
+
+def get_code_scanner() -> "CodeScanner":
+    """앱 소스 스캐너 (파일별 내용 해시 캐시, 첫 사용 시 생성)"""
+    global _code_scanner
+    if _code_scanner is None:
+        from sync_analyzer import CodeScanner
+
+        _code_scanner = CodeScanner()
+    return _code_scanner
+
+def get_search_index() -> "SearchIndex":
+    """검색 인덱스 반환 (최초 1회 저장본 로드 + 변경분 재색인, 이후에는 스펙/콘텐츠 변경분만 반영)"""
+    from search_index import DEFAULT_INDEX_PATH, open_index, sync_resource_sources, sync_spec_sources
+
+    global _search_index, _search_content_version
+    store = get_spec_store()
+    specs = {domain: store.get(domain) for domain in store.domains()}
+    content = get_content_store()
+    if _search_index is None:
+        # content/ 리소스 마크다운을 함께 색인
+        resources = {entry.uri: entry.text for entry in content.entries()}
+        _search_index, stats = open_index(resources, specs)
+        _search_content_version = content.version
+        logger.info("search index ready: %s", stats)
+        return _search_index
+
+    changed = sync_spec_sources(_search_index, specs)
+    if content.version != _search_content_version:
+        changed += sync_resource_sources(_search_index, {entry.uri: entry.text for entry in content.entries()})
+        _search_content_version = content.version
+    if changed:
+        _search_index.save(DEFAULT_INDEX_PATH)
+    return _search_index
 
 # ===== 공통 유틸 =====
 @mcp.tool()
 def ping() -> str:
     """서버 헬스 체크 문자열 반환"""
-    logger.info("ping called")
     return "pong"
 
+@mcp.tool()
+def get_server_metrics() -> Dict[str, Any]:
+    """핸들러별 호출 수·지연(p50/p99 추정)·응답 크기와 캐시 적중률 (프로세스 단위)"""
+    return METRICS.snapshot()
+
 # ===== Primes 프로젝트 툴 =====
 
 @mcp.tool()
-def get_primes_overview() -> str:
-    """Primes 프로젝트 개요(마크다운)"""
-    return """
-# 🎯 Primes 프로젝트 개요
-
-## 📋 **프로젝트 설명**
-Primes는 현대적인 기업용 ERP 시스템으로, React 18 + TypeScript + Radix UI를 기반으로 구축된 고품질 웹 애플리케이션입니다.
-
-## 🏗️ **기술 스택**
-- **Frontend**: React 18.3.1 + TypeScript 5.7.2
-- **UI Framework**: Radix UI + Tailwind CSS
-- **State Management**: React Query (@tanstack/react-query)
-- **Build Tool**: Vite 6.2.0
-- **Package Manager**: pnpm
-
-## 📊 **현재 상태**
-- **완성도**: 🟢 98%
-- **페이지 수**: 260개
-- **Hook 수**: 422개
-- **솔루션 도메인**: 7개 (ini, sales, purchase, production, machine, mold, quality)
-
-## 🎯 **주요 특징**
-- **Enhanced Template System**: SinglePage, MasterDetailPage, TabNavigation
-- **Atomic Hooks**: 단일 책임 원칙의 훅 패턴
-- **MCP 통합**: AI 기반 코드 생성
-- **Swagger 동기화**: API 스키마 자동 동기화
-- **GS 인증 준비**: 보안성, 신뢰성, 감사 추적 강화
-"""
+def get_primes_overview(format: str = "markdown") -> str:
+    """Primes 프로젝트 개요 (format: markdown | json)"""
+    return get_content_store().text("primes://overview", format)
 
 @mcp.tool()
-def get_primes_patterns() -> str:
-    """Primes 개발 패턴(마크다운)"""
-    return """
-# 🏗️ Primes 개발 패턴
-
-## 🏗️ **아키텍처 패턴**
-- **레이어 구조**: Presentation → Business Logic → Service → API
-- **도메인 분리**: 7개 솔루션 (ini, sales, purchase, production, machine, mold, quality)
-- **모듈화**: 각 도메인별 독립적 구조
-
-## 🎨 **UI 컴포넌트 패턴**
-- **Radix UI + Tailwind CSS**: 접근성과 일관성
-- **Enhanced Template System**:
-  - SinglePage: Modal-based CRUD with DatatableComponent
-  - MasterDetailPage: Navigation-based CRUD with relationships
-  - TabNavigation: Tab-based navigation structure
-  - CustomSelect: Field API integrated select components
-
-## 🔧 **Hook 패턴**
-- **Atomic Hooks**: 단일 책임 원칙
-  - useCreateEntity() - 생성 전용
-  - useUpdateEntity() - 수정 전용
-  - useDeleteEntity() - 삭제 전용
-  - useEntityListQuery() - 목록 조회 전용
-  - useEntityByIdQuery() - 단일 조회 전용
-
-## 📝 **코드 생성 패턴**
-- **Swagger 기반**: API 스키마 자동 동기화
-- **Template 기반**: 일관된 코드 구조
-- **ValidationSchema**: Zod-based validation with business rules
-"""
+def get_primes_patterns(format: str = "markdown") -> str:
+    """Primes 개발 패턴 (format: markdown | json)"""
+    return get_content_store().text("primes://patterns", format)
 
 @mcp.tool()
-def get_primes_swagger() -> str:
-    """Primes Swagger API 정보(마크다운)"""
-    return f"""
-# 🔍 Primes Swagger API 정보
+def get_primes_swagger(format: str = "markdown") -> str:
+    """Primes Swagger API 정보 (format: markdown | json)"""
+    return get_content_store().text("primes://swagger", format)
 
-## 📊 **실제 Swagger URL들**
+# ===== ESG 프로젝트 툴 =====
 
-### **🏭 Production (생산 관리)**
-- **URL**: {SWAGGER_URLS['primes_production']}
-- **용도**: 생산 계획, 작업 지시, 생산 실적 관리
-- **주요 API**: Plan, WorkOrder, Performance, Material
+@mcp.tool()
+def get_esg_overview(format: str = "markdown") -> str:
+    """ESG 프로젝트 개요 (format: markdown | json)"""
+    return get_content_store().text("esg://overview", format)
 
-### **💰 Sales (판매 관리)**
-- **URL**: {SWAGGER_URLS['primes_sales']}
-- **용도**: 견적, 주문, 출하, 매출 관리
-- **주요 API**: Quote, Order, Shipment, Revenue, Invoice
+@mcp.tool()
+def get_esg_swagger(format: str = "markdown") -> str:
+    """ESG Swagger API 정보 (format: markdown | json)"""
+    return get_content_store().text("esg://swagger", format)
 
-### **🛒 Purchase (구매 관리)**
-- **URL**: {SWAGGER_URLS['primes_purchase']}
-- **용도**: 견적 요청, 구매 주문, 입고, 지급 관리
-- **주요 API**: RFQ, PO, Receipt, Payment
+# ===== AIPS 프로젝트 툴 =====
 
-### **📦 Inventory (재고 관리)**
-- **URL**: {SWAGGER_URLS['primes_inventory']}
-- **용도**: 재고 수준, 입출고, 재고 이동 관리
-- **주요 API**: Stock, Movement, Transfer, Adjustment
+@mcp.tool()
+def get_aips_overview(format: str = "markdown") -> str:
+    """AIPS 프로젝트 개요 (format: markdown | json)"""
+    return get_content_store().text("aips://overview", format)
 
-### **⚙️ Machine (설비 관리)**
-- **URL**: {SWAGGER_URLS['primes_machine']}
-- **용도**: 설비 정보, 점검, 수리, 이력 관리
-- **주요 API**: Machine, Inspection, Repair, History
+# ===== SCM 프로젝트 툴 =====
 
-### **🎯 Mold (금형 관리)**
-- **URL**: {SWAGGER_URLS['primes_mold']}
-- **용도**: 금형 정보, 사용 이력, 보관, 수명 관리
-- **주요 API**: Mold, Usage, Storage, Lifecycle
+@mcp.tool()
+def get_scm_overview(format: str = "markdown") -> str:
+    """SCM 프로젝트 개요 (format: markdown | json)"""
+    return get_content_store().text("scm://overview", format)
 
-### **🏢 INI (기본 정보)**
-- **URL**: {SWAGGER_URLS['primes_ini']}
-- **용도**: 거래처, 품목, 코드, 사용자 관리
-- **주요 API**: Vendor, Customer, Item, Category, Code, User
-"""
+# ===== 공통 정보 툴 =====
 
-# ===== ESG 프로젝트 툴 =====
+@mcp.tool()
+def get_project_comparison(format: str = "markdown") -> str:
+    """프로젝트 비교 정보 (format: markdown | json)"""
+    return get_content_store().text("common://comparison", format)
 
 @mcp.tool()
-def get_esg_overview() -> str:
-    """ESG 프로젝트 개요(마크다운)"""
-    return """
-# 🌱 ESG 프로젝트 개요
+def get_swagger_urls() -> Dict[str, str]:
+    """모든 Swagger URL 딕셔너리 반환"""
+    return SWAGGER_URLS
 
-## 📋 **프로젝트 설명**
-ESG는 지속가능성 관리 시스템으로, 환경(Environmental), 사회(Social), 지배구조(Governance) 데이터를 통합 관리하는 대시보드 중심의 웹 애플리케이션입니다.
+@mcp.tool()
+def get_workspace_inventory(app: Optional[str] = None) -> Dict[str, Any]:
+    """앱별 페이지/Hook/서비스/템플릿/다국어 파일 수 (apps/*/src 스캔, 디렉토리 mtime 캐시로 바뀐 디렉토리만 다시 나열)"""
+    from workspace_inventory import get_workspace_inventory as inventory
 
-## 🏗️ **기술 스택**
-- **Frontend**: React 18 + TypeScript
-- **UI Framework**: Falcon UI + Bootstrap + Material-UI
-- **Charts**: Recharts (ESG 데이터 시각화 최적화)
-- **State Management**: React Query
-- **Build Tool**: Vite
+    result = inventory().scan()
+    if app is None:
+        return result
+    if app not in result["apps"]:
+        raise ValueError(f"앱을 찾을 수 없습니다: {app} (가능: {', '.join(result['apps'])})")
+    return {"app": app, **result["apps"][app], "stats": result["stats"]}
 
-## 📊 **현재 상태**
-- **완성도**: 🟡 85%
-- **주요 기능**: 대시보드, 데이터 수집, 리포트 생성
-- **특화 영역**: ESG 프레임워크 준수 (GRI, SASB, TCFD, CDP)
+# ===== 워크스페이스 패키지 그래프 툴 =====
 
-## 🎯 **주요 특징**
-- **Dashboard Templates**: ESG 메트릭 대시보드 with KPI cards
-- **Chart Widgets**: 시계열, 막대, 영역, 파이 차트
-- **KPI Cards**: 탄소 배출량, 에너지 사용량, 물 사용량, 폐기물
-- **Form Wizards**: 다단계 데이터 입력 with 검증
-"""
+@mcp.tool()
+def find_package_dependents(package: str, transitive: bool = False) -> Dict[str, Any]:
+    """패키지를 쓰는 앱/패키지 (역방향 의존, 예: "@repo/falcon-ui" → 어떤 앱이 쓰는지, transitive=True 면 간접 의존 포함)"""
+    from package_graph import get_package_graph
+
+    graph = get_package_graph()
+    found = graph.get(package)
+    dependents = graph.dependents(found.name, transitive)
+    return {
+        **found.to_dict(),
+        "apps": [entry["name"] for entry in dependents if entry["kind"] == "app"],
+        "dependents": dependents,
+    }
 
 @mcp.tool()
-def get_esg_swagger() -> str:
-    """ESG Swagger API 정보(마크다운)"""
-    return f"""
-# 🔍 ESG Swagger API 정보
+def get_package_dependencies(package: str, transitive: bool = False) -> Dict[str, Any]:
+    """앱/패키지가 의존하는 워크스페이스 패키지 (transitive=True 면 간접 의존 포함, depth = 거리)"""
+    from package_graph import get_package_graph
 
-## 📊 **실제 Swagger URL**
+    graph = get_package_graph()
+    found = graph.get(package)
+    return {**found.to_dict(), "dependencies": graph.dependencies(found.name, transitive)}
 
-### **🌱 ESG API**
-- **URL**: {SWAGGER_URLS['esg']}
-- **용도**: ESG 데이터 수집, 분석, 리포트 생성
-- **주요 API**: CarbonEmission, EnergyUsage, WaterUsage, WasteManagement
+@mcp.tool()
+def get_build_order(targets: Optional[List[str]] = None) -> Dict[str, Any]:
+    """워크스페이스 위상 정렬 빌드 단계 (같은 단계는 병렬 빌드 가능, targets 를 주면 그 패키지와 의존 대상만)"""
+    from package_graph import get_package_graph
 
-## 📋 **주요 ESG API 모듈**
+    stages = get_package_graph().build_order(targets)
+    return {"stages": stages, "packages": sum(len(stage) for stage in stages)}
 
-### **🌡️ 배출량 관리 (Emission Management)**
-- **EmissionFactor**: 배출계수 관리 (category, gasType, coefficientValue, unit)
-- **EmissionFactorHead**: 배출계수 헤더 (title, applyYm, publishedBy)
-- **DataType**: GHG Scope별 배출원 분류 (Scope 1/2/3, emissionSource, category, uom)
-- **EmissionDashboard**: 월별/스코프별 배출량 대시보드
+# ===== 검색 툴 =====
 
-### **📊 데이터 수집 (Data Collection)**
-- **Record**: 실제 사용량/배출량 데이터 (accountMonth, quantity, totalCost)
-- **RecordMatrix**: 월별 매트릭스 형태 데이터 입력 (12개월 데이터)
-- **Account**: 계정 관리 (name, supplier, accountStyle, meter, company, charger)
-- **Meter**: 계량기 관리 (name, serialNo, servicePoint, component)
+@mcp.tool()
+def search(query: str, limit: int = 10, scope: Optional[str] = None) -> List[Dict[str, Any]]:
+    """리소스·docs/·packages/ 마크다운과 Swagger 요약을 BM25 로 검색 (scope: "docs/", "esg://", "swagger://" 등 접두사)"""
+    hits = get_search_index().search(query, limit=limit, scope=scope)
+    return [hit.to_dict() for hit in hits]
 
-### **🏢 조직 관리 (Organization Management)**
-- **Company**: 회사 정보 (name, license, companyType, businessType, address)
-- **Group**: 그룹 구조 (groupName, type, parentId, reportPercent, isOpenToPublic)
-- **Location**: 위치 정보 (country, state, city, emissionFactorHead)
-- **Charger**: 담당자 관리 (name, department, grade, phone, address)
-"""
+@mcp.tool()
+def find_symbol(
+    query: str,
+    kind: Optional[str] = None,
+    scope: Optional[str] = None,
+    limit: int = 20,
+) -> Dict[str, Any]:
+    """apps/·packages/ 의 TS export 심볼(Hook/컴포넌트/타입/서비스 등) 이름 검색 → 파일과 줄 번호
+    (부분·오타 일치 허용, kind: hook|component|type|service|class|function|constant, scope: "apps/primes" 등 경로 접두사)"""
+    import time
+
+    from symbol_index import SYMBOL_KINDS, get_symbol_index
+
+    if kind is not None and kind not in SYMBOL_KINDS:
+        raise ValueError(f"kind 는 {', '.join(SYMBOL_KINDS)} 중 하나여야 합니다: {kind}")
+    index = get_symbol_index()
+    started = time.perf_counter()
+    matches = index.find(query, limit=limit, kind=kind, scope=scope)
+    return {
+        "query": query,
+        "matches": matches,
+        "symbols": len(index),
+        "elapsedMs": round((time.perf_counter() - started) * 1000, 3),
+    }
+
+# ===== Swagger 스펙 툴 (로컬 스펙 인덱스) =====
 
-# ===== AIPS 프로젝트 툴 =====
+@mcp.tool()
+def list_spec_domains() -> List[Dict[str, Any]]:
+    """로드된 OpenAPI 스펙 도메인 목록과 통계(경로/오퍼레이션/태그/스키마 수)"""
+    store = get_spec_store()
+    return [{"domain": domain, **store.get(domain).summary()} for domain in store.domains()]
 
 @mcp.tool()
-def get_aips_overview() -> str:
-    """AIPS 프로젝트 개요(마크다운)"""
-    return """
-# 🤖 AIPS 프로젝트 개요
-
-## 📋 **프로젝트 설명**
-AIPS(AI-Powered Information Processing System)는 인공지능을 활용하여 정보 처리 및 생산성 향상을 목표로 하는 현대적인 웹 애플리케이션입니다.
-
-## 🏗️ **기술 스택**
-- **Frontend**: React 18.3.1 + TypeScript 5.7.2
-- **UI Framework**: Radix UI + Tailwind CSS
-- **AI Integration**: AI 모듈 및 머신러닝 알고리즘
-- **Charts**: ECharts (데이터 시각화 최적화)
-- **Editor**: Flora Editor (리치 텍스트 편집)
-- **Build Tool**: Vite 6.2.0
-- **Package Manager**: pnpm
-
-## 📊 **현재 상태**
-- **완성도**: 🟡 70%
-- **주요 기능**: AI 분석, 데이터 처리, 생산성 도구
-- **특화 영역**: AI 기반 정보 처리 및 분석
-
-## 🎯 **주요 특징**
-- **AI Integration**: 머신러닝 모델 통합
-- **Information Processing**: 대용량 데이터 처리
-- **Productivity Tools**: 작업 자동화 및 최적화
-- **Advanced Analytics**: 예측 분석 및 인사이트
-"""
+def list_spec_tags(domain: str = "primes_mold", projection: str = "full") -> Any:
+    """도메인 스펙의 태그별 설명과 오퍼레이션 수 (projection="names" 면 태그 이름 목록만)"""
+    from spec_projections import NAMES, check_projection
+
+    index = get_spec_store().get(domain)
+    if check_projection(projection) == NAMES:
+        return sorted(index.by_tag)
+    return {
+        tag: {"description": index.tag_descriptions.get(tag, ""), "operations": len(positions)}
+        for tag, positions in sorted(index.by_tag.items())
+    }
 
-# ===== SCM 프로젝트 툴 =====
+@mcp.tool()
+def find_spec_operations(
+    domain: str = "primes_mold",
+    tag: Optional[str] = None,
+    method: Optional[str] = None,
+    path: Optional[str] = None,
+    operation_id: Optional[str] = None,
+    projection: str = "full",
+) -> List[Any]:
+    """태그/HTTP 메서드/경로/operationId 조건(AND)으로 오퍼레이션 조회 (예: tag="MoldRepair")
+    (projection: names → "GET /path" 만, names+types → 파라미터 타입/요청·응답 스키마, full → 전체)"""
+    from spec_projections import check_projection, get_projections
+
+    index = get_spec_store().get(domain)
+    operations = index.find_operations(tag=tag, method=method, path=path, operation_id=operation_id)
+    return get_projections(index).operations(operations, check_projection(projection))
 
 @mcp.tool()
-def get_scm_overview() -> str:
-    """SCM 프로젝트 개요(마크다운)"""
-    return """
-# 📦 SCM 프로젝트 개요
-
-## 📋 **프로젝트 설명**
-SCM은 공급망 관리 시스템으로, 공급업체부터 고객까지의 전체 공급망을 효율적으로 관리하고 최적화하는 웹 애플리케이션입니다.
-
-## 🏗️ **기술 스택**
-- **Frontend**: React 18.3.1 + TypeScript 5.7.2
-- **UI Framework**: Radix UI + Tailwind CSS
-- **State Management**: React Query + React Table
-- **Charts**: ECharts (공급망 시각화)
-- **Build Tool**: Vite 6.2.0
-- **Package Manager**: pnpm
-
-## 📊 **현재 상태**
-- **완성도**: 🟠 40%
-- **개발 단계**: 초기 개발 단계
-- **주요 기능**: 공급업체 관리, 재고 관리, 물류 관리
-- **특화 영역**: 공급망 최적화 및 리스크 관리
-
-## 🎯 **주요 특징**
-- **공급업체 관리**: 공급업체 정보 및 성과 관리
-- **재고 관리**: 실시간 재고 추적 및 최적화
-- **물류 관리**: 운송, 배송, 창고 관리
-- **공급망 시각화**: 네트워크 맵 및 분석 도구
-"""
+def find_operations_by_schema(
+    schema: str,
+    domain: str = "primes_mold",
+    direction: str = "response",
+    projection: str = "full",
+) -> List[Any]:
+    """스키마를 응답(response)/요청(request)/양쪽(any)으로 참조하는 오퍼레이션 조회 (예: CommonResponseMoldMasterDto)
+    (projection: names / names+types / full)"""
+    from spec_projections import check_projection, get_projections
+
+    index = get_spec_store().get(domain)
+    operations = index.operations_using_schema(schema, direction)
+    return get_projections(index).operations(operations, check_projection(projection))
 
-# ===== 공통 정보 툴 =====
+@mcp.tool()
+def get_schema(domain: str, name: str, depth: Optional[int] = None, projection: str = "full") -> Dict[str, Any]:
+    """컴포넌트 스키마를 $ref 펼친 형태로 반환 (depth: 펼칠 중첩 단계 수, 생략 시 전체)
+    (projection: names → 필드 이름만, names+types → {필드: 타입} + required, full → $ref 펼친 전체)"""
+    from schema_resolver import get_resolver
+    from spec_projections import FULL, check_projection, get_projections
+
+    index = get_spec_store().get(domain)
+    resolver = get_resolver(index)
+    if name not in resolver:
+        raise ValueError(f"스키마를 찾을 수 없습니다: {domain}/{name}")
+    if check_projection(projection) != FULL:
+        return get_projections(index).schema(name, projection)
+    return resolver.get(name, depth)
 
 @mcp.tool()
-def get_project_comparison() -> str:
-    """프로젝트 비교 정보(마크다운)"""
-    return """
-# 🔄 프로젝트별 특징 비교
-
-## 🎯 **Primes (ERP 시스템)**
-- **완성도**: 🟢 98%
-- **UI**: Radix UI + Tailwind CSS
-- **특징**: 7개 솔루션 도메인, 260개 페이지, 422개 Hook
-- **용도**: 기업 전반의 업무 프로세스 관리
-- **Swagger**: 7개 도메인별 API (orcamaas.com)
-
-## 🌱 **ESG (지속가능성 관리)**
-- **완성도**: 🟡 85%
-- **UI**: Falcon UI + Bootstrap + Material-UI
-- **특징**: 대시보드 중심, 차트 위젯, KPI 카드
-- **용도**: ESG 데이터 수집, 분석, 리포트
-- **Swagger**: ESG 통합 API (esg.primes-cloud.co.kr)
-
-## 🤖 **AIPS (AI 생산성 시스템)**
-- **완성도**: 🟡 70%
-- **UI**: Radix UI + Tailwind CSS
-- **특징**: AI 통합, 정보 처리, 생산성 도구
-- **용도**: AI 기반 분석 및 생산성 향상
-- **Swagger**: AI 모듈별 API (개발 중)
-
-## 📦 **SCM (공급망 관리)**
-- **완성도**: 🟠 40%
-- **UI**: Radix UI + Tailwind CSS
-- **특징**: 공급업체 관리, 재고 관리, 물류 관리
-- **용도**: 공급망 최적화 및 관리
-- **Swagger**: 공급망 모듈별 API (개발 중)
-
-## 🔗 **공통점**
-- **Frontend**: React 18 + TypeScript
-- **State Management**: React Query
-- **Build Tool**: Vite
-- **Package Manager**: pnpm
-- **Monorepo**: Turborepo 기반 구조
-"""
+def list_spec_versions(domain: str = "primes_mold") -> List[Dict[str, Any]]:
+    """도메인에 로드된 스펙 버전 이력 (오래된 순, 마지막이 current) - diff_swagger 비교 대상"""
+    store = get_spec_store()
+    versions = []
+    for position, version in enumerate(store.versions(domain)):
+        index = store.get_version(domain, str(position))
+        versions.append({"position": position, **version.to_dict(), "title": index.title, "version": index.version})
+    return versions
 
 @mcp.tool()
-def get_swagger_urls() -> Dict[str, str]:
-    """모든 Swagger URL 딕셔너리 반환"""
-    return SWAGGER_URLS
+def diff_swagger(
+    domain: str = "primes_mold",
+    from_version: str = "previous",
+    to_version: str = "current",
+    limit: int = 200,
+) -> Dict[str, Any]:
+    """두 스펙 버전의 추가/삭제/변경된 경로·오퍼레이션·파라미터·스키마 필드 비교
+    (버전: current / previous / list_spec_versions 의 position / contentHash 앞 6자 이상)"""
+    from spec_diff import diff_specs
+
+    store = get_spec_store()
+    before = store.get_version(domain, from_version)
+    after = store.get_version(domain, to_version)
+    return {
+        "domain": domain,
+        "from": {"contentHash": before.content_hash, "title": before.title, "version": before.version},
+        "to": {"contentHash": after.content_hash, "title": after.title, "version": after.version},
+        **diff_specs(before, after, limit),
+    }
+
+@mcp.tool()
+@coalesce()
+async def analyze_swagger_sync(
+    domain: str = "primes_mold",
+    app: str = "primes",
+    entity: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Swagger 동기화 상태 분석 - 태그(엔티티)별 누락 타입/필드 불일치/누락 Hook/서비스 미사용 엔드포인트"""
+    from sync_analyzer import analyze_sync
+
+    index = get_spec_store().get(domain)
+    facts, scan_stats = await _scan_flight.do(app, lambda: anyio.to_thread.run_sync(get_code_scanner().scan, app))
+    report = analyze_sync(index, facts, entity)
+    report["scan"] = scan_stats
+    return report
+
+@mcp.tool()
+@coalesce()
+async def generate_atomic_hooks(
+    domain: str = "primes_mold",
+    tags: Optional[List[str]] = None,
+    output_dir: Optional[str] = None,
+) -> Dict[str, Any]:
+    """도메인 스펙의 태그별 Atomic Hooks(use{X}ListQuery/useCreate{X}/useUpdate{X}/useDelete{X}/...)와 서비스 파일 일괄 생성
+    (output_dir 생략 시 mcp/.cache/generated/{domain}, 지정 시 프로젝트 루트 기준 상대 경로로 apps/ 또는 mcp/.cache/generated 아래만 - 예: apps/primes/src)"""
+    from hook_generator import generate_domain
+
+    index = get_spec_store().get(domain)
+    return await anyio.to_thread.run_sync(generate_domain, index, domain, tags, output_dir)
+
+@mcp.tool()
+@coalesce()
+async def emit_zod_schemas(domain: str = "primes_mold", output_dir: Optional[str] = None) -> Dict[str, Any]:
+    """components.schemas 를 $ref 의존 순서대로 TypeScript 타입 + Zod 스키마(<Name>.ts)로 생성
+    (스펙 제약 maxLength/minimum/required 등 반영, 해시가 바뀐 스키마만 다시 생성, 기본 출력: mcp/.cache/generated/{domain}/schemas,
+    output_dir 는 generate_atomic_hooks 와 같이 apps/ 또는 mcp/.cache/generated 아래만)"""
+    from schema_emitter import emit_domain_schemas
+
+    index = get_spec_store().get(domain)
+    return await anyio.to_thread.run_sync(emit_domain_schemas, index, domain, output_dir)
+
+@mcp.tool()
+@coalesce()
+async def refresh_swagger_specs(domains: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """SWAGGER_URLS 스펙을 지금 바로 수집(변경 없으면 304)하고 바뀐 스펙만 인덱스/스냅샷에 반영 (백그라운드 갱신과 상태 공유)"""
+    return await get_refresh_scheduler().refresh(domains)
+
+@mcp.tool()
+def get_refresh_status() -> Dict[str, Any]:
+    """스펙 백그라운드 갱신 상태 (이 프로세스 역할 leader/follower, 도메인별 마지막 시도/성공/변경 시각, 다음 예정 시각, 연속 실패 수와 백오프)"""
+    status = get_refresh_scheduler().status()
+    store = get_spec_store()
+    for entry in status["domains"]:
+        entry["contentHash"] = store.get(entry["domain"]).content_hash[:12] if entry["domain"] in store else None
+    return status
+
+@mcp.tool()
+def list_swagger_snapshots(domain: Optional[str] = None) -> Dict[str, Any]:
+    """오프라인 스냅샷 매니페스트 (도메인별 최신 해시와 이력, 네트워크 없이 스펙 툴이 쓰는 원본)"""
+    from snapshot_store import get_snapshot_store
+
+    snapshots = get_snapshot_store()
+    domains = [domain] if domain else snapshots.domains()
+    return {
+        "root": str(snapshots.root),
+        "domains": {
+            name: {
+                "latest": latest.content_hash if (latest := snapshots.latest(name)) else None,
+                "history": [entry.to_dict() for entry in snapshots.history(name)],
+            }
+            for name in domains
+        },
+        "missing": sorted(set(SWAGGER_URLS) - set(snapshots.domains())),
+    }
+
+@mcp.tool()
+def import_swagger_snapshot(domain: str, path: str) -> Dict[str, Any]:
+    """로컬 OpenAPI JSON 파일을 도메인 스냅샷으로 가져와 바로 스펙 저장소에 반영
+    (예: primes_mold ← mcp/mold_api.json, 프로젝트 루트 또는 SWAGGER_IMPORT_DIR 기준 상대 경로의 .json 파일만)"""
+    from snapshot_store import get_snapshot_store
+
+    entry = get_snapshot_store().import_file(domain, Path(path))
+    index = get_spec_store().load_bytes(domain, get_snapshot_store().read(entry.content_hash), source=entry.source)
+    return {"domain": domain, **entry.to_dict(), **index.summary()}
+
+@mcp.tool()
+def read_resource_chunk(uri: str, offset: int = 0, limit: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+    """큰 리소스를 바이트 범위로 나눠 읽기 (swagger://{domain}/spec 등, 콘텐츠는 uri 에 ?format=json 이면 압축 JSON) - 다음 청크는 nextOffset 으로 요청"""
+    from chunked_reads import MAX_CHUNK_SIZE
+
+    if offset < 0 or not 0 < limit <= MAX_CHUNK_SIZE:
+        raise ValueError(f"범위는 offset >= 0, 0 < limit <= {MAX_CHUNK_SIZE} 이어야 합니다")
+    if uri.startswith(SWAGGER_SCHEME):
+        data = get_spec_resources().buffer(uri)
+    else:
+        # 콘텐츠 리소스는 '<uri>?format=json' 으로 압축 JSON 형식
+        base, format = split_format(uri)
+        data = get_content_store().get(base).encode(format)
+    text, start, end = slice_text(data, offset, limit)
+    return {"uri": uri, **chunk_meta(start, end, len(data)), "text": text}
+
+# ===== 스펙 리소스 템플릿 =====
+
+@mcp.resource(SPEC_TEMPLATE, name="swagger_spec", mime_type=JSON_MIME_TYPE)
+def swagger_spec(domain: str) -> str:
+    """도메인 스펙 JSON 전체 (큰 문서는 read_resource_chunk 툴로 나눠 읽기)"""
+    return get_spec_resources().text(SPEC_TEMPLATE.format(domain=domain))
+
+@mcp.resource(PATH_TEMPLATE, name="swagger_path", mime_type=JSON_MIME_TYPE)
+def swagger_path(domain: str, path: str) -> str:
+    """경로 하나의 전체 오퍼레이션(JSON) - path 는 '/' 포함 퍼센트 인코딩 (예: %2Fmold%2Frepair)"""
+    return get_spec_resources().text(PATH_TEMPLATE.format(domain=domain, path=path))
+
+@mcp.resource(SCHEMA_TEMPLATE, name="swagger_schema", mime_type=JSON_MIME_TYPE)
+def swagger_schema(domain: str, name: str) -> str:
+    """components.schemas 항목 하나(JSON, $ref 는 그대로 - 펼친 결과는 get_schema 툴)"""
+    return get_spec_resources().text(SCHEMA_TEMPLATE.format(domain=domain, name=name))
+
+profiler.mark("register tools")
+
+# ===== 시작 시간 프로파일 =====
+
+async def profile_first_response() -> None:
+    """인메모리 MCP 세션으로 첫 응답까지와 하위 시스템 첫 사용 비용 측정"""
+    from mcp.shared.memory import create_connected_server_and_client_session
+
+    profiler.mark("import in-memory client")
+    async with create_connected_server_and_client_session(mcp._mcp_server) as client:
+        profiler.mark("initialize")
+        await client.list_tools()
+        profiler.mark("first list_tools")
+        await client.call_tool("ping", {})
+        profiler.mark("first call_tool(ping)  <- time to first response")
+        await client.call_tool("list_spec_domains", {})
+        profiler.mark("lazy: spec store (first spec tool)")
+        await client.call_tool("get_schema", {"domain": "primes_mold", "name": "MoldMasterDto", "depth": 0})
+        profiler.mark("lazy: schema resolver (first get_schema)")
+        await client.call_tool("search", {"query": "MoldRepair", "limit": 1})
+        profiler.mark("lazy: search index (first search)")
+
+# ===== HTTP 전송 (Streamable HTTP) =====
+
+# gzip 압축 최소 응답 크기 (작은 JSON-RPC 응답은 압축 이득보다 비용이 큼)
+GZIP_MINIMUM_SIZE = 1024
+
+def create_http_app():
+    """팀 공용 배포용 ASGI 앱 (uvicorn 워커마다 1회 생성)
+
+    - stateless + JSON 응답: 세션 상태가 워커에 묶이지 않아 여러 워커로 분산 가능
+    - 스펙 저장소/스키마 해석기/검색 인덱스는 모듈 전역 캐시라 워커 내 모든 요청이 공유
+    - MCP_ALLOWED_HOSTS (쉼표 구분, 예: "mcp.internal:*") 로 허용 Host 헤더 추가
+    """
+    from fastapi import FastAPI
+    from fastapi.responses import PlainTextResponse
+    from starlette.middleware.gzip import GZipMiddleware
+
+    mcp.settings.stateless_http = True
+    mcp.settings.json_response = True
+    allowed_hosts = [host.strip() for host in os.getenv("MCP_ALLOWED_HOSTS", "").split(",") if host.strip()]
+    if allowed_hosts:
+        security = mcp.settings.transport_security or TransportSecuritySettings(allowed_hosts=[], allowed_origins=[])
+        security.allowed_hosts = [*security.allowed_hosts, *allowed_hosts]
+        security.allowed_origins = [
+            *security.allowed_origins,
+            *(f"{scheme}://{host}" for host in allowed_hosts for scheme in ("http", "https")),
+        ]
+        mcp.settings.transport_security = security
+    mcp_app = mcp.streamable_http_app()
+
+    @asynccontextmanager
+    async def lifespan(app):
+        # 첫 요청이 스펙 파싱 비용을 내지 않도록 공유 캐시를 미리 채움
+        get_spec_store()
+        # content/ 편집 감시 (워커마다 1개, 바뀐 파일만 다시 읽음)
+        watcher = asyncio.create_task(watch_content(get_content_store()))
+        # 스펙 백그라운드 갱신 (리더 잠금을 얻은 워커 1개만 수집, 나머지 워커는 스냅샷만 다시 로드)
+        refresher = asyncio.create_task(get_refresh_scheduler().run())
+        async with mcp.session_manager.run():
+            yield
+        watcher.cancel()
+        refresher.cancel()
+
+    app = FastAPI(title="unified-project-info-mcp", lifespan=lifespan)
+    app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
+
+    @app.get("/healthz")
+    async def healthz() -> Dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/metrics", response_class=PlainTextResponse)
+    async def metrics() -> PlainTextResponse:
+        # 워커 프로세스별 값 - 스크레이프 대상이 워커를 구분하려면 워커당 포트를 분리
+        return PlainTextResponse(METRICS.render_prometheus(), media_type="text/plain; version=0.0.4")
+
+    app.mount("/", mcp_app)
+    return app
+
+# stdio 기동 후 백그라운드 작업을 시작하기까지 대기 (초) - 첫 요청 응답(TTFR)과 겹치지 않도록
+BACKGROUND_START_DELAY = float(os.getenv("MCP_BACKGROUND_START_DELAY", "2"))
+
+async def watch_content_later(delay: float = BACKGROUND_START_DELAY) -> None:
+    """delay 뒤 콘텐츠 저장소(패키지 그래프/인벤토리 스캔 포함)를 스레드에서 만들고 감시 시작
+    (그 전에 콘텐츠 툴이 호출되면 그 툴이 저장소를 만들고, 여기서는 같은 저장소를 받음)"""
+    await asyncio.sleep(delay)
+    store = await anyio.to_thread.run_sync(get_content_store)
+    await watch_content(store)
+
+async def refresh_specs_later(delay: float = BACKGROUND_START_DELAY) -> None:
+    """delay 뒤 스펙 백그라운드 갱신 시작 (httpx import·클라이언트 생성·리더 잠금이 첫 응답을 늦추지 않도록)"""
+    await asyncio.sleep(delay)
+    await get_refresh_scheduler().run()
+
+async def run_stdio() -> None:
+    """stdio 전송 실행 + content/ 편집 감시 + 스펙 백그라운드 갱신"""
+    watcher = asyncio.create_task(watch_content_later())
+    refresher = asyncio.create_task(refresh_specs_later())
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        watcher.cancel()
+        refresher.cancel()
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="통합 프로젝트 정보 MCP 서버")
+    parser.add_argument("--transport", choices=["stdio", "http"], default=os.getenv("MCP_TRANSPORT", "stdio"))
+    parser.add_argument("--host", default=os.getenv("MCP_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("MCP_PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=int(os.getenv("MCP_WORKERS", "1")))
+    parser.add_argument("--keep-alive", type=int, default=int(os.getenv("MCP_KEEP_ALIVE", "30")), help="HTTP keep-alive 유지 시간(초)")
+    parser.add_argument("--profile-startup", action="store_true", help="시작 단계별 시간을 stderr 로 출력하고 종료")
+    return parser.parse_args(argv)
 
 # ===== 메인 실행 =====
 if __name__ == "__main__":
-    # 기본: stdio 전송으로 실행
-    # HTTP 전송이 필요하면 FastAPI에 mcp.streamable_http_app() 마운트 방식을 사용하세요.
-    # (예) app.mount("/", mcp.streamable_http_app())
-    logger.info("Starting MCP server (stdio)")
-    mcp.run(transport="stdio")
+    args = parse_args()
+    if args.profile_startup:
+        logging.getLogger().setLevel(logging.WARNING)
+        asyncio.run(profile_first_response())
+        profiler.report(sys.stderr)
+    elif args.transport == "http":
+        import uvicorn
+
+        # 엔드포인트: http://{host}:{port}/mcp , 헬스 체크: /healthz
+        logger.info("Starting MCP server (http) on %s:%s with %d worker(s)", args.host, args.port, args.workers)
+        uvicorn.run(
+            "server_fastmcp:create_http_app",
+            factory=True,
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            timeout_keep_alive=args.keep_alive,
+            log_level=os.getenv("LOG_LEVEL", "INFO").lower(),
+        )
+    else:
+        # 기본: stdio 전송으로 실행 (Cursor 가 프로세스 관리)
+        logger.info("Starting MCP server (stdio)")
+        anyio.run(run_stdio)
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+핸들러 계측 (호출 수, 지연 히스토그램, 응답 크기, 캐시 적중/미스)
+- instrument_server(server): 저수준 Server 의 모든 요청 핸들러를 감싸 측정 (두 서버 공통)
+- METRICS.cache_hit/cache_miss: 스키마 해석기·Swagger 캐시·소스 스캐너 등이 적중 여부 기록
+- snapshot() → get_server_metrics 툴, render_prometheus() → HTTP 모드 /metrics
+- 요청 로그는 샘플링 (REQUEST_LOG_SAMPLE 중 1건, 느린 호출은 항상) → 부하 시 stderr 파이프 폭주 방지
+"""
+
+import bisect
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from mcp import types
+from mcp.server import Server
+
+logger = logging.getLogger("unified-project-info-mcp.metrics")
+
+# 지연 히스토그램 버킷 상한 (초) - Prometheus 기본값보다 짧은 쪽을 촘촘하게
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)
+
+# 요청 로그 샘플링: N 건 중 1건만 INFO 로 기록 (0 이면 끔), 이 시간(ms) 이상 걸린 호출은 항상 WARNING
+REQUEST_LOG_SAMPLE = int(os.getenv("REQUEST_LOG_SAMPLE", "100"))
+SLOW_CALL_MS = float(os.getenv("SLOW_CALL_MS", "500"))
+
+HandlerKey = Tuple[str, str]  # (method, name)
+
+
+class HandlerStats:
+    """핸들러 (method, name) 하나의 누적 통계"""
+
+    __slots__ = ("calls", "errors", "seconds_sum", "seconds_max", "bytes_sum", "buckets")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.seconds_sum = 0.0
+        self.seconds_max = 0.0
+        self.bytes_sum = 0
+        # 버킷별(비누적) 개수, 마지막 칸은 +Inf
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def observe(self, seconds: float, size: int, error: bool) -> None:
+        self.calls += 1
+        self.errors += error
+        self.seconds_sum += seconds
+        if seconds > self.seconds_max:
+            self.seconds_max = seconds
+        self.bytes_sum += size
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def quantile_ms(self, ratio: float) -> float:
+        """히스토그램 기반 분위수 추정 (해당 버킷 상한, +Inf 버킷이면 최대값)"""
+        target = self.calls * ratio
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target and count:
+                bound = LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else self.seconds_max
+                return min(bound, self.seconds_max) * 1000
+        return self.seconds_max * 1000
+
+
+class ServerMetrics:
+    """프로세스 단위 계측 저장소 (HTTP 다중 워커에서는 워커별)"""
+
+    def __init__(self) -> None:
+        self.started = time.time()
+        self.handlers: Dict[HandlerKey, HandlerStats] = {}
+        self.caches: Dict[str, Dict[str, int]] = defaultdict(lambda: {"hit": 0, "miss": 0})
+        # 캐시 기록은 스캐너/분석기 워커 스레드에서도 호출됨
+        self._cache_lock = threading.Lock()
+        self._sequence = 0
+
+    # ----- 기록 -----
+
+    def observe(self, method: str, name: str, seconds: float, size: int, error: bool = False) -> None:
+        key = (method, name)
+        stats = self.handlers.get(key)
+        if stats is None:
+            stats = self.handlers[key] = HandlerStats()
+        stats.observe(seconds, size, error)
+
+        self._sequence += 1
+        elapsed_ms = seconds * 1000
+        if elapsed_ms >= SLOW_CALL_MS:
+            logger.warning("slow %s %s %.1fms %dB", method, name, elapsed_ms, size)
+        elif REQUEST_LOG_SAMPLE and self._sequence % REQUEST_LOG_SAMPLE == 0:
+            logger.info("%s %s %.1fms %dB (1/%d sampled)", method, name, elapsed_ms, size, REQUEST_LOG_SAMPLE)
+
+    def cache_hit(self, cache: str, count: int = 1) -> None:
+        with self._cache_lock:
+            self.caches[cache]["hit"] += count
+
+    def cache_miss(self, cache: str, count: int = 1) -> None:
+        with self._cache_lock:
+            self.caches[cache]["miss"] += count
+
+    # ----- 조회 -----
+
+    def snapshot(self) -> Dict[str, Any]:
+        """get_server_metrics 응답 (p50/p99 는 히스토그램 버킷 기반 추정)"""
+        handlers: List[Dict[str, Any]] = []
+        for (method, name), stats in sorted(self.handlers.items()):
+            handlers.append({
+                "method": method,
+                "name": name,
+                "calls": stats.calls,
+                "errors": stats.errors,
+                "avgMs": round(stats.seconds_sum / stats.calls * 1000, 3),
+                "p50Ms": round(stats.quantile_ms(0.50), 3),
+                "p99Ms": round(stats.quantile_ms(0.99), 3),
+                "maxMs": round(stats.seconds_max * 1000, 3),
+                "bytesTotal": stats.bytes_sum,
+                "avgBytes": stats.bytes_sum // stats.calls,
+            })
+        with self._cache_lock:
+            caches = {
+                cache: {**counts, "hitRatio": round(counts["hit"] / max(1, counts["hit"] + counts["miss"]), 3)}
+                for cache, counts in sorted(self.caches.items())
+            }
+        return {
+            "pid": os.getpid(),
+            "uptimeSeconds": round(time.time() - self.started, 1),
+            "handlers": handlers,
+            "caches": caches,
+        }
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식 (0.0.4)"""
+        lines: List[str] = [
+            "# HELP mcp_requests_total MCP requests handled.",
+            "# TYPE mcp_requests_total counter",
+        ]
+        items = sorted(self.handlers.items())
+        for (method, name), stats in items:
+            lines.append(f"mcp_requests_total{_labels(method=method, name=name)} {stats.calls}")
+        lines += ["# HELP mcp_request_errors_total MCP requests that failed.", "# TYPE mcp_request_errors_total counter"]
+        for (method, name), stats in items:
+            lines.append(f"mcp_request_errors_total{_labels(method=method, name=name)} {stats.errors}")
+        lines += [
+            "# HELP mcp_response_bytes_total UTF-8 bytes of text returned to clients.",
+            "# TYPE mcp_response_bytes_total counter",
+        ]
+        for (method, name), stats in items:
+            lines.append(f"mcp_response_bytes_total{_labels(method=method, name=name)} {stats.bytes_sum}")
+        lines += [
+            "# HELP mcp_request_duration_seconds Handler latency.",
+            "# TYPE mcp_request_duration_seconds histogram",
+        ]
+        for (method, name), stats in items:
+            cumulative = 0
+            for bound, count in zip((*LATENCY_BUCKETS, float("inf")), stats.buckets):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"mcp_request_duration_seconds_bucket{_labels(method=method, name=name, le=le)} {cumulative}")
+            lines.append(f"mcp_request_duration_seconds_sum{_labels(method=method, name=name)} {stats.seconds_sum}")
+            lines.append(f"mcp_request_duration_seconds_count{_labels(method=method, name=name)} {stats.calls}")
+        lines += ["# HELP mcp_cache_requests_total Cache lookups by result.", "# TYPE mcp_cache_requests_total counter"]
+        with self._cache_lock:
+            for cache, counts in sorted(self.caches.items()):
+                for result in ("hit", "miss"):
+                    lines.append(f"mcp_cache_requests_total{_labels(cache=cache, result=result)} {counts[result]}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+METRICS = ServerMetrics()
+
+
+# ===== 핸들러 계측 =====
+
+def _no_name(request: Any) -> str:
+    return ""
+
+
+# 읽기마다 같은 URI 를 다시 자르지 않도록 URI → 레이블 메모이즈 (크기 제한, 넘으면 비움)
+_RESOURCE_LABEL_CACHE_LIMIT = 4096
+_resource_labels: Dict[str, str] = {}
+
+
+def _resource_label(request: Any) -> str:
+    """리소스 URI 레이블 - 스펙 파생 리소스(수천 개)는 도메인/종류 단위로 묶어 레이블 수 제한"""
+    uri = str(request.params.uri)
+    label = _resource_labels.get(uri)
+    if label is None:
+        if len(_resource_labels) >= _RESOURCE_LABEL_CACHE_LIMIT:
+            _resource_labels.clear()
+        label = _resource_labels[uri] = _label_for_uri(uri)
+    return label
+
+
+def _label_for_uri(uri: str) -> str:
+    uri = uri.partition("?")[0]
+    if uri.startswith("swagger://"):
+        domain, _, rest = uri[len("swagger://"):].partition("/")
+        kind, has_key, _ = rest.partition("/")
+        return f"swagger://{domain}/{kind}/*" if has_key else uri
+    return uri
+
+
+# 요청 유형별 레이블 이름 (툴 이름 / 리소스 URI / 프롬프트 이름) - 래핑 시점에 한 번 선택
+_NAME_EXTRACTORS: Dict[type, Callable[[Any], str]] = {
+    types.CallToolRequest: lambda request: request.params.name,
+    types.GetPromptRequest: lambda request: request.params.name,
+    types.ReadResourceRequest: _resource_label,
+}
+
+
+def _text_size(text: str) -> int:
+    # isascii() 는 O(1) - ASCII 응답은 인코딩 없이 길이가 곧 바이트 수
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+# 리소스 응답은 레지스트리 / 스펙 리소스가 미리 만든 같은 ServerResult 객체를 매번 돌려주므로 객체 id 로 크기 메모이즈
+# (값에 원본을 함께 보관해 id 재사용으로 인한 오인을 막음)
+_RESOURCE_SIZE_CACHE_LIMIT = 4096
+_resource_sizes: Dict[int, Tuple[Any, int]] = {}
+
+
+def _tool_result_size(result: Any) -> Tuple[int, bool]:
+    size = 0
+    for block in result.root.content:
+        text = getattr(block, "text", None)
+        if text is not None:
+            size += _text_size(text)
+    return size, bool(result.root.isError)
+
+
+def _resource_result_size(result: Any) -> Tuple[int, bool]:
+    cached = _resource_sizes.get(id(result))
+    if cached is not None and cached[0] is result:
+        return cached[1], False
+    size = 0
+    for contents in result.root.contents:
+        text = getattr(contents, "text", None)
+        size += _text_size(text) if text is not None else len(getattr(contents, "blob", ""))
+    if len(_resource_sizes) >= _RESOURCE_SIZE_CACHE_LIMIT:
+        _resource_sizes.clear()
+    _resource_sizes[id(result)] = (result, size)
+    return size, False
+
+
+def _no_size(result: Any) -> Tuple[int, bool]:
+    return 0, False
+
+
+# 요청 유형별 (응답 텍스트 UTF-8 바이트 수, 오류 응답 여부) 계산기
+_SIZERS: Dict[type, Callable[[Any], Tuple[int, bool]]] = {
+    types.CallToolRequest: _tool_result_size,
+    types.ReadResourceRequest: _resource_result_size,
+}
+
+
+def instrument_server(server: Server, metrics: ServerMetrics = METRICS) -> None:
+    """등록된 모든 요청 핸들러를 계측 래퍼로 교체 (핸들러 등록이 끝난 뒤 1회 호출)"""
+    for request_type, handler in list(server.request_handlers.items()):
+        if getattr(handler, "__instrumented__", False):
+            continue
+        server.request_handlers[request_type] = _wrap(request_type, handler, metrics)
+    install_log_sampling()
+
+
+def _wrap(
+    request_type: type, handler: Callable[[Any], Awaitable[Any]], metrics: ServerMetrics
+) -> Callable[[Any], Awaitable[Any]]:
+    method = request_type.model_fields["method"].default
+    name_of = _NAME_EXTRACTORS.get(request_type, _no_name)
+    size_of = _SIZERS.get(request_type, _no_size)
+    perf_counter = time.perf_counter
+
+    async def instrumented(request: Any) -> Any:
+        if request is None:
+            # SDK 내부 호출 (call_tool 이 툴 정의 캐시를 채우려 list_tools 핸들러를 직접 부름) - 측정 제외
+            return await handler(request)
+        started = perf_counter()
+        try:
+            result = await handler(request)
+        except Exception:
+            metrics.observe(method, name_of(request), perf_counter() - started, 0, error=True)
+            raise
+        elapsed = perf_counter() - started
+        size, error = size_of(result)
+        metrics.observe(method, name_of(request), elapsed, size, error)
+        return result
+
+    instrumented.__instrumented__ = True  # type: ignore[attr-defined]
+    return instrumented
+
+
+# ===== 로그 샘플링 =====
+
+class SamplingFilter(logging.Filter):
+    """INFO 이하 레코드는 rate 건 중 1건만 통과 (WARNING 이상은 항상 통과)"""
+
+    def __init__(self, rate: int) -> None:
+        super().__init__()
+        self.rate = rate
+        self._seen = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or self.rate <= 1:
+            return True
+        self._seen += 1
+        return self._seen % self.rate == 0
+
+
+_sampling_installed = False
+
+
+def install_log_sampling(rate: Optional[int] = None) -> None:
+    """SDK 의 요청마다 찍히는 'Processing request of type ...' 로그를 샘플링"""
+    global _sampling_installed
+    if _sampling_installed:
+        return
+    rate = REQUEST_LOG_SAMPLE if rate is None else rate
+    if rate:
+        logging.getLogger("mcp.server.lowlevel.server").addFilter(SamplingFilter(rate))
+    else:
+        logging.getLogger("mcp.server.lowlevel.server").setLevel(logging.WARNING)
+    _sampling_installed = True
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+동시 동일 요청 병합 (single-flight)
+- 같은 키의 작업이 진행 중이면 새로 시작하지 않고 진행 중인 작업 결과를 함께 기다림
+- 작업이 끝나면 키를 비움 → 결과 캐시가 아니라 "동시에 들어온 호출" 만 합침 (캐시는 각 하위 시스템 몫)
+- 기다리던 세션 하나가 취소돼도 작업은 계속됨 (asyncio.shield) → 다른 세션과 캐시 채우기는 영향 없음
+- 새로 시작한 호출은 cache_miss, 합류한 호출은 cache_hit 으로 METRICS 에 기록 (get_server_metrics 의 caches)
+"""
+
+import asyncio
+import functools
+import inspect
+import json
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+from server_metrics import METRICS
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """키별 진행 중 작업 공유"""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """key 의 작업이 진행 중이면 합류, 아니면 factory() 로 시작"""
+        future = self._inflight.get(key)
+        if future is None:
+            METRICS.cache_miss(self.name)
+            future = asyncio.ensure_future(factory())
+            self._inflight[key] = future
+            future.add_done_callback(functools.partial(self._finished, key))
+        else:
+            METRICS.cache_hit(self.name)
+        return await asyncio.shield(future)
+
+    def _finished(self, key: Hashable, future: "asyncio.Future[Any]") -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        # 기다리던 호출이 모두 취소된 경우에도 "예외 미확인" 경고가 남지 않도록
+        if not future.cancelled():
+            future.exception()
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+
+def call_key(function: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> str:
+    """기본값까지 채운 인자를 정렬된 JSON 으로 (위치/키워드 인자 차이와 무관하게 같은 호출은 같은 키)"""
+    bound = inspect.signature(function).bind(*args, **kwargs)
+    bound.apply_defaults()
+    return json.dumps(bound.arguments, sort_keys=True, ensure_ascii=False, default=repr)
+
+
+def coalesce(name: Optional[str] = None) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """async 툴 함수용 - 같은 인자로 동시에 들어온 호출을 하나의 실행으로 합침 (시그니처는 그대로 유지)"""
+
+    def decorator(function: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        flight = SingleFlight(f"singleflight:{name or function.__name__}")
+
+        @functools.wraps(function)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            return await flight.do(call_key(function, args, kwargs), lambda: function(*args, **kwargs))
+
+        wrapper.flight = flight  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
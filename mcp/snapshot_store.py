@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Swagger 오프라인 스냅샷 저장소 (내용 주소 + 압축)
+- 스펙 원문을 SHA-256 내용 해시로 저장: objects/<해시 앞 2자>/<해시>.json.gz (같은 내용은 한 번만 저장)
+- manifest.json 이 도메인 → 최신 해시와 이력(출처, 저장 시각, 크기) 을 가짐
+- refresh_swagger_specs 로 받은 스펙은 자동 저장, mold_api.json 등 로컬 스펙은 시드 스냅샷으로 가져옴
+- 서버 시작 시 도메인별 최신 스냅샷을 스펙 저장소에 로드 → VPN/네트워크 없이도 스펙 툴·리소스 응답
+- 기본 위치는 mcp/snapshots (SWAGGER_SNAPSHOT_DIR 로 변경, 팀 공유 디렉토리 지정 가능)
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from atomic_files import atomic_write
+from server_metrics import METRICS
+
+logger = logging.getLogger("unified-project-info-mcp.snapshots")
+
+DEFAULT_SNAPSHOT_DIR = Path(os.getenv("SWAGGER_SNAPSHOT_DIR", str(Path(__file__).parent / "snapshots")))
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+# import_file 로 가져올 수 있는 위치 (프로젝트 루트 + SWAGGER_IMPORT_DIR, 그 밖의 서버 파일은 읽지 않음)
+IMPORT_DIR = Path(os.getenv("SWAGGER_IMPORT_DIR", str(PROJECT_ROOT)))
+
+# 도메인별 매니페스트에 남길 이력 수 (어느 도메인에서도 참조하지 않는 객체는 삭제)
+SNAPSHOT_HISTORY = int(os.getenv("SWAGGER_SNAPSHOT_HISTORY", "20"))
+
+MANIFEST_FORMAT = 1
+COMPRESS_LEVEL = 6
+
+
+@dataclass(frozen=True)
+class SnapshotEntry:
+    """도메인 스냅샷 한 건 (매니페스트 이력 항목)"""
+
+    content_hash: str
+    source: str
+    stored_at: float
+    size: int
+    compressed_size: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "contentHash": self.content_hash,
+            "source": self.source,
+            "storedAt": self.stored_at,
+            "size": self.size,
+            "compressedSize": self.compressed_size,
+        }
+
+
+class SnapshotStore:
+    """내용 주소 객체 + 도메인 매니페스트"""
+
+    def __init__(self, root: Path = DEFAULT_SNAPSHOT_DIR, history: int = SNAPSHOT_HISTORY) -> None:
+        self.root = Path(root)
+        self.history_limit = max(1, history)
+        self.manifest_path = self.root / "manifest.json"
+        # 마지막으로 읽거나 쓴 매니페스트의 수정 시각 (reload 에서 다른 프로세스의 변경 감지)
+        self._manifest_mtime = self._stat_manifest()
+        self._domains: Dict[str, List[SnapshotEntry]] = self._load_manifest()
+
+    def _stat_manifest(self) -> Optional[int]:
+        try:
+            return self.manifest_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def reload(self) -> bool:
+        """다른 프로세스(갱신 리더)가 매니페스트를 바꿨으면 다시 읽기 (바뀌었으면 True)"""
+        mtime = self._stat_manifest()
+        if mtime == self._manifest_mtime:
+            return False
+        self._manifest_mtime = mtime
+        self._domains = self._load_manifest()
+        return True
+
+    def _load_manifest(self) -> Dict[str, List[SnapshotEntry]]:
+        try:
+            payload = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            logger.warning("스냅샷 매니페스트 로드 실패 %s: %s", self.manifest_path, exc)
+            return {}
+        if not isinstance(payload, dict) or payload.get("format") != MANIFEST_FORMAT:
+            return {}
+        return {
+            domain: [SnapshotEntry(**entry) for entry in record.get("history", [])]
+            for domain, record in payload.get("domains", {}).items()
+        }
+
+    def _save_manifest(self) -> None:
+        payload = {
+            "format": MANIFEST_FORMAT,
+            "domains": {
+                domain: {"latest": history[-1].content_hash, "history": [asdict(entry) for entry in history]}
+                for domain, history in sorted(self._domains.items())
+                if history
+            },
+        }
+        self.root.mkdir(parents=True, exist_ok=True)
+        atomic_write(self.manifest_path, json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8"))
+        self._manifest_mtime = self._stat_manifest()
+
+    def object_path(self, content_hash: str) -> Path:
+        return self.root / "objects" / content_hash[:2] / f"{content_hash}.json.gz"
+
+    # ===== 저장 =====
+
+    def put(self, domain: str, body: bytes, source: str = "") -> SnapshotEntry:
+        """스펙 원문 저장 - 객체가 이미 있으면 쓰지 않고, 최신 해시와 같으면 이력도 그대로"""
+        content_hash = hashlib.sha256(body).hexdigest()
+        history = self._domains.setdefault(domain, [])
+        if history and history[-1].content_hash == content_hash:
+            METRICS.cache_hit("snapshot_store")
+            return history[-1]
+
+        path = self.object_path(content_hash)
+        if path.exists():
+            METRICS.cache_hit("snapshot_store")
+            compressed_size = path.stat().st_size
+        else:
+            METRICS.cache_miss("snapshot_store")
+            # mtime=0 → 같은 내용이면 압축 결과도 같은 바이트 (공유 디렉토리 동기화 시 불필요한 변경 방지)
+            compressed = gzip.compress(body, compresslevel=COMPRESS_LEVEL, mtime=0)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(path, compressed)
+            compressed_size = len(compressed)
+
+        entry = SnapshotEntry(content_hash, source, time.time(), len(body), compressed_size)
+        history.append(entry)
+        dropped = history[: -self.history_limit]
+        del history[: -self.history_limit]
+        self._save_manifest()
+        self._prune(dropped)
+        return entry
+
+    def import_file(self, domain: str, path: Path) -> SnapshotEntry:
+        """로컬 스펙 파일을 스냅샷으로 가져오기 (JSON 으로 파싱되는지만 확인)"""
+        path = resolve_import_path(path)
+        body = path.read_bytes()
+        try:
+            spec = json.loads(body)
+        except ValueError:
+            raise ValueError(f"JSON 스펙 파일이 아닙니다: {path.name}") from None
+        if not isinstance(spec, dict) or "paths" not in spec:
+            raise ValueError(f"OpenAPI 스펙(paths)이 없는 파일입니다: {path.name}")
+        return self.put(domain, body, source=f"import:{path.name}")
+
+    def _prune(self, dropped: List[SnapshotEntry]) -> None:
+        in_use = {entry.content_hash for history in self._domains.values() for entry in history}
+        for entry in dropped:
+            if entry.content_hash not in in_use:
+                try:
+                    self.object_path(entry.content_hash).unlink()
+                except FileNotFoundError:
+                    pass
+
+    # ===== 조회 =====
+
+    def read(self, content_hash: str) -> bytes:
+        """객체 원문 (압축 해제 후 해시 검증 - 손상된 객체는 ValueError)"""
+        try:
+            body = gzip.decompress(self.object_path(content_hash).read_bytes())
+        except FileNotFoundError:
+            raise ValueError(f"스냅샷 객체가 없습니다: {content_hash}") from None
+        except (OSError, EOFError) as exc:
+            raise ValueError(f"스냅샷 객체를 읽을 수 없습니다: {content_hash} ({exc})") from exc
+        if hashlib.sha256(body).hexdigest() != content_hash:
+            raise ValueError(f"스냅샷 객체 해시가 맞지 않습니다 (손상): {content_hash}")
+        return body
+
+    def latest(self, domain: str) -> Optional[SnapshotEntry]:
+        history = self._domains.get(domain)
+        return history[-1] if history else None
+
+    def history(self, domain: str) -> List[SnapshotEntry]:
+        return list(self._domains.get(domain, ()))
+
+    def domains(self) -> List[str]:
+        return sorted(domain for domain, history in self._domains.items() if history)
+
+    def __contains__(self, domain: object) -> bool:
+        return bool(self._domains.get(domain))  # type: ignore[arg-type]
+
+
+def resolve_import_path(path: Path) -> Path:
+    """가져올 스펙 파일 경로 → 실제 경로 (프로젝트 루트 기준 상대 경로의 .json 파일만, 프로젝트 루트 또는 IMPORT_DIR 아래만 허용)
+    절대 경로·'..' 경로·심볼릭 링크로 밖을 가리키는 경로는 ValueError - 오류에 원래 경로만 담아 서버 파일 존재 여부를 드러내지 않음"""
+    relative = Path(path)
+    if relative.is_absolute() or ".." in relative.parts:
+        raise ValueError(f"가져올 파일은 프로젝트 루트 기준 상대 경로여야 합니다 ('..' 불가): {path}")
+    allowed = (PROJECT_ROOT, IMPORT_DIR.resolve())
+    for root in allowed:
+        resolved = (root / relative).resolve()
+        if (
+            resolved.suffix == ".json"
+            and any(resolved.is_relative_to(base) for base in allowed)
+            and resolved.is_file()
+        ):
+            return resolved
+    raise ValueError(f"가져올 수 있는 스펙 JSON 파일이 아닙니다: {path}")
+
+
+_default_snapshots: Optional[SnapshotStore] = None
+
+
+def get_snapshot_store() -> SnapshotStore:
+    """프로세스 공용 스냅샷 저장소 (첫 사용 시 매니페스트 로드)"""
+    global _default_snapshots
+    if _default_snapshots is None:
+        _default_snapshots = SnapshotStore()
+    return _default_snapshots
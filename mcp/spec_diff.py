@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Swagger 스펙 버전 간 구조 비교 (Merkle 해시 트리)
+- 스펙 JSON 의 모든 노드에 (자식 키, 자식 해시) 로 만든 해시를 매겨 트리 구성 → 내용 해시별로 한 번만 만들고 캐시
+- 두 버전 비교는 루트부터 내려가며 해시가 같은 서브트리를 통째로 건너뜀 → 비용은 바뀐 서브트리 크기에 비례
+- 배열은 요소 성격에 따라 키를 정함
+  - name 이 있는 객체 배열(parameters 등): "in:name" 키 → 순서가 바뀌어도 같은 파라미터로 비교
+  - 문자열/숫자 배열(required, enum, tags): 집합으로 비교
+  - 그 외: 위치(인덱스) 기준
+- 변경 목록(JSON Pointer)과 경로/오퍼레이션/파라미터/스키마/스키마 필드 단위 요약을 함께 반환
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from server_metrics import METRICS
+from spec_store import HTTP_METHODS, SpecIndex, on_spec_evicted
+
+# 내용 해시별로 보관할 해시 트리 수
+MAX_CACHED_TREES = 16
+
+_OBJECT, _KEYED, _ARRAY, _SET, _LEAF = "o", "k", "a", "s", "v"
+
+
+class MerkleNode:
+    """해시 트리 노드 - 컨테이너는 children(키 → 노드), 스칼라는 value"""
+
+    __slots__ = ("digest", "kind", "value", "children")
+
+    def __init__(self, digest: bytes, kind: str, value: Any = None, children: Optional[Dict[str, "MerkleNode"]] = None):
+        self.digest = digest
+        self.kind = kind
+        self.value = value
+        self.children = children
+
+
+@dataclass
+class MerkleTree:
+    root: MerkleNode
+    node_count: int
+
+
+@dataclass
+class Change:
+    op: str  # added | removed | changed
+    pointer: Tuple[str, ...]
+    before: Any = None
+    after: Any = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {"op": self.op, "pointer": to_pointer(self.pointer)}
+        if self.op != "added":
+            entry["before"] = self.before
+        if self.op != "removed":
+            entry["after"] = self.after
+        return entry
+
+
+@dataclass
+class DiffStats:
+    compared: int = 0
+    changes: List[Change] = field(default_factory=list)
+
+
+def to_pointer(segments: Tuple[str, ...]) -> str:
+    """RFC 6901 JSON Pointer (경로의 '/' 는 ~1)"""
+    return "".join("/" + segment.replace("~", "~0").replace("/", "~1") for segment in segments)
+
+
+def _hash(kind: str, parts: List[bytes]) -> bytes:
+    hasher = hashlib.blake2b(kind.encode(), digest_size=16)
+    for part in parts:
+        hasher.update(part)
+    return hasher.digest()
+
+
+def _scalar_key(value: Any) -> str:
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def _array_keys(items: List[Any]) -> Tuple[str, Optional[List[str]]]:
+    """배열 비교 방식과 요소 키 - 키가 겹치면 위치 기준으로 대체"""
+    if items and all(isinstance(item, dict) and isinstance(item.get("name"), str) for item in items):
+        keys = [f"{item['in']}:{item['name']}" if isinstance(item.get("in"), str) else item["name"] for item in items]
+        if len(set(keys)) == len(keys):
+            return _KEYED, keys
+    if items and all(item is None or isinstance(item, (str, int, float, bool)) for item in items):
+        keys = [_scalar_key(item) for item in items]
+        if len(set(keys)) == len(keys):
+            return _SET, keys
+    return _ARRAY, None
+
+
+def build_tree(value: Any) -> MerkleTree:
+    """스펙 JSON → 해시 트리 (노드 수 포함)"""
+    count = 0
+
+    def build(node: Any) -> MerkleNode:
+        nonlocal count
+        count += 1
+        if isinstance(node, dict):
+            children = {key: build(child) for key, child in node.items()}
+            kind = _OBJECT
+        elif isinstance(node, list):
+            kind, keys = _array_keys(node)
+            if kind == _SET:
+                children = {key: MerkleNode(_hash(_LEAF, [key.encode()]), _LEAF, item) for key, item in zip(keys, node)}
+                count += len(children)
+            elif keys is not None:
+                children = {key: build(child) for key, child in zip(keys, node)}
+            else:
+                children = {str(position): build(child) for position, child in enumerate(node)}
+        else:
+            return MerkleNode(_hash(_LEAF, [json.dumps(node).encode()]), _LEAF, node)
+        # 객체/키 배열/집합은 키 순서와 무관, 위치 배열만 순서 반영
+        entries = children.items() if kind == _ARRAY else sorted(children.items())
+        return MerkleNode(
+            _hash(kind, [key.encode() + b"\0" + child.digest for key, child in entries]),
+            kind,
+            children=children,
+        )
+
+    root = build(value)
+    return MerkleTree(root, count)
+
+
+def diff_nodes(before: MerkleNode, after: MerkleNode, pointer: Tuple[str, ...], stats: DiffStats) -> None:
+    """해시가 다른 서브트리만 내려가며 변경 수집"""
+    stats.compared += 1
+    if before.digest == after.digest:
+        return
+    if before.children is None or after.children is None or before.kind != after.kind:
+        stats.changes.append(Change("changed", pointer, _summarize(before), _summarize(after)))
+        return
+    for key, child in before.children.items():
+        other = after.children.get(key)
+        if other is None:
+            stats.changes.append(Change("removed", pointer + (key,), before=_summarize(child)))
+        else:
+            diff_nodes(child, other, pointer + (key,), stats)
+    for key, child in after.children.items():
+        if key not in before.children:
+            stats.changes.append(Change("added", pointer + (key,), after=_summarize(child)))
+
+
+def _summarize(node: MerkleNode) -> Any:
+    """변경 목록에 실을 값 - 스칼라는 값 그대로, 컨테이너는 키 목록만"""
+    if node.children is None:
+        return node.value
+    if node.kind == _SET:
+        return [child.value for child in node.children.values()]
+    return {"keys": list(node.children)[:20], "size": len(node.children)}
+
+
+_trees: "OrderedDict[str, MerkleTree]" = OrderedDict()
+
+
+@on_spec_evicted
+def _evict_tree(content_hash: str) -> None:
+    _trees.pop(content_hash, None)
+
+
+def get_tree(index: SpecIndex) -> MerkleTree:
+    """내용 해시별 해시 트리 (LRU 캐시)"""
+    tree = _trees.get(index.content_hash)
+    if tree is not None:
+        METRICS.cache_hit("spec_diff")
+        _trees.move_to_end(index.content_hash)
+        return tree
+    METRICS.cache_miss("spec_diff")
+    tree = build_tree(index.spec)
+    _trees[index.content_hash] = tree
+    while len(_trees) > MAX_CACHED_TREES:
+        _trees.popitem(last=False)
+    return tree
+
+
+def _operation_label(path: str, method: str) -> str:
+    return f"{method.upper()} {path}"
+
+
+def summarize_changes(changes: List[Change], before: MerkleNode, after: MerkleNode) -> Dict[str, Dict[str, List[str]]]:
+    """JSON Pointer 변경 목록 → 경로/오퍼레이션/파라미터/스키마/스키마 필드 단위 요약"""
+    summary: Dict[str, Dict[str, List[str]]] = {
+        group: {"added": [], "removed": [], "changed": []}
+        for group in ("paths", "operations", "parameters", "schemas", "schemaFields")
+    }
+
+    def note(group: str, op: str, label: str) -> None:
+        bucket = summary[group][op]
+        if label not in bucket:
+            bucket.append(label)
+
+    for change in changes:
+        segments = change.pointer
+        if len(segments) >= 2 and segments[0] == "paths":
+            path = segments[1]
+            if len(segments) == 2:
+                note("paths", change.op, path)
+                # 경로가 통째로 추가/삭제되면 그 아래 오퍼레이션도 같은 변경으로 집계
+                source = after if change.op == "added" else before
+                path_node = source.children["paths"].children[path]
+                for method in path_node.children or {}:
+                    if method in HTTP_METHODS:
+                        note("operations", change.op, _operation_label(path, method))
+                continue
+            note("paths", "changed", path)
+            method = segments[2]
+            if method not in HTTP_METHODS:
+                continue
+            label = _operation_label(path, method)
+            if len(segments) == 3:
+                note("operations", change.op, label)
+                continue
+            note("operations", "changed", label)
+            if segments[3] == "parameters" and len(segments) >= 5:
+                op = change.op if len(segments) == 5 else "changed"
+                note("parameters", op, f"{label} {segments[4]}")
+        elif len(segments) >= 3 and segments[:2] == ("components", "schemas"):
+            name = segments[2]
+            if len(segments) == 3:
+                note("schemas", change.op, name)
+                continue
+            note("schemas", "changed", name)
+            if segments[3] == "properties" and len(segments) >= 5:
+                op = change.op if len(segments) == 5 else "changed"
+                note("schemaFields", op, f"{name}.{segments[4]}")
+    return {
+        group: {op: labels for op, labels in buckets.items() if labels}
+        for group, buckets in summary.items()
+        if any(buckets.values())
+    }
+
+
+def diff_specs(before: SpecIndex, after: SpecIndex, limit: int = 200) -> Dict[str, Any]:
+    """두 스펙 버전의 구조 비교 결과 (changes 는 최대 limit 건)"""
+    before_tree, after_tree = get_tree(before), get_tree(after)
+    stats = DiffStats()
+    diff_nodes(before_tree.root, after_tree.root, (), stats)
+    return {
+        "identical": not stats.changes,
+        "summary": summarize_changes(stats.changes, before_tree.root, after_tree.root),
+        "changes": [change.to_dict() for change in stats.changes[: max(0, limit)]],
+        "truncated": len(stats.changes) > limit,
+        "stats": {
+            "changes": len(stats.changes),
+            "nodesCompared": stats.compared,
+            "nodesBefore": before_tree.node_count,
+            "nodesAfter": after_tree.node_count,
+        },
+    }
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스펙 압축 모델 (__slots__ 클래스 + 문자열 인턴)
+- 스키마/필드/파라미터를 __slots__ 클래스로 표현 → 인스턴스마다 dict 를 두지 않음
+- 키·타입·포맷·설명 문자열("사용여부", "isUse", "int64" ...)은 sys.intern 으로 프로세스 전체에서 한 벌만 유지
+  (여러 도메인 스펙, 여러 버전이 같은 문자열 객체를 공유)
+- 스펙 원본 JSON 파싱 자체도 intern_strings() 로 문자열 값을 인턴해 중첩 dict 의 중복 문자열 제거
+- 예시값(example)은 모델에 두지 않음 (필요하면 원본 스펙/리소스에서 조회)
+- 스펙 저장소가 유지하는 표현은 이 모델들 + 원문 bytes (원본 중첩 dict 는 인덱스 구성 후 버림)
+"""
+
+import sys
+from typing import Any, Dict, Optional, Tuple
+
+REF_PREFIX = "#/components/schemas/"
+
+# 이 길이 이하 문자열만 인턴 (긴 설명 문장은 중복 가능성이 낮아 인턴 테이블만 키움)
+INTERN_MAX_LENGTH = 128
+
+# Field.constraints 로 옮기는 검증 제약
+CONSTRAINT_KEYS = ("maxLength", "minLength", "minimum", "maximum", "pattern", "enum", "minItems", "maxItems")
+
+_intern = sys.intern
+
+
+def intern_strings(node: Any) -> Any:
+    """json.loads 결과의 짧은 문자열 값을 제자리에서 인턴 (키는 json 모듈이 한 번의 loads 안에서 이미 공유)"""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if type(current) is dict:
+            for key, value in current.items():
+                if type(value) is str:
+                    if len(value) <= INTERN_MAX_LENGTH:
+                        current[key] = _intern(value)
+                elif type(value) in (dict, list):
+                    stack.append(value)
+        elif type(current) is list:
+            for position, value in enumerate(current):
+                if type(value) is str:
+                    if len(value) <= INTERN_MAX_LENGTH:
+                        current[position] = _intern(value)
+                elif type(value) in (dict, list):
+                    stack.append(value)
+    return node
+
+
+def _maybe_intern(value: Any) -> Any:
+    return _intern(value) if type(value) is str and len(value) <= INTERN_MAX_LENGTH else value
+
+
+def type_label(schema: Any) -> str:
+    """스키마 노드 → 짧은 타입 표기 (MoldInstanceDto, string, integer(int64), string[] ...)"""
+    if not isinstance(schema, dict):
+        return "any"
+    ref = schema.get("$ref")
+    if isinstance(ref, str) and ref.startswith(REF_PREFIX):
+        return _intern(ref[len(REF_PREFIX):])
+    kind = schema.get("type")
+    if kind == "array":
+        return _intern(type_label(schema.get("items", {})) + "[]")
+    if kind is None:
+        if "properties" in schema:
+            return "object"
+        for combinator in ("allOf", "oneOf", "anyOf"):
+            if schema.get(combinator):
+                joiner = " & " if combinator == "allOf" else " | "
+                return _intern(joiner.join(type_label(member) for member in schema[combinator]))
+        return "any"
+    fmt = schema.get("format")
+    return _intern(f"{kind}({fmt})" if fmt else kind)
+
+
+class Field:
+    """스키마 속성 한 개"""
+
+    __slots__ = ("name", "type", "description", "required", "nullable", "constraints")
+
+    def __init__(self, name: str, schema: Dict[str, Any], required: bool) -> None:
+        self.name = _intern(name)
+        self.type = type_label(schema)
+        self.description = _maybe_intern(schema.get("description", ""))
+        self.required = required
+        self.nullable = bool(schema.get("nullable", False))
+        self.constraints: Tuple[Tuple[str, Any], ...] = tuple(
+            (_intern(key), _freeze(schema[key])) for key in CONSTRAINT_KEYS if key in schema
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {"name": self.name, "type": self.type, "required": self.required}
+        if self.nullable:
+            entry["nullable"] = True
+        if self.description:
+            entry["description"] = self.description
+        if self.constraints:
+            entry.update({key: list(value) if isinstance(value, tuple) else value for key, value in self.constraints})
+        return entry
+
+
+class Schema:
+    """components.schemas 항목 한 개"""
+
+    __slots__ = ("name", "type", "title", "description", "fields")
+
+    def __init__(self, name: str, schema: Dict[str, Any]) -> None:
+        required = set(schema.get("required") or ())
+        self.name = _intern(name)
+        self.type = type_label(schema)
+        self.title = _maybe_intern(schema.get("title", ""))
+        self.description = _maybe_intern(schema.get("description", ""))
+        self.fields: Tuple[Field, ...] = tuple(
+            Field(key, value if isinstance(value, dict) else {}, key in required)
+            for key, value in (schema.get("properties") or {}).items()
+        )
+
+    def field(self, name: str) -> Optional[Field]:
+        for item in self.fields:
+            if item.name == name:
+                return item
+        return None
+
+
+class Parameter:
+    """오퍼레이션 파라미터 한 개 (path / query / header)"""
+
+    __slots__ = ("name", "location", "type", "required", "description")
+
+    def __init__(self, raw: Dict[str, Any]) -> None:
+        self.name = _intern(str(raw.get("name", "")))
+        self.location = _intern(str(raw.get("in", "")))
+        self.type = type_label(raw.get("schema", {}))
+        self.required = bool(raw.get("required", False))
+        self.description = _maybe_intern(raw.get("description", ""))
+
+    def to_dict(self) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {"name": self.name, "in": self.location, "type": self.type, "required": self.required}
+        if self.description:
+            entry["description"] = self.description
+        return entry
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_maybe_intern(item) for item in value)
+    return _maybe_intern(value)
+
+
+def build_parameters(raw_parameters: Any) -> Tuple[Parameter, ...]:
+    if not isinstance(raw_parameters, list):
+        return ()
+    return tuple(Parameter(raw) for raw in raw_parameters if isinstance(raw, dict))
+
+
+def build_schemas(schemas: Dict[str, Any]) -> Dict[str, Schema]:
+    return {_intern(name): Schema(name, schema if isinstance(schema, dict) else {}) for name, schema in schemas.items()}
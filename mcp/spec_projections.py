@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스펙 툴 응답 투영(projection) - 응답 바이트(토큰)를 줄이기 위한 가벼운 형태
+- names       : 이름만 (스키마 → 필드 이름 목록, 오퍼레이션 → "GET /path")
+- names+types : 이름 + 타입 (스키마 → {필드: 타입} + required, 오퍼레이션 → 파라미터 타입/요청·응답 스키마)
+- full        : 전체 (스키마 → $ref 펼친 결과, 오퍼레이션 → 모든 속성 + 파라미터)
+- 가벼운 두 형태는 압축 모델(spec_model)에서 스키마/오퍼레이션별로 한 번만 만들어 내용 해시 단위로 캐시
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from server_metrics import METRICS
+from spec_store import Operation, SpecIndex, on_spec_evicted
+
+NAMES, TYPES, FULL = "names", "names+types", "full"
+PROJECTIONS = (NAMES, TYPES, FULL)
+
+
+def check_projection(projection: str) -> str:
+    if projection not in PROJECTIONS:
+        raise ValueError(f"projection 은 {', '.join(PROJECTIONS)} 중 하나여야 합니다: {projection}")
+    return projection
+
+
+def operation_label(operation: Operation) -> str:
+    return f"{operation.method.upper()} {operation.path}"
+
+
+class SpecProjections:
+    """스펙 한 건(내용 해시)의 투영 캐시"""
+
+    def __init__(self, index: SpecIndex) -> None:
+        self.index = index
+        self._schemas: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._operations: Dict[Tuple[int, str], Any] = {}
+        self._positions = {id(operation): position for position, operation in enumerate(index.operations)}
+
+    def schema(self, name: str, projection: str) -> Dict[str, Any]:
+        """names / names+types 스키마 투영 (full 은 schema_resolver 몫)"""
+        key = (name, projection)
+        cached = self._schemas.get(key)
+        if cached is not None:
+            METRICS.cache_hit("spec_projections")
+            return cached
+        model = self.index.schema_models.get(name)
+        if model is None:
+            raise ValueError(f"스키마를 찾을 수 없습니다: {name}")
+        METRICS.cache_miss("spec_projections")
+        if projection == NAMES:
+            result: Dict[str, Any] = {"name": model.name, "fields": [field.name for field in model.fields]}
+        else:
+            result = {
+                "name": model.name,
+                "type": model.type,
+                "fields": {field.name: field.type for field in model.fields},
+                "required": [field.name for field in model.fields if field.required],
+            }
+            if model.description:
+                result["description"] = model.description
+        self._schemas[key] = result
+        return result
+
+    def operation(self, operation: Operation, projection: str) -> Any:
+        position = self._positions[id(operation)]
+        key = (position, projection)
+        cached = self._operations.get(key)
+        if cached is not None:
+            METRICS.cache_hit("spec_projections")
+            return cached
+        METRICS.cache_miss("spec_projections")
+        if projection == NAMES:
+            result: Any = operation_label(operation)
+        elif projection == TYPES:
+            result = {"operation": operation_label(operation), "operationId": operation.operation_id}
+            if operation.parameters:
+                result["parameters"] = {
+                    f"{parameter.location}:{parameter.name}": parameter.type for parameter in operation.parameters
+                }
+            if operation.request_schemas:
+                result["request"] = list(operation.request_schemas)
+            if operation.response_schemas:
+                result["response"] = list(operation.response_schemas)
+        else:
+            result = {**operation.to_dict(), "parameters": [parameter.to_dict() for parameter in operation.parameters]}
+        self._operations[key] = result
+        return result
+
+    def operations(self, operations: List[Operation], projection: str) -> List[Any]:
+        return [self.operation(operation, projection) for operation in operations]
+
+
+_projections: Dict[str, SpecProjections] = {}
+
+
+@on_spec_evicted
+def _evict_projections(content_hash: str) -> None:
+    _projections.pop(content_hash, None)
+
+
+def get_projections(index: SpecIndex) -> SpecProjections:
+    """스펙 내용 해시별 투영 캐시 (같은 스펙을 공유하는 도메인은 캐시도 공유)"""
+    projections: Optional[SpecProjections] = _projections.get(index.content_hash)
+    if projections is None or projections.index is not index:
+        projections = SpecProjections(index)
+        _projections[index.content_hash] = projections
+    return projections
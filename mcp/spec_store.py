@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+OpenAPI 스펙 저장소 (인메모리 인덱스)
+- Swagger/OpenAPI JSON 을 한 번만 파싱하고 태그/경로/HTTP 메서드/operationId/스키마 이름 인덱스 구성
+- 스키마를 요청·응답으로 참조하는 오퍼레이션 역인덱스 제공
+- 같은 내용의 파일은 내용 해시(SHA-256)로 감지해 한 번만 로드
+- 파싱 결과의 짧은 문자열은 인턴, 오퍼레이션/파라미터/스키마 필드는 __slots__ 모델 (spec_model)
+- 유지하는 표현은 모델 + 인덱스 + 원문 bytes 뿐 - 중첩 dict 는 인덱스를 만든 뒤 버리고, 원본 JSON 이 필요한
+  툴(리소스 본문, $ref 해석, 생성기, diff)은 SpecIndex.spec 으로 원문에서 다시 파싱 (최근 SPEC_DICT_CACHE 개만 캐시)
+- 도메인별로 로드된 버전(내용 해시) 이력을 최근 MAX_SPEC_VERSIONS 개까지 보관 (diff_swagger 비교 대상)
+- 이력에서 빠져 해제된 버전은 on_spec_evicted 로 등록한 콜백에 알림 → 내용 해시로 키를 잡은 파생 캐시도 함께 해제
+- 시작 시 로컬 스펙 파일 다음으로 오프라인 스냅샷(snapshot_store)의 도메인별 최신 스펙을 로드 → 네트워크 없이 응답
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from server_metrics import METRICS
+from spec_model import Parameter, Schema, build_parameters, build_schemas, intern_strings
+
+if TYPE_CHECKING:
+    from snapshot_store import SnapshotStore
+
+logger = logging.getLogger("unified-project-info-mcp.specs")
+
+# mcp 디렉토리
+MCP_DIR = Path(__file__).parent
+
+# 로컬 스펙 파일 (도메인, 파일 경로) - 같은 내용의 파일은 해시로 중복 제거
+LOCAL_SPEC_FILES: List[Tuple[str, Path]] = [
+    ("primes_mold", MCP_DIR / "mold_api.json"),
+    ("primes_mold", MCP_DIR / "mold_api_python.json"),
+]
+
+HTTP_METHODS = ("get", "put", "post", "delete", "patch", "options", "head", "trace")
+
+REF_PREFIX = "#/components/schemas/"
+
+# 도메인별 보관할 스펙 버전 수 (오래된 버전은 다른 도메인이 쓰지 않으면 메모리에서 해제)
+MAX_SPEC_VERSIONS = int(os.getenv("MAX_SPEC_VERSIONS", "8"))
+
+# 원문에서 다시 파싱한 스펙 dict 를 들고 있을 개수 (연속된 툴 호출이 같은 스펙을 매번 파싱하지 않을 만큼만, 0 이면 캐시 안 함)
+SPEC_DICT_CACHE = int(os.getenv("SPEC_DICT_CACHE", "2"))
+
+
+@dataclass(frozen=True, slots=True)
+class Operation:
+    """오퍼레이션 한 건 (경로 + 메서드)"""
+
+    method: str
+    path: str
+    operation_id: str
+    summary: str
+    tags: Tuple[str, ...]
+    request_schemas: Tuple[str, ...]
+    response_schemas: Tuple[str, ...]
+    parameters: Tuple[Parameter, ...] = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "method": self.method.upper(),
+            "path": self.path,
+            "operationId": self.operation_id,
+            "summary": self.summary,
+            "tags": list(self.tags),
+            "requestSchemas": list(self.request_schemas),
+            "responseSchemas": list(self.response_schemas),
+        }
+
+
+def schema_refs(node: Any) -> List[str]:
+    """인라인 스키마 안의 $ref 스키마 이름 수집 (참조는 따라가지 않음, 등장 순서 유지)"""
+    found: List[str] = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            ref = current.get("$ref")
+            if isinstance(ref, str) and ref.startswith(REF_PREFIX):
+                name = ref[len(REF_PREFIX):]
+                if name not in found:
+                    found.append(name)
+            stack.extend(reversed(list(current.values())))
+        elif isinstance(current, list):
+            stack.extend(reversed(current))
+    return found
+
+
+@dataclass
+class SpecIndex:
+    """파싱된 스펙 한 건의 인덱스 (모델 + 원문 bytes 만 유지, 원본 dict 는 spec 으로 필요할 때 다시 파싱)"""
+
+    content_hash: str
+    title: str = ""
+    version: str = ""
+    openapi: str = ""
+    servers: Tuple[str, ...] = ()
+    sources: List[str] = field(default_factory=list)
+    operations: List[Operation] = field(default_factory=list)
+    by_tag: Dict[str, List[int]] = field(default_factory=dict)
+    by_path: Dict[str, List[int]] = field(default_factory=dict)
+    by_method: Dict[str, List[int]] = field(default_factory=dict)
+    by_operation_id: Dict[str, List[int]] = field(default_factory=dict)
+    by_request_schema: Dict[str, List[int]] = field(default_factory=dict)
+    by_response_schema: Dict[str, List[int]] = field(default_factory=dict)
+    schema_models: Dict[str, Schema] = field(default_factory=dict)
+    tag_descriptions: Dict[str, str] = field(default_factory=dict)
+    # 로드한 원문 그대로 (전체 스펙 리소스/청크 읽기는 재직렬화 없이, 원본 dict 는 여기서 다시 파싱)
+    raw: bytes = field(default=b"", repr=False)
+
+    @classmethod
+    def build(cls, spec: Dict[str, Any], content_hash: str, raw: bytes) -> "SpecIndex":
+        """스펙 dict 를 한 번 순회해 모든 인덱스와 모델 구성 (spec 은 보관하지 않음 - raw 가 같은 내용의 원문)"""
+        info = spec.get("info", {})
+        index = cls(
+            content_hash=content_hash,
+            title=info.get("title", ""),
+            version=info.get("version", ""),
+            openapi=spec.get("openapi", ""),
+            servers=tuple(str(server.get("url", "")) for server in spec.get("servers") or () if isinstance(server, dict)),
+            raw=raw,
+        )
+        index.schema_models = build_schemas(spec.get("components", {}).get("schemas", {}))
+        index.tag_descriptions = {
+            tag["name"]: tag.get("description", "") for tag in spec.get("tags", []) if "name" in tag
+        }
+
+        for path, path_item in spec.get("paths", {}).items():
+            for method in HTTP_METHODS:
+                raw_operation = path_item.get(method)
+                if raw_operation is None:
+                    continue
+                request_refs = schema_refs(raw_operation.get("requestBody", {}))
+                for name in schema_refs(raw_operation.get("parameters", [])):
+                    if name not in request_refs:
+                        request_refs.append(name)
+                operation = Operation(
+                    method=method,
+                    path=path,
+                    operation_id=raw_operation.get("operationId", ""),
+                    summary=raw_operation.get("summary", ""),
+                    tags=tuple(raw_operation.get("tags", [])),
+                    request_schemas=tuple(request_refs),
+                    response_schemas=tuple(schema_refs(raw_operation.get("responses", {}))),
+                    parameters=build_parameters(raw_operation.get("parameters")),
+                )
+                index._add(operation)
+        return index
+
+    def _add(self, operation: Operation) -> None:
+        position = len(self.operations)
+        self.operations.append(operation)
+        for tag in operation.tags:
+            self.by_tag.setdefault(tag, []).append(position)
+        self.by_path.setdefault(operation.path, []).append(position)
+        self.by_method.setdefault(operation.method, []).append(position)
+        if operation.operation_id:
+            self.by_operation_id.setdefault(operation.operation_id, []).append(position)
+        for name in operation.request_schemas:
+            self.by_request_schema.setdefault(name, []).append(position)
+        for name in operation.response_schemas:
+            self.by_response_schema.setdefault(name, []).append(position)
+
+    @property
+    def spec(self) -> Dict[str, Any]:
+        """원본 스펙 dict - 원문에서 다시 파싱 (최근 SPEC_DICT_CACHE 개 공유 캐시, 반환값은 수정 금지)"""
+        return _parsed_spec(self.content_hash, self.raw)
+
+    @property
+    def schemas(self) -> Dict[str, Dict[str, Any]]:
+        """components.schemas 원본 dict (spec 과 같은 캐시 - 이름/필드만 필요하면 schema_models)"""
+        return self.spec.get("components", {}).get("schemas", {})
+
+    def find_operations(
+        self,
+        tag: Optional[str] = None,
+        method: Optional[str] = None,
+        path: Optional[str] = None,
+        operation_id: Optional[str] = None,
+    ) -> List[Operation]:
+        """조건(AND)에 맞는 오퍼레이션 조회 - 인덱스 교집합만 계산"""
+        candidates: List[Iterable[int]] = []
+        if tag is not None:
+            candidates.append(self.by_tag.get(tag, ()))
+        if method is not None:
+            candidates.append(self.by_method.get(method.lower(), ()))
+        if path is not None:
+            candidates.append(self.by_path.get(path, ()))
+        if operation_id is not None:
+            candidates.append(self.by_operation_id.get(operation_id, ()))
+        return self._select(candidates)
+
+    def operations_using_schema(self, name: str, direction: str = "response") -> List[Operation]:
+        """스키마를 요청(request)/응답(response)/양쪽(any)으로 직접 참조하는 오퍼레이션"""
+        if direction == "request":
+            positions: Iterable[int] = self.by_request_schema.get(name, ())
+        elif direction == "response":
+            positions = self.by_response_schema.get(name, ())
+        elif direction == "any":
+            positions = set(self.by_request_schema.get(name, ())) | set(self.by_response_schema.get(name, ()))
+        else:
+            raise ValueError(f"direction 은 request, response, any 중 하나여야 합니다: {direction}")
+        return [self.operations[position] for position in sorted(positions)]
+
+    def _select(self, candidates: List[Iterable[int]]) -> List[Operation]:
+        if not candidates:
+            return list(self.operations)
+        ordered = sorted((set(positions) for positions in candidates), key=len)
+        selected: Set[int] = ordered[0].intersection(*ordered[1:])
+        return [self.operations[position] for position in sorted(selected)]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "title": self.title,
+            "version": self.version,
+            "openapi": self.openapi,
+            "contentHash": self.content_hash,
+            "sources": list(self.sources),
+            "paths": len(self.by_path),
+            "operations": len(self.operations),
+            "tags": len(self.by_tag),
+            "schemas": len(self.schema_models),
+        }
+
+
+# 해제된 스펙 내용 해시 알림 (해석기/투영/리소스 본문 등 내용 해시 단위 캐시가 모듈 로드 시 등록)
+EvictionListener = Callable[[str], None]
+_eviction_listeners: List[EvictionListener] = []
+
+
+def on_spec_evicted(listener: EvictionListener) -> EvictionListener:
+    """스펙 버전이 이력 한도를 넘어 해제될 때 내용 해시로 호출할 콜백 등록"""
+    _eviction_listeners.append(listener)
+    return listener
+
+
+# 원문에서 다시 파싱한 스펙 dict (LRU, 툴 스레드에서 동시에 접근)
+_parsed: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_parsed_lock = threading.Lock()
+
+
+def _parsed_spec(content_hash: str, raw: bytes) -> Dict[str, Any]:
+    with _parsed_lock:
+        spec = _parsed.get(content_hash)
+        if spec is not None:
+            _parsed.move_to_end(content_hash)
+            METRICS.cache_hit("spec_dict")
+            return spec
+    METRICS.cache_miss("spec_dict")
+    # 잠금 밖에서 파싱 (같은 스펙을 두 스레드가 동시에 파싱하면 나중 결과가 캐시에 남을 뿐)
+    spec = json.loads(raw)
+    if SPEC_DICT_CACHE > 0:
+        with _parsed_lock:
+            _parsed[content_hash] = spec
+            _parsed.move_to_end(content_hash)
+            while len(_parsed) > SPEC_DICT_CACHE:
+                _parsed.popitem(last=False)
+    return spec
+
+
+@on_spec_evicted
+def _evict_parsed(content_hash: str) -> None:
+    with _parsed_lock:
+        _parsed.pop(content_hash, None)
+
+
+@dataclass(frozen=True)
+class SpecVersion:
+    """도메인에 로드된 스펙 버전 한 건"""
+
+    content_hash: str
+    source: str
+    loaded_at: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"contentHash": self.content_hash, "source": self.source, "loadedAt": self.loaded_at}
+
+
+class SpecStore:
+    """도메인별 SpecIndex 저장소 (내용 해시 기준 중복 제거, 도메인별 버전 이력)"""
+
+    def __init__(self, max_versions: int = MAX_SPEC_VERSIONS) -> None:
+        self.max_versions = max(1, max_versions)
+        self._by_domain: Dict[str, SpecIndex] = {}
+        self._by_hash: Dict[str, SpecIndex] = {}
+        self._history: Dict[str, List[SpecVersion]] = {}
+
+    def load_file(self, domain: str, path: Path) -> SpecIndex:
+        """스펙 파일 로드 (같은 내용이 이미 로드됐으면 파싱 생략)"""
+        return self.load_bytes(domain, Path(path).read_bytes(), source=str(path))
+
+    def load_bytes(self, domain: str, data: bytes, source: str = "") -> SpecIndex:
+        """스펙 원문(bytes) 로드 - 해시가 같으면 기존 인덱스 재사용"""
+        content_hash = hashlib.sha256(data).hexdigest()
+        index = self._by_hash.get(content_hash)
+        if index is None:
+            index = self.parse(data, content_hash)
+        return self.install(domain, index, source)
+
+    @staticmethod
+    def parse(data: bytes, content_hash: Optional[str] = None) -> SpecIndex:
+        """스펙 원문 → 새 SpecIndex (저장소를 건드리지 않으므로 스레드에서 실행 가능)"""
+        if content_hash is None:
+            content_hash = hashlib.sha256(data).hexdigest()
+        return SpecIndex.build(intern_strings(json.loads(data)), content_hash, data)
+
+    def indexed(self, content_hash: str) -> Optional[SpecIndex]:
+        """이미 로드된 같은 내용의 인덱스 (없으면 None - parse 를 건너뛸 때 사용)"""
+        return self._by_hash.get(content_hash)
+
+    def install(self, domain: str, index: SpecIndex, source: str = "") -> SpecIndex:
+        """파싱된 인덱스를 도메인 현재 버전으로 교체 (저장소 변경은 여기서만 - 조회와 같은 스레드(이벤트 루프)에서 호출)"""
+        existing = self._by_hash.get(index.content_hash)
+        if existing is None:
+            METRICS.cache_miss("spec_store")
+            self._by_hash[index.content_hash] = index
+        else:
+            METRICS.cache_hit("spec_store")
+            index = existing
+        if source and source not in index.sources:
+            index.sources.append(source)
+        self._by_domain[domain] = index
+        self._record_version(domain, index.content_hash, source)
+        return index
+
+    def _record_version(self, domain: str, content_hash: str, source: str) -> None:
+        """현재 버전과 내용이 다를 때만 이력에 추가하고, 한도를 넘은 버전의 인덱스는 해제"""
+        history = self._history.setdefault(domain, [])
+        if history and history[-1].content_hash == content_hash:
+            return
+        history.append(SpecVersion(content_hash, source, time.time()))
+        dropped = history[: -self.max_versions]
+        del history[: -self.max_versions]
+        in_use = {version.content_hash for versions in self._history.values() for version in versions}
+        for version in dropped:
+            if version.content_hash not in in_use and self._by_hash.pop(version.content_hash, None) is not None:
+                for listener in _eviction_listeners:
+                    listener(version.content_hash)
+
+    def versions(self, domain: str) -> List[SpecVersion]:
+        """도메인 버전 이력 (오래된 순, 마지막이 현재 버전)"""
+        self.get(domain)
+        return list(self._history.get(domain, ()))
+
+    def get_version(self, domain: str, ref: str) -> SpecIndex:
+        """버전 참조로 스펙 조회 - current / previous / 이력 위치(0, -2 ..) / 내용 해시 앞부분(6자 이상)"""
+        history = self.versions(domain)
+        ref = ref.strip()
+        if ref == "current":
+            position = len(history) - 1
+        elif ref == "previous":
+            position = len(history) - 2
+            if position < 0:
+                raise ValueError(f"{domain} 에는 이전 버전이 없습니다 (로드된 버전 1개)")
+        elif ref.lstrip("-").isdigit() and len(ref.lstrip("-")) < 6:
+            position = int(ref) if int(ref) >= 0 else len(history) + int(ref)
+            if not 0 <= position < len(history):
+                raise ValueError(f"버전 위치가 범위를 벗어났습니다: {ref} (버전 {len(history)}개)")
+        else:
+            matches = [i for i, version in enumerate(history) if len(ref) >= 6 and version.content_hash.startswith(ref)]
+            if len(matches) != 1:
+                available = ", ".join(version.content_hash[:12] for version in history)
+                raise ValueError(f"{domain} 버전을 찾을 수 없습니다: {ref} (사용 가능: {available})")
+            position = matches[0]
+        return self._by_hash[history[position].content_hash]
+
+    def get(self, domain: str) -> SpecIndex:
+        """도메인 스펙 조회 (없으면 ValueError)"""
+        index = self._by_domain.get(domain)
+        if index is None:
+            available = ", ".join(sorted(self._by_domain)) or "(없음)"
+            raise ValueError(f"로드된 스펙이 없는 도메인입니다: {domain} (사용 가능: {available})")
+        return index
+
+    def domains(self) -> List[str]:
+        return sorted(self._by_domain)
+
+    def __contains__(self, domain: object) -> bool:
+        return domain in self._by_domain
+
+    @property
+    def parsed_count(self) -> int:
+        """실제로 파싱한 고유 스펙 수"""
+        return len(self._by_hash)
+
+
+def load_local_specs(store: Optional[SpecStore] = None) -> SpecStore:
+    """LOCAL_SPEC_FILES 중 존재하는 파일을 저장소에 로드"""
+    store = store if store is not None else SpecStore()
+    for domain, path in LOCAL_SPEC_FILES:
+        if path.exists():
+            store.load_file(domain, path)
+    return store
+
+
+def load_snapshot_specs(store: SpecStore, snapshots: Optional["SnapshotStore"] = None) -> SpecStore:
+    """오프라인 스냅샷의 도메인별 최신 스펙 로드 (스냅샷이 없는 도메인의 로컬 스펙 파일은 시드 스냅샷으로 저장)"""
+    from snapshot_store import get_snapshot_store
+
+    snapshots = snapshots if snapshots is not None else get_snapshot_store()
+    for domain, path in LOCAL_SPEC_FILES:
+        if domain not in snapshots and path.exists():
+            snapshots.put(domain, path.read_bytes(), source=f"seed:{path.name}")
+    for domain in snapshots.domains():
+        entry = snapshots.latest(domain)
+        if entry is None or (domain in store and store.get(domain).content_hash == entry.content_hash):
+            continue
+        try:
+            store.load_bytes(domain, snapshots.read(entry.content_hash), source=f"snapshot:{entry.content_hash[:12]}")
+        except ValueError as exc:
+            # 손상된 객체 등 - 해당 도메인만 건너뛰고 나머지는 계속 로드
+            logger.warning("스냅샷 로드 실패 %s: %s", domain, exc)
+    return store
+
+
+_default_store: Optional[SpecStore] = None
+
+
+def get_spec_store() -> SpecStore:
+    """프로세스 공용 스펙 저장소 (첫 호출 시 로컬 스펙 파일 + 오프라인 스냅샷을 한 번만 로드)"""
+    global _default_store
+    if _default_store is None:
+        _default_store = load_snapshot_specs(load_local_specs())
+    return _default_store
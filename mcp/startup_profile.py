@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+시작 시간 프로파일러
+- 서버 모듈 로드 시점부터 단계별(import, 등록, 첫 응답) 경과 시간 기록
+- --profile-startup 실행 시 stderr 로 표 출력 (stdout 은 stdio 프로토콜 전용)
+"""
+
+import sys
+import time
+from typing import List, TextIO, Tuple
+
+
+class StartupProfiler:
+    """단계별 경과 시간 기록기"""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self._last = self.started
+        self.phases: List[Tuple[str, float]] = []
+
+    def mark(self, phase: str) -> None:
+        """직전 mark 이후 경과 시간을 phase 이름으로 기록"""
+        now = time.perf_counter()
+        self.phases.append((phase, (now - self._last) * 1000))
+        self._last = now
+
+    @property
+    def total_ms(self) -> float:
+        return (self._last - self.started) * 1000
+
+    def report(self, stream: TextIO = sys.stderr) -> None:
+        width = max((len(phase) for phase, _ in self.phases), default=10)
+        stream.write(f"{'phase':<{width}}  {'ms':>8}  {'total':>8}\n")
+        cumulative = 0.0
+        for phase, elapsed in self.phases:
+            cumulative += elapsed
+            stream.write(f"{phase:<{width}}  {elapsed:>8.1f}  {cumulative:>8.1f}\n")
+        stream.write("(인터프리터 기동 시간 제외 - 전체 콜드 스타트는 benchmarks/bench_cold_start.py)\n")
+        stream.flush()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Swagger 스펙 비동기 수집기
+- 하나의 커넥션 풀(httpx.AsyncClient)로 모든 도메인 스펙을 동시에 수집
+- URL 별 디스크 캐시 (본문 + ETag/Last-Modified 메타데이터)
+- 조건부 요청(If-None-Match / If-Modified-Since)으로 재검증 → 변경 없으면 304
+- 같은 URL 수집이 동시에 여러 번 요청되면(세션 여러 개의 refresh 등) 요청 1회만 보내고 결과 공유
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+import httpx
+
+from atomic_files import atomic_write
+from server_metrics import METRICS
+from single_flight import SingleFlight
+
+# 기본 캐시 디렉토리 (환경변수로 오버라이드 가능)
+DEFAULT_CACHE_DIR = Path(os.getenv("SWAGGER_CACHE_DIR", str(Path(__file__).parent / ".cache" / "swagger")))
+
+
+@dataclass
+class CacheMeta:
+    """캐시 메타데이터 (URL 한 건)"""
+
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_hash: str
+    size: int
+    fetched_at: float
+    validated_at: float
+
+
+@dataclass
+class FetchResult:
+    """도메인 한 건의 수집 결과"""
+
+    domain: str
+    url: str
+    status: str  # fetched | not_modified | error
+    body: Optional[bytes] = None
+    content_hash: Optional[str] = None
+    http_status: Optional[int] = None
+    bytes_received: int = 0
+    elapsed_ms: float = 0.0
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "domain": self.domain,
+            "url": self.url,
+            "status": self.status,
+            "httpStatus": self.http_status,
+            "contentHash": self.content_hash,
+            "bytesReceived": self.bytes_received,
+            "elapsedMs": round(self.elapsed_ms, 1),
+            "error": self.error,
+        }
+
+
+class SwaggerDiskCache:
+    """URL 해시를 키로 하는 스펙 디스크 캐시"""
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR) -> None:
+        self.cache_dir = Path(cache_dir)
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.meta.json"
+
+    def load_meta(self, url: str) -> Optional[CacheMeta]:
+        _, meta_path = self._paths(url)
+        try:
+            return CacheMeta(**json.loads(meta_path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def load_body(self, url: str) -> Optional[bytes]:
+        body_path, _ = self._paths(url)
+        try:
+            return body_path.read_bytes()
+        except OSError:
+            return None
+
+    def store(self, url: str, body: bytes, etag: Optional[str], last_modified: Optional[str]) -> CacheMeta:
+        """본문과 메타데이터 저장 (임시 파일 → rename 으로 원자적 교체)"""
+        now = time.time()
+        meta = CacheMeta(
+            url=url,
+            etag=etag,
+            last_modified=last_modified,
+            content_hash=hashlib.sha256(body).hexdigest(),
+            size=len(body),
+            fetched_at=now,
+            validated_at=now,
+        )
+        body_path, meta_path = self._paths(url)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        atomic_write(body_path, body)
+        atomic_write(meta_path, json.dumps(asdict(meta), ensure_ascii=False).encode("utf-8"))
+        return meta
+
+    def mark_validated(self, meta: CacheMeta) -> None:
+        """304 응답 시 재검증 시각만 갱신"""
+        meta.validated_at = time.time()
+        _, meta_path = self._paths(meta.url)
+        atomic_write(meta_path, json.dumps(asdict(meta), ensure_ascii=False).encode("utf-8"))
+
+
+class SwaggerFetcher:
+    """풀링된 HTTP 클라이언트로 Swagger 스펙을 동시에 수집/재검증"""
+
+    def __init__(
+        self,
+        cache: Optional[SwaggerDiskCache] = None,
+        timeout: float = 30.0,
+        max_connections: int = 8,
+    ) -> None:
+        self.cache = cache if cache is not None else SwaggerDiskCache()
+        self.timeout = timeout
+        self.limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        self._flights = SingleFlight("singleflight:swagger_fetch")
+
+    def create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(timeout=self.timeout, limits=self.limits, follow_redirects=True)
+
+    async def fetch_all(self, urls: Dict[str, str], client: Optional[httpx.AsyncClient] = None) -> Dict[str, FetchResult]:
+        """도메인 → URL 전체를 하나의 클라이언트로 동시 수집"""
+        if client is None:
+            async with self.create_client() as owned_client:
+                return await self.fetch_all(urls, owned_client)
+
+        results = await asyncio.gather(*(self.fetch(client, domain, url) for domain, url in urls.items()))
+        return {result.domain: result for result in results}
+
+    async def fetch(self, client: httpx.AsyncClient, domain: str, url: str) -> FetchResult:
+        """스펙 한 건 수집 - 같은 (도메인, URL) 수집이 진행 중이면 그 결과를 함께 사용"""
+        return await self._flights.do((domain, url), lambda: self._fetch(client, domain, url))
+
+    async def _fetch(self, client: httpx.AsyncClient, domain: str, url: str) -> FetchResult:
+        """스펙 한 건 수집 (캐시가 있으면 조건부 요청)"""
+        started = time.perf_counter()
+        meta = self.cache.load_meta(url)
+        cached_body = self.cache.load_body(url) if meta is not None else None
+
+        headers: Dict[str, str] = {"Accept": "application/json"}
+        if cached_body is not None:
+            if meta.etag:
+                headers["If-None-Match"] = meta.etag
+            if meta.last_modified:
+                headers["If-Modified-Since"] = meta.last_modified
+
+        try:
+            response = await client.get(url, headers=headers)
+        except httpx.HTTPError as exc:
+            return FetchResult(
+                domain=domain,
+                url=url,
+                status="error",
+                body=cached_body,
+                content_hash=meta.content_hash if cached_body is not None else None,
+                elapsed_ms=(time.perf_counter() - started) * 1000,
+                error=f"{type(exc).__name__}: {exc}",
+            )
+
+        if response.status_code == 304 and cached_body is not None:
+            METRICS.cache_hit("swagger_http")
+            self.cache.mark_validated(meta)
+            return FetchResult(
+                domain=domain,
+                url=url,
+                status="not_modified",
+                body=cached_body,
+                content_hash=meta.content_hash,
+                http_status=304,
+                elapsed_ms=(time.perf_counter() - started) * 1000,
+            )
+
+        if response.status_code != 200:
+            return FetchResult(
+                domain=domain,
+                url=url,
+                status="error",
+                body=cached_body,
+                content_hash=meta.content_hash if cached_body is not None else None,
+                http_status=response.status_code,
+                elapsed_ms=(time.perf_counter() - started) * 1000,
+                error=f"HTTP {response.status_code}",
+            )
+
+        METRICS.cache_miss("swagger_http")
+        body = response.content
+        stored = self.cache.store(
+            url,
+            body,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return FetchResult(
+            domain=domain,
+            url=url,
+            status="fetched",
+            body=body,
+            content_hash=stored.content_hash,
+            http_status=200,
+            bytes_received=len(body),
+            elapsed_ms=(time.perf_counter() - started) * 1000,
+        )
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+TS export 심볼 인덱스 (트라이그램)
+- apps/*/src, packages/* 의 TS/TSX 파일에서 export 선언(Hook, 컴포넌트, 타입, 서비스, 함수, 상수)과 줄 번호 추출
+  (export default X; 는 X 선언 줄, `export { ... } from` 재수출은 원본 파일에서 잡히므로 제외)
+- 소문자 이름의 3-gram 역색인 → 부분/오타 검색 (useMoldRepairList, MoldRepiar 등)
+- 파일별 (mtime, size) 로 추출 결과를 캐시해 .cache/symbol_index.pickle 에 저장 → 바뀐 파일만 다시 파싱하고
+  그 파일의 심볼만 역색인에서 교체
+- 변경 확인(파일 stat)은 SYMBOL_POLL_INTERVAL 초에 한 번만, 그 사이 조회는 메모리 역색인만 사용
+"""
+
+import bisect
+import heapq
+import os
+import pickle
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from atomic_files import atomic_pickle
+from server_metrics import METRICS
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_CACHE_PATH = Path(os.getenv("SYMBOL_INDEX_PATH", str(Path(__file__).parent / ".cache" / "symbol_index.pickle")))
+
+# 파일 변경 확인 주기 (초) - find_symbol 이 매번 트리 전체를 stat 하지 않도록
+SYMBOL_POLL_INTERVAL = float(os.getenv("SYMBOL_POLL_INTERVAL", "5"))
+
+SOURCE_SUFFIXES = (".ts", ".tsx")
+SKIP_DIRS = {"node_modules", "dist", "build", ".turbo", ".git", "coverage", "public"}
+
+SYMBOL_KINDS = ("hook", "component", "type", "service", "class", "function", "constant")
+
+# 질의 트라이그램 중 이 비율 이상을 공유하는 이름만 후보 (오타 1~2개 허용)
+MIN_TRIGRAM_OVERLAP = 0.4
+
+# 캐시 포맷 버전 (추출 규칙이 바뀌면 올려서 전체 재파싱)
+CACHE_FORMAT = 1
+
+_DECLARATION_RE = re.compile(
+    r"^export\s+(?:declare\s+)?(?:default\s+)?(?:async\s+)?"
+    r"(function\*?|const\s+enum|const|let|var|abstract\s+class|class|interface|type|enum)\s+([A-Za-z_$][\w$]*)",
+    re.M,
+)
+_DEFAULT_NAME_RE = re.compile(r"^export\s+default\s+([A-Za-z_$][\w$]*)\s*;?\s*$", re.M)
+_LOCAL_DECLARATION = r"^(?:const|let|var|function\*?|async\s+function|class|abstract\s+class)\s+{name}\b"
+
+
+@dataclass(frozen=True)
+class Symbol:
+    """export 심볼 한 개"""
+
+    name: str
+    kind: str  # hook | component | type | service | class | function | constant
+    line: int
+
+
+@dataclass
+class CachedFile:
+    mtime_ns: int
+    size: int
+    symbols: Tuple[Symbol, ...]
+
+
+def classify_symbol(name: str, declaration: str, relpath: str) -> str:
+    if declaration in ("interface", "type", "enum", "const enum"):
+        return "type"
+    if name.startswith("use") and name[3:4].isupper():
+        return "hook"
+    if name.endswith(("Service", "Api")) or "/services/" in relpath:
+        return "service"
+    if declaration.endswith("class"):
+        return "class"
+    if name[:1].isupper() and relpath.endswith(".tsx"):
+        return "component"
+    if declaration.startswith("function"):
+        return "function"
+    return "constant"
+
+
+def extract_symbols(relpath: str, text: str) -> Tuple[Symbol, ...]:
+    """파일 본문 → export 심볼 (줄 번호 1부터, 같은 이름은 첫 선언만)"""
+    line_starts = [0]
+    line_starts.extend(match.end() for match in re.finditer(r"\n", text))
+
+    def line_of(offset: int) -> int:
+        return bisect.bisect_right(line_starts, offset)
+
+    symbols: Dict[str, Symbol] = {}
+    for match in _DECLARATION_RE.finditer(text):
+        declaration = " ".join(match.group(1).split())
+        name = match.group(2)
+        if name not in symbols:
+            symbols[name] = Symbol(name, classify_symbol(name, declaration, relpath), line_of(match.start()))
+    for match in _DEFAULT_NAME_RE.finditer(text):
+        name = match.group(1)
+        if name in symbols:
+            continue
+        local = re.search(_LOCAL_DECLARATION.format(name=re.escape(name)), text, re.M)
+        declaration = " ".join(local.group(0).split()[:-1]) if local else "const"
+        offset = local.start() if local else match.start()
+        symbols[name] = Symbol(name, classify_symbol(name, declaration, relpath), line_of(offset))
+    return tuple(sorted(symbols.values(), key=lambda symbol: symbol.line))
+
+
+def trigrams(name: str) -> Set[str]:
+    """소문자 3-gram (3자 미만은 이름 전체 하나)"""
+    lowered = name.lower()
+    if len(lowered) < 3:
+        return {lowered}
+    return {lowered[i:i + 3] for i in range(len(lowered) - 2)}
+
+
+class SymbolIndex:
+    """파일별 심볼 캐시 + 이름 트라이그램 역색인"""
+
+    def __init__(self, root: Path = PROJECT_ROOT, cache_path: Path = DEFAULT_CACHE_PATH) -> None:
+        self.root = Path(root)
+        self.cache_path = Path(cache_path)
+        self.files: Dict[str, CachedFile] = {}
+        # 이름 → (파일, 심볼) 정의 목록, 트라이그램 → 이름 집합
+        self.definitions: Dict[str, List[Tuple[str, Symbol]]] = {}
+        self.postings: Dict[str, Set[str]] = {}
+        # 이름 → 트라이그램 수 (유사도 계산 시 다시 나누지 않도록)
+        self.gram_counts: Dict[str, int] = {}
+        self._checked_at: Optional[float] = None
+        self._load()
+
+    # ===== 저장 / 역색인 =====
+
+    def _load(self) -> None:
+        try:
+            with open(self.cache_path, "rb") as handle:
+                payload = pickle.load(handle)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return
+        if isinstance(payload, dict) and payload.get("format") == CACHE_FORMAT:
+            for relpath, cached in payload["files"].items():
+                self._add_file(relpath, cached)
+
+    def save(self) -> None:
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_pickle(self.cache_path, {"format": CACHE_FORMAT, "files": self.files})
+
+    def _add_file(self, relpath: str, cached: CachedFile) -> None:
+        self.files[relpath] = cached
+        for symbol in cached.symbols:
+            definitions = self.definitions.get(symbol.name)
+            if definitions is None:
+                definitions = self.definitions[symbol.name] = []
+                grams = trigrams(symbol.name)
+                self.gram_counts[symbol.name] = len(grams)
+                for gram in grams:
+                    self.postings.setdefault(gram, set()).add(symbol.name)
+            definitions.append((relpath, symbol))
+
+    def _remove_file(self, relpath: str) -> None:
+        cached = self.files.pop(relpath, None)
+        if cached is None:
+            return
+        for symbol in cached.symbols:
+            definitions = [item for item in self.definitions[symbol.name] if item[0] != relpath]
+            if definitions:
+                self.definitions[symbol.name] = definitions
+                continue
+            del self.definitions[symbol.name]
+            del self.gram_counts[symbol.name]
+            for gram in trigrams(symbol.name):
+                posting = self.postings[gram]
+                posting.discard(symbol.name)
+                if not posting:
+                    del self.postings[gram]
+
+    # ===== 변경 반영 =====
+
+    def iter_sources(self) -> Iterable[Tuple[str, os.stat_result]]:
+        """apps/*/src, packages/* 아래 (상대경로, stat) - .d.ts 제외"""
+        roots: List[str] = []
+        for group in ("apps", "packages"):
+            try:
+                with os.scandir(self.root / group) as entries:
+                    children = sorted(entry.name for entry in entries if entry.is_dir())
+            except FileNotFoundError:
+                continue
+            roots.extend(f"{group}/{child}/src" if group == "apps" else f"{group}/{child}" for child in children)
+        stack = list(reversed(roots))
+        while stack:
+            relpath = stack.pop()
+            try:
+                with os.scandir(self.root / relpath) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in SKIP_DIRS:
+                                stack.append(f"{relpath}/{entry.name}")
+                        elif entry.name.endswith(SOURCE_SUFFIXES) and not entry.name.endswith(".d.ts"):
+                            yield f"{relpath}/{entry.name}", entry.stat()
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+
+    def refresh(self) -> Dict[str, Any]:
+        """바뀐 파일만 다시 파싱해 역색인 교체 (통계 반환)"""
+        started = time.perf_counter()
+        stats = {"files": 0, "parsed": 0, "removed": 0}
+        seen: Set[str] = set()
+        for relpath, stat in self.iter_sources():
+            stats["files"] += 1
+            seen.add(relpath)
+            cached = self.files.get(relpath)
+            if cached is not None and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+                continue
+            try:
+                text = (self.root / relpath).read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                continue
+            self._remove_file(relpath)
+            self._add_file(relpath, CachedFile(stat.st_mtime_ns, stat.st_size, extract_symbols(relpath, text)))
+            stats["parsed"] += 1
+        for relpath in [relpath for relpath in self.files if relpath not in seen]:
+            self._remove_file(relpath)
+            stats["removed"] += 1
+
+        METRICS.cache_hit("symbol_index", stats["files"] - stats["parsed"])
+        METRICS.cache_miss("symbol_index", stats["parsed"])
+        if stats["parsed"] or stats["removed"]:
+            self.save()
+        self._checked_at = time.monotonic()
+        stats["symbols"] = len(self.definitions)
+        stats["elapsedMs"] = round((time.perf_counter() - started) * 1000, 1)
+        return stats
+
+    def ensure_fresh(self, max_age: float = SYMBOL_POLL_INTERVAL) -> Optional[Dict[str, Any]]:
+        """마지막 변경 확인이 max_age 초보다 오래됐으면 refresh (했으면 통계, 아니면 None)"""
+        if self._checked_at is not None and time.monotonic() - self._checked_at < max_age:
+            return None
+        return self.refresh()
+
+    # ===== 조회 =====
+
+    def find(
+        self,
+        query: str,
+        limit: int = 20,
+        kind: Optional[str] = None,
+        scope: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """이름 검색 (정확 일치 > 접두사 > 부분 문자열 > 트라이그램 유사도 순, kind/scope(경로 접두사) 필터)"""
+        lowered = query.strip().lower()
+        if not lowered:
+            raise ValueError("검색할 심볼 이름을 입력하세요")
+        query_grams = trigrams(lowered)
+        if len(lowered) < 3:
+            candidates = {name: 1 for name in self.definitions if lowered in name.lower()}
+        else:
+            counts: Counter = Counter()
+            for gram in query_grams:
+                counts.update(self.postings.get(gram, ()))
+            minimum = max(1, int(len(query_grams) * MIN_TRIGRAM_OVERLAP))
+            candidates = {name: shared for name, shared in counts.items() if shared >= minimum}
+        if kind or scope:
+            candidates = {
+                name: shared
+                for name, shared in candidates.items()
+                if any(_matches(relpath, symbol, kind, scope) for relpath, symbol in self.definitions[name])
+            }
+
+        def rank(name: str) -> Tuple[float, ...]:
+            name_lower = name.lower()
+            shared = candidates[name]
+            similarity = shared / (len(query_grams) + self.gram_counts[name] - shared)
+            return (
+                name_lower == lowered,
+                name_lower.startswith(lowered),
+                lowered in name_lower,
+                similarity,
+                -len(name),
+            )
+
+        results: List[Dict[str, Any]] = []
+        for name in heapq.nlargest(limit, candidates, key=rank):
+            score = rank(name)
+            for relpath, symbol in self.definitions[name]:
+                if not _matches(relpath, symbol, kind, scope):
+                    continue
+                results.append({
+                    "name": name,
+                    "kind": symbol.kind,
+                    "file": relpath,
+                    "line": symbol.line,
+                    "score": round(1.0 if score[0] else score[3], 3),
+                })
+                if len(results) >= limit:
+                    return results
+        return results
+
+    def __len__(self) -> int:
+        return len(self.definitions)
+
+
+def _matches(relpath: str, symbol: Symbol, kind: Optional[str], scope: Optional[str]) -> bool:
+    return (not kind or symbol.kind == kind) and (not scope or relpath.startswith(scope))
+
+
+_default_index: Optional[SymbolIndex] = None
+
+
+def get_symbol_index() -> SymbolIndex:
+    """프로세스 공용 심볼 인덱스 (저장본 로드 후 SYMBOL_POLL_INTERVAL 초마다 변경 파일 반영)"""
+    global _default_index
+    if _default_index is None:
+        _default_index = SymbolIndex()
+    _default_index.ensure_fresh()
+    return _default_index
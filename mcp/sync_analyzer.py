@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Swagger ↔ 코드 동기화 분석기
+- apps/{app}/src 의 TS/TSX 파일에서 interface/type 필드, export 이름(Hook/Service), API 경로 추출
+- 파일별 추출 결과는 내용 해시로 디스크 캐시 → 재실행 시 바뀐 파일만 다시 파싱
+- 다시 파싱할 파일이 많으면 프로세스 풀로 병렬 처리
+- 스펙 인덱스(태그 = 엔티티)와 비교해 누락 타입/필드 불일치/누락 Hook/미사용 엔드포인트 리포트
+"""
+
+import hashlib
+import os
+import pickle
+import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from atomic_files import atomic_pickle
+from server_metrics import METRICS
+from spec_store import SpecIndex, schema_refs
+
+# 프로젝트 루트 / 기본 캐시 파일
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_CACHE_PATH = Path(os.getenv("SYNC_CACHE_PATH", str(Path(__file__).parent / ".cache" / "sync_analyzer.pickle")))
+
+SOURCE_SUFFIXES = (".ts", ".tsx")
+SKIP_DIRS = {"node_modules", "dist", "build", ".turbo", ".git", "coverage"}
+
+# 이 수 이상 다시 파싱해야 할 때만 프로세스 풀 사용 (풀 기동 비용 > 소량 파싱 비용)
+PARALLEL_THRESHOLD = 64
+
+# 캐시 포맷 버전 (추출 규칙이 바뀌면 올려서 전체 재파싱)
+CACHE_FORMAT = 1
+
+# 엔티티 스키마가 아닌 공통 래퍼 스키마
+WRAPPER_PREFIXES = ("CommonResponse", "Page")
+IGNORED_SCHEMAS = {"PageableObject", "SortObject", "CommonResponseObject", "CommonResponseListObject"}
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/|//[^\n]*", re.S)
+_TYPE_DECL_RE = re.compile(r"export\s+(?:interface|type)\s+(\w+)(?:\s*<[^>{]*>)?[^{=;]*=?\s*\{")
+_NESTED_BLOCK_RE = re.compile(r"\{[^{}]*\}")
+_FIELD_RE = re.compile(r"^\s*(?:readonly\s+)?['\"]?(\w+)['\"]?\??\s*:", re.M)
+_EXPORT_RE = re.compile(r"export\s+(?:default\s+)?(?:async\s+)?(?:const|let|function|class)\s+(\w+)")
+_ENDPOINT_RE = re.compile(r"(?:FetchApi\w*|\.(?:get|post|put|patch|delete))\(\s*(['\"`])(.+?)\1")
+_TEMPLATE_PARAM_RE = re.compile(r"\$\{[^}]*\}|\{[^}/]*\}")
+
+
+@dataclass
+class FileFacts:
+    """TS 파일 한 개에서 추출한 정보"""
+
+    kind: str  # hook | service | type | other
+    types: Dict[str, Tuple[str, ...]] = field(default_factory=dict)
+    exports: Tuple[str, ...] = ()
+    endpoints: Tuple[str, ...] = ()
+
+
+@dataclass
+class CachedFile:
+    mtime_ns: int
+    size: int
+    content_hash: str
+    facts: FileFacts
+
+
+def normalize_endpoint(path: str) -> str:
+    """경로 정규화: 앞뒤 '/' 제거, 경로 변수(${id}, {id}) → {}, 쿼리스트링 제거"""
+    path = path.split("?", 1)[0]
+    return _TEMPLATE_PARAM_RE.sub("{}", path).strip("/")
+
+
+def classify(relpath: str) -> str:
+    name = relpath.rsplit("/", 1)[-1]
+    if "/hooks/" in relpath or name.startswith("use"):
+        return "hook"
+    if "/services/" in relpath:
+        return "service"
+    if "/types/" in relpath or name.startswith("types."):
+        return "type"
+    return "other"
+
+
+def extract_facts(relpath: str, text: str) -> FileFacts:
+    """정규식 기반 추출 (TS 파서 없이 interface 필드/export/API 경로만)"""
+    source = _COMMENT_RE.sub("", text)
+
+    types: Dict[str, Tuple[str, ...]] = {}
+    for match in _TYPE_DECL_RE.finditer(source):
+        body = _block_body(source, match.end() - 1)
+        while True:
+            collapsed = _NESTED_BLOCK_RE.sub("", body)
+            if collapsed == body:
+                break
+            body = collapsed
+        types[match.group(1)] = tuple(dict.fromkeys(_FIELD_RE.findall(body)))
+
+    endpoints = tuple(
+        dict.fromkeys(normalize_endpoint(path) for _, path in _ENDPOINT_RE.findall(source) if "/" in path or "-" in path)
+    )
+    return FileFacts(
+        kind=classify(relpath),
+        types=types,
+        exports=tuple(dict.fromkeys(_EXPORT_RE.findall(source))),
+        endpoints=endpoints,
+    )
+
+
+def _block_body(source: str, open_brace: int) -> str:
+    """open_brace 위치의 '{' 와 짝이 맞는 '}' 사이 본문"""
+    depth = 0
+    for position in range(open_brace, len(source)):
+        char = source[position]
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return source[open_brace + 1:position]
+    return source[open_brace + 1:]
+
+
+def _parse_file(args: Tuple[str, str]) -> Tuple[str, str, FileFacts]:
+    """프로세스 풀 작업 단위: (상대경로, 절대경로) → (상대경로, 내용 해시, 추출 결과)"""
+    relpath, path = args
+    data = Path(path).read_bytes()
+    return relpath, hashlib.sha1(data).hexdigest(), extract_facts(relpath, data.decode("utf-8", errors="replace"))
+
+
+class CodeScanner:
+    """앱 소스 스캐너 (파일별 캐시 + 병렬 파싱)"""
+
+    def __init__(self, root: Path = PROJECT_ROOT, cache_path: Path = DEFAULT_CACHE_PATH, workers: Optional[int] = None) -> None:
+        self.root = Path(root)
+        self.cache_path = Path(cache_path)
+        self.workers = workers
+        self._cache: Optional[Dict[str, CachedFile]] = None
+        # 앱이 다른 scan 은 스레드에서 동시에 돌 수 있음 → 공유 캐시 로드/갱신/저장은 한 번에 하나씩
+        self._lock = threading.Lock()
+
+    def _load_cache(self) -> Dict[str, CachedFile]:
+        with self._lock:
+            if self._cache is None:
+                cache: Dict[str, CachedFile] = {}
+                try:
+                    with open(self.cache_path, "rb") as handle:
+                        payload = pickle.load(handle)
+                    if isinstance(payload, dict) and payload.get("format") == CACHE_FORMAT:
+                        cache = payload["files"]
+                except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+                    pass
+                self._cache = cache
+            return self._cache
+
+    def _save_cache(self) -> None:
+        """self._lock 을 쥔 상태에서 호출"""
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_pickle(self.cache_path, {"format": CACHE_FORMAT, "files": self._cache})
+
+    def apps(self) -> List[str]:
+        """src 디렉토리가 있는 apps/ 바로 아래 앱 이름"""
+        try:
+            with os.scandir(self.root / "apps") as entries:
+                return sorted(entry.name for entry in entries if entry.is_dir() and os.path.isdir(Path(entry.path) / "src"))
+        except FileNotFoundError:
+            return []
+
+    def check_app(self, app: str) -> str:
+        """앱 이름 확인 - 경로(../ 등)나 없는 앱은 ValueError (오타가 빈 스캔 결과로 보이지 않도록)"""
+        apps = self.apps()
+        if app not in apps:
+            raise ValueError(f"앱을 찾을 수 없습니다: {app} (가능: {', '.join(apps) or '(없음)'})")
+        return app
+
+    def iter_sources(self, app: str):
+        """apps/{app}/src 아래 (상대경로, 절대경로, stat) 목록"""
+        base = self.root / "apps" / self.check_app(app) / "src"
+        for dirpath, dirnames, filenames in os.walk(base):
+            dirnames[:] = [name for name in dirnames if name not in SKIP_DIRS]
+            for filename in filenames:
+                if filename.endswith(SOURCE_SUFFIXES):
+                    path = os.path.join(dirpath, filename)
+                    yield Path(path).relative_to(self.root).as_posix(), path, os.stat(path)
+
+    def scan(self, app: str) -> Tuple[Dict[str, FileFacts], Dict[str, Any]]:
+        """앱 소스 전체 추출 결과와 스캔 통계 반환"""
+        self.check_app(app)
+        started = time.perf_counter()
+        cache = self._load_cache()
+        prefix = f"apps/{app}/src/"
+
+        facts: Dict[str, FileFacts] = {}
+        pending: List[Tuple[str, str]] = []
+        stats = {"files": 0, "reused": 0, "rehashed": 0, "parsed": 0, "removed": 0, "parallel": False}
+        seen: Set[str] = set()
+
+        for relpath, path, stat in self.iter_sources(app):
+            stats["files"] += 1
+            seen.add(relpath)
+            cached = cache.get(relpath)
+            if cached is not None and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+                facts[relpath] = cached.facts
+                stats["reused"] += 1
+                continue
+            if cached is not None:
+                # mtime 만 바뀐 경우(체크아웃 등) 내용 해시가 같으면 재사용
+                content_hash = hashlib.sha1(Path(path).read_bytes()).hexdigest()
+                if content_hash == cached.content_hash:
+                    cached.mtime_ns, cached.size = stat.st_mtime_ns, stat.st_size
+                    facts[relpath] = cached.facts
+                    stats["rehashed"] += 1
+                    continue
+            pending.append((relpath, path))
+
+        results: List[Tuple[str, str, FileFacts]] = []
+        if pending:
+            stats["parallel"] = len(pending) >= PARALLEL_THRESHOLD
+            if stats["parallel"]:
+                with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                    results = list(pool.map(_parse_file, pending, chunksize=32))
+            else:
+                results = [_parse_file(item) for item in pending]
+            stats["parsed"] = len(results)
+        stat_by_path = {relpath: os.stat(path) for relpath, path in pending}
+
+        with self._lock:
+            for relpath, content_hash, file_facts in results:
+                stat = stat_by_path[relpath]
+                cache[relpath] = CachedFile(stat.st_mtime_ns, stat.st_size, content_hash, file_facts)
+                facts[relpath] = file_facts
+            for relpath in [relpath for relpath in cache if relpath.startswith(prefix) and relpath not in seen]:
+                del cache[relpath]
+                stats["removed"] += 1
+            if stats["parsed"] or stats["rehashed"] or stats["removed"]:
+                self._save_cache()
+
+        METRICS.cache_hit("code_scanner", stats["reused"] + stats["rehashed"])
+        METRICS.cache_miss("code_scanner", stats["parsed"])
+        stats["elapsedMs"] = round((time.perf_counter() - started) * 1000, 1)
+        return facts, stats
+
+
+# ===== 스펙 ↔ 코드 비교 =====
+
+def entity_schemas(index: SpecIndex, tag: str) -> List[str]:
+    """태그 오퍼레이션이 쓰는 엔티티 스키마 (CommonResponse*/Page* 래퍼는 풀어서)"""
+    names: List[str] = []
+    queue: List[str] = []
+    for position in index.by_tag.get(tag, ()):
+        operation = index.operations[position]
+        queue.extend(operation.request_schemas + operation.response_schemas)
+    seen: Set[str] = set()
+    while queue:
+        name = queue.pop(0)
+        if name in seen or name in IGNORED_SCHEMAS:
+            continue
+        seen.add(name)
+        if name.startswith(WRAPPER_PREFIXES):
+            queue.extend(schema_refs(index.schemas.get(name, {})))
+        elif name in index.schema_models:
+            names.append(name)
+    return names
+
+
+def expected_hooks(index: SpecIndex, tag: str) -> List[str]:
+    """Atomic Hooks 패턴 기준 기대 Hook 이름 (HTTP 메서드별)"""
+    methods = {index.operations[position].method for position in index.by_tag.get(tag, ())}
+    hooks: List[str] = []
+    if "get" in methods:
+        hooks.append(f"use{tag}ListQuery")
+    if "post" in methods:
+        hooks.append(f"useCreate{tag}")
+    if "put" in methods or "patch" in methods:
+        hooks.append(f"useUpdate{tag}")
+    if "delete" in methods:
+        hooks.append(f"useDelete{tag}")
+    return hooks
+
+
+def analyze_sync(index: SpecIndex, facts: Dict[str, FileFacts], entity: Optional[str] = None) -> Dict[str, Any]:
+    """태그(엔티티)별 동기화 리포트"""
+    code_types: Dict[str, Tuple[Tuple[str, ...], str]] = {}
+    hooks: Dict[str, str] = {}
+    endpoints: Set[str] = set()
+    for relpath, file_facts in facts.items():
+        for name, fields in file_facts.types.items():
+            code_types.setdefault(name, (fields, relpath))
+        if file_facts.kind == "hook":
+            for name in file_facts.exports:
+                if name.startswith("use"):
+                    hooks.setdefault(name, relpath)
+        endpoints.update(file_facts.endpoints)
+
+    base = normalize_endpoint(index.servers[0]) if index.servers else ""
+
+    entities: Dict[str, Any] = {}
+    tags = sorted(index.by_tag)
+    if entity:
+        tags = [tag for tag in tags if tag.lower() == entity.lower()]
+
+    for tag in tags:
+        missing_types: List[str] = []
+        field_mismatches: Dict[str, Dict[str, Any]] = {}
+        for name in entity_schemas(index, tag):
+            spec_fields = [item.name for item in index.schema_models[name].fields]
+            code = code_types.get(name)
+            if code is None:
+                missing_types.append(name)
+                continue
+            code_fields = set(code[0])
+            missing_fields = [prop for prop in spec_fields if prop not in code_fields]
+            extra_fields = sorted(code_fields - set(spec_fields))
+            if missing_fields or extra_fields:
+                field_mismatches[name] = {"file": code[1], "missingFields": missing_fields, "extraFields": extra_fields}
+
+        missing_hooks = [name for name in expected_hooks(index, tag) if name not in hooks]
+
+        unreferenced: List[str] = []
+        for position in index.by_tag[tag]:
+            operation = index.operations[position]
+            key = normalize_endpoint(operation.path)
+            candidates = {key, f"{base}/{key}".strip("/")} if base else {key}
+            if not candidates & endpoints:
+                unreferenced.append(f"{operation.method.upper()} {operation.path}")
+
+        entities[tag] = {
+            "missingTypes": missing_types,
+            "fieldMismatches": field_mismatches,
+            "missingHooks": missing_hooks,
+            "unreferencedEndpoints": unreferenced,
+            "inSync": not (missing_types or field_mismatches or missing_hooks or unreferenced),
+        }
+
+    return {
+        "summary": {
+            "entities": len(entities),
+            "inSync": sum(1 for report in entities.values() if report["inSync"]),
+            "missingTypes": sum(len(report["missingTypes"]) for report in entities.values()),
+            "fieldMismatches": sum(len(report["fieldMismatches"]) for report in entities.values()),
+            "missingHooks": sum(len(report["missingHooks"]) for report in entities.values()),
+            "unreferencedEndpoints": sum(len(report["unreferencedEndpoints"]) for report in entities.values()),
+        },
+        "entities": entities,
+    }
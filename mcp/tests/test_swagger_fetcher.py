@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Swagger 수집기 테스트 (로컬 대역 HTTP 서버)
+- ETag 재검증: 2회차는 304 + 캐시 본문 재사용, 스펙이 바뀌면 다시 200
+- 동시 연결 상한: max_connections 를 넘는 요청이 동시에 처리되지 않음
+- 같은 URL 동시 수집은 요청 1회로 합쳐짐
+- 디스크 캐시 쓰기: 동시에 써도 읽는 쪽은 완전한 본문만 보고 임시 파일이 남지 않음
+
+사용법:
+    cd mcp && python -m pytest -q tests
+"""
+
+import asyncio
+import hashlib
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from swagger_fetcher import SwaggerDiskCache, SwaggerFetcher  # noqa: E402
+
+SPEC = b'{"openapi": "3.0.1", "info": {"title": "mold", "version": "1"}, "paths": {}}'
+
+
+class SpecServer(ThreadingHTTPServer):
+    """경로별 스펙 본문을 ETag 와 함께 제공하고 요청 수 / 동시 처리 수를 기록하는 대역 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, bodies: Dict[str, bytes], delay: float = 0.0) -> None:
+        super().__init__(("127.0.0.1", 0), SpecHandler)
+        self.bodies = bodies
+        self.delay = delay
+        self.statuses: List[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+
+class SpecHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802
+        server: SpecServer = self.server  # type: ignore[assignment]
+        with server._lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(server.delay)
+            body = server.bodies[self.path]
+            etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+            if self.headers.get("If-None-Match") == etag:
+                self._send(304, etag, b"")
+            else:
+                self._send(200, etag, body)
+        finally:
+            with server._lock:
+                server.in_flight -= 1
+
+    def _send(self, status: int, etag: str, body: bytes) -> None:
+        self.server.statuses.append(status)  # type: ignore[attr-defined]
+        self.send_response(status)
+        self.send_header("ETag", etag)
+        if status == 200:
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def serve(bodies: Dict[str, bytes], delay: float = 0.0) -> Iterator[SpecServer]:
+    server = SpecServer(bodies, delay)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def spec_server() -> Iterator[SpecServer]:
+    yield from serve({"/api-docs/mold": SPEC})
+
+
+def test_etag_revalidation_reuses_cached_body(spec_server: SpecServer, tmp_path: Path) -> None:
+    fetcher = SwaggerFetcher(SwaggerDiskCache(tmp_path))
+    url = spec_server.url("/api-docs/mold")
+
+    first = asyncio.run(fetcher.fetch_all({"primes_mold": url}))["primes_mold"]
+    second = asyncio.run(fetcher.fetch_all({"primes_mold": url}))["primes_mold"]
+
+    assert (first.status, first.http_status, first.body) == ("fetched", 200, SPEC)
+    assert (second.status, second.http_status, second.body) == ("not_modified", 304, SPEC)
+    assert second.content_hash == first.content_hash
+    assert second.bytes_received == 0
+    assert spec_server.statuses == [200, 304]
+
+    # 서버 스펙이 바뀌면 ETag 불일치 → 새 본문
+    changed = SPEC.replace(b'"1"', b'"2"')
+    spec_server.bodies["/api-docs/mold"] = changed
+    third = asyncio.run(fetcher.fetch_all({"primes_mold": url}))["primes_mold"]
+    assert (third.status, third.body) == ("fetched", changed)
+    assert SwaggerDiskCache(tmp_path).load_body(url) == changed
+
+
+def test_error_response_falls_back_to_cached_body(spec_server: SpecServer, tmp_path: Path) -> None:
+    fetcher = SwaggerFetcher(SwaggerDiskCache(tmp_path))
+    url = spec_server.url("/api-docs/mold")
+    asyncio.run(fetcher.fetch_all({"primes_mold": url}))
+
+    spec_server.server_close()
+    result = asyncio.run(fetcher.fetch_all({"primes_mold": url}))["primes_mold"]
+
+    assert result.status == "error"
+    assert result.body == SPEC
+
+
+def test_concurrent_requests_are_capped_by_max_connections(tmp_path: Path) -> None:
+    paths = [f"/api-docs/{index}" for index in range(8)]
+    for server in serve({path: SPEC for path in paths}, delay=0.1):
+        fetcher = SwaggerFetcher(SwaggerDiskCache(tmp_path), max_connections=2)
+        results = asyncio.run(fetcher.fetch_all({path: server.url(path) for path in paths}))
+
+        assert {result.status for result in results.values()} == {"fetched"}
+        assert len(server.statuses) == len(paths)
+        assert server.max_in_flight == 2
+
+
+def test_same_url_fetches_are_coalesced(tmp_path: Path) -> None:
+    for server in serve({"/api-docs/mold": SPEC}, delay=0.1):
+        fetcher = SwaggerFetcher(SwaggerDiskCache(tmp_path))
+        url = server.url("/api-docs/mold")
+
+        async def fetch_many():
+            async with fetcher.create_client() as client:
+                return await asyncio.gather(*(fetcher.fetch(client, "primes_mold", url) for _ in range(5)))
+
+        results = asyncio.run(fetch_many())
+
+        assert [result.body for result in results] == [SPEC] * 5
+        assert server.statuses == [200]
+
+
+def test_concurrent_cache_writes_are_atomic(tmp_path: Path) -> None:
+    cache = SwaggerDiskCache(tmp_path)
+    url = "http://127.0.0.1/api-docs/mold"
+    bodies = [bytes([ord("a") + index]) * 256 * 1024 for index in range(4)]
+    cache.store(url, bodies[0], etag=None, last_modified=None)
+    partial: List[int] = []
+    done = threading.Event()
+
+    def write(body: bytes) -> None:
+        for _ in range(20):
+            cache.store(url, body, etag='"x"', last_modified=None)
+
+    def read() -> None:
+        while not done.is_set():
+            body = cache.load_body(url)
+            if body not in bodies:
+                partial.append(len(body or b""))
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    writers = [threading.Thread(target=write, args=(body,)) for body in bodies]
+    for thread in writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    done.set()
+    reader.join()
+
+    assert partial == []
+    assert cache.load_body(url) in bodies
+    meta = cache.load_meta(url)
+    assert meta is not None and meta.size == 256 * 1024
+    assert sorted(path.name for path in tmp_path.iterdir() if path.name.endswith(".tmp")) == []
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+워크스페이스 인벤토리 (앱별 페이지/Hook/서비스/템플릿/다국어 파일 수)
+- apps/*/src 를 os.scandir 로 훑고, 앱 src 바로 아래 디렉토리 단위로 스레드 풀에 나눠 처리
+- 분류는 경로/파일 이름만 보므로 디렉토리 mtime(파일 추가·삭제·이름 변경 시 바뀜)을 키로 디렉토리별 집계를 캐시
+  → 재스캔은 디렉토리 stat 만 하고, mtime 이 바뀐 디렉토리만 다시 나열
+- 캐시는 .cache/workspace_inventory.pickle 에 저장 (프로세스 재시작 후에도 재사용)
+- primes://overview, common://comparison 의 {{workspace.*}} 자리표시자 값 (content_store 생성 콘텐츠)
+"""
+
+import os
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from atomic_files import atomic_pickle
+from server_metrics import METRICS
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_CACHE_PATH = Path(
+    os.getenv("INVENTORY_CACHE_PATH", str(Path(__file__).parent / ".cache" / "workspace_inventory.pickle"))
+)
+
+# 스캔 스레드 수 (scandir/stat 은 GIL 을 놓으므로 CPU 수보다 많아도 이득)
+INVENTORY_WORKERS = int(os.getenv("INVENTORY_WORKERS", "8"))
+
+# 콘텐츠 자리표시자 갱신 주기 (초) - 콘텐츠 감시 주기마다 디렉토리를 stat 하지 않도록
+INVENTORY_POLL_INTERVAL = float(os.getenv("INVENTORY_POLL_INTERVAL", "10"))
+
+SOURCE_SUFFIXES = (".ts", ".tsx")
+SKIP_DIRS = {"node_modules", "dist", "build", ".turbo", ".git", "coverage"}
+
+# 디렉토리별 집계 항목 (DirRecord.counts 순서)
+CATEGORIES = ("sources", "pages", "hooks", "services", "templates", "locales")
+
+# 캐시 포맷 버전 (분류 규칙이 바뀌면 올려서 전체 재나열)
+CACHE_FORMAT = 1
+
+
+@dataclass
+class DirRecord:
+    """디렉토리 한 개의 직속 파일 집계"""
+
+    mtime_ns: int
+    counts: Tuple[int, ...]
+    subdirs: Tuple[str, ...]
+
+
+def classify_file(parts: Tuple[str, ...], name: str) -> List[str]:
+    """src 기준 디렉토리 경로(parts)와 파일 이름 → 해당하는 집계 항목"""
+    if name.endswith(".json"):
+        return ["locales"] if "locales" in parts else []
+    if not name.endswith(SOURCE_SUFFIXES) or name.endswith(".d.ts"):
+        return []
+    stem = name.rsplit(".", 1)[0]
+    found = ["sources"]
+    if "pages" in parts and stem.endswith("Page"):
+        found.append("pages")
+    if stem.startswith("use") and stem[3:4].isupper():
+        found.append("hooks")
+    if stem != "index" and ("services" in parts or stem.lower().endswith("service")):
+        found.append("services")
+    if "templates" in parts and stem != "index" and name.endswith(".tsx"):
+        found.append("templates")
+    return found
+
+
+def _list_dir(path: str, parts: Tuple[str, ...], mtime_ns: int) -> DirRecord:
+    counts = [0] * len(CATEGORIES)
+    subdirs: List[str] = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    subdirs.append(entry.name)
+            elif entry.is_file():
+                for category in classify_file(parts, entry.name):
+                    counts[CATEGORIES.index(category)] += 1
+    return DirRecord(mtime_ns, tuple(counts), tuple(sorted(subdirs)))
+
+
+class WorkspaceInventory:
+    """apps/*/src 인벤토리 스캐너 (디렉토리 mtime 캐시 + 스레드 풀)"""
+
+    def __init__(
+        self,
+        root: Path = PROJECT_ROOT,
+        cache_path: Path = DEFAULT_CACHE_PATH,
+        workers: int = INVENTORY_WORKERS,
+    ) -> None:
+        self.root = Path(root)
+        self.cache_path = Path(cache_path)
+        self.workers = workers
+        self._cache: Optional[Dict[str, DirRecord]] = None
+        self._last: Optional[Tuple[float, Dict[str, Any]]] = None
+
+    def _load_cache(self) -> Dict[str, DirRecord]:
+        if self._cache is None:
+            self._cache = {}
+            try:
+                with open(self.cache_path, "rb") as handle:
+                    payload = pickle.load(handle)
+                if isinstance(payload, dict) and payload.get("format") == CACHE_FORMAT:
+                    self._cache = payload["dirs"]
+            except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+                pass
+        return self._cache
+
+    def _save_cache(self) -> None:
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_pickle(self.cache_path, {"format": CACHE_FORMAT, "dirs": self._cache})
+
+    def apps(self) -> List[str]:
+        try:
+            with os.scandir(self.root / "apps") as entries:
+                return sorted(entry.name for entry in entries if entry.is_dir() and os.path.isdir(Path(entry.path) / "src"))
+        except FileNotFoundError:
+            return []
+
+    def _visit(self, relpath: str, cache: Dict[str, DirRecord]) -> Tuple[DirRecord, bool]:
+        """디렉토리 하나 - mtime 이 같으면 캐시 재사용, 아니면 다시 나열 (두 번째 값: 나열 여부)"""
+        path = os.path.join(self.root, relpath)
+        mtime_ns = os.stat(path).st_mtime_ns
+        cached = cache.get(relpath)
+        if cached is not None and cached.mtime_ns == mtime_ns:
+            return cached, False
+        # apps/{app}/src 다음부터가 분류 기준 경로
+        parts = tuple(relpath.split("/")[3:])
+        return _list_dir(path, parts, mtime_ns), True
+
+    def _walk(self, relpath: str, cache: Dict[str, DirRecord]) -> Tuple[Dict[str, DirRecord], int]:
+        """relpath 아래 전체 (워커 스레드 하나가 서브트리 하나를 담당, 캐시는 읽기만)"""
+        records: Dict[str, DirRecord] = {}
+        listed = 0
+        stack = [relpath]
+        while stack:
+            current = stack.pop()
+            try:
+                record, fresh = self._visit(current, cache)
+            except FileNotFoundError:
+                # 스캔 도중 삭제된 디렉토리
+                continue
+            records[current] = record
+            listed += fresh
+            stack.extend(f"{current}/{name}" for name in record.subdirs)
+        return records, listed
+
+    def scan(self) -> Dict[str, Any]:
+        """앱별 집계 + 스캔 통계"""
+        started = time.perf_counter()
+        cache = self._load_cache()
+        records: Dict[str, DirRecord] = {}
+        listed = 0
+
+        subtrees: List[str] = []
+        for app in self.apps():
+            src = f"apps/{app}/src"
+            record, fresh = self._visit(src, cache)
+            records[src] = record
+            listed += fresh
+            subtrees.extend(f"{src}/{name}" for name in record.subdirs)
+        with ThreadPoolExecutor(max_workers=max(1, self.workers)) as pool:
+            for subtree_records, subtree_listed in pool.map(lambda relpath: self._walk(relpath, cache), subtrees):
+                records.update(subtree_records)
+                listed += subtree_listed
+
+        removed = len(cache.keys() - records.keys())
+        METRICS.cache_hit("workspace_inventory", len(records) - listed)
+        METRICS.cache_miss("workspace_inventory", listed)
+        self._cache = records
+        if listed or removed:
+            self._save_cache()
+
+        apps: Dict[str, Dict[str, Any]] = {}
+        for relpath, record in records.items():
+            parts = relpath.split("/")
+            app = apps.setdefault(parts[1], {**{category: 0 for category in CATEGORIES}, "languages": set()})
+            for category, count in zip(CATEGORIES, record.counts):
+                app[category] += count
+            # locales/{언어}/... 의 언어 디렉토리
+            if record.counts[CATEGORIES.index("locales")] and "locales" in parts[3:-1]:
+                app["languages"].add(parts[parts.index("locales", 3) + 1])
+        for app in apps.values():
+            app["languages"] = sorted(app["languages"])
+
+        return {
+            "apps": dict(sorted(apps.items())),
+            "totals": {category: sum(app[category] for app in apps.values()) for category in CATEGORIES},
+            "stats": {
+                "dirs": len(records),
+                "listed": listed,
+                "reused": len(records) - listed,
+                "removed": removed,
+                "subtrees": len(subtrees),
+                "elapsedMs": round((time.perf_counter() - started) * 1000, 2),
+            },
+        }
+
+    def current(self, max_age: float = INVENTORY_POLL_INTERVAL) -> Dict[str, Any]:
+        """max_age 초 안에 스캔한 결과가 있으면 재사용"""
+        now = time.monotonic()
+        if self._last is None or now - self._last[0] >= max_age:
+            self._last = (now, self.scan())
+        return self._last[1]
+
+
+_default_inventory: Optional[WorkspaceInventory] = None
+
+
+def get_workspace_inventory() -> WorkspaceInventory:
+    """프로세스 공용 인벤토리 스캐너 (첫 사용 시 생성)"""
+    global _default_inventory
+    if _default_inventory is None:
+        _default_inventory = WorkspaceInventory()
+    return _default_inventory
+
+
+def workspace_variables() -> Dict[str, str]:
+    """content_store 자리표시자 그룹 "workspace" 값 ({{workspace.primes_pages}} 등, 천 단위 구분)"""
+    inventory = get_workspace_inventory().current()
+    values: Dict[str, str] = {}
+    for app, counts in inventory["apps"].items():
+        for category in CATEGORIES:
+            values[f"{app}_{category}"] = f"{counts[category]:,}"
+        values[f"{app}_languages"] = ", ".join(counts["languages"]) or "-"
+    for category, count in inventory["totals"].items():
+        values[f"total_{category}"] = f"{count:,}"
+    return values